@@ -47,11 +47,12 @@ FILTER_PATTERNS = {
     },
     "experience_years": {
         "patterns": [
-            (r"(\d+)년", "min_years"),  # 정규식 패턴
+            # 정규식 패턴 (구체적인 패턴을 먼저 확인)
             (r"(\d+)년이상", "min_years"),
             (r"(\d+)년 이상", "min_years"),
             (r"(\d+)년이하", "max_years"),
-            (r"(\d+)년 이하", "max_years")
+            (r"(\d+)년 이하", "max_years"),
+            (r"(\d+)년", "min_years")
         ],
         "description": "경력 연차"
     },
@@ -131,11 +132,12 @@ FILTER_PATTERNS = {
     },
     "salary": {
         "patterns": [
-            (r"(\d+)만원", "min_salary"),
+            # 정규식 패턴 (구체적인 패턴을 먼저 확인)
             (r"(\d+)만원이상", "min_salary"),
             (r"(\d+)만원 이상", "min_salary"),
             (r"(\d+)만원이하", "max_salary"),
-            (r"(\d+)만원 이하", "max_salary")
+            (r"(\d+)만원 이하", "max_salary"),
+            (r"(\d+)만원", "min_salary")
         ],
         "description": "연봉"
     }
@@ -144,12 +146,12 @@ FILTER_PATTERNS = {
 # 사용자별 맞춤 필터 설정
 USER_FILTER_CONFIGS = {
     "default": {
-        "enabled_filters": ["seniority", "availability", "location", "experience_years", "companies", "skills"],
+        "enabled_filters": ["seniority", "availability", "location", "experience_years", "companies", "skills", "salary"],
         "strict_mode": False,
         "min_score_threshold": 0.3
     },
     "strict": {
-        "enabled_filters": ["seniority", "availability", "location", "experience_years", "companies", "skills"],
+        "enabled_filters": ["seniority", "availability", "location", "experience_years", "companies", "skills", "salary"],
         "strict_mode": True,
         "min_score_threshold": 0.5
     },
@@ -24,6 +24,7 @@ DEBUG = os.getenv("DEBUG", "False").lower() == "true"
 # 검색 설정
 DEFAULT_SEARCH_LIMIT = 10
 MAX_SEARCH_LIMIT = 100
+MAX_BATCH_QUERIES = int(os.getenv("MAX_BATCH_QUERIES", 500))
 DEFAULT_SAMPLE_COUNT = 30
 
 # 벡터 검색 가중치
@@ -33,6 +34,121 @@ SEARCH_WEIGHTS = {
     "experience": 0.25
 }
 
+# 검색 응답 캐시 설정 (0이면 비활성화)
+RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", 1024))
+# 지정 시 같은 호스트의 워커들이 공유하는 SQLite 캐시 파일 사용
+RESPONSE_CACHE_PATH = os.getenv("RESPONSE_CACHE_PATH")
+
+# 쿼리 임베딩 캐시 크기 (0이면 비활성화)
+EMBEDDING_CACHE_SIZE = int(os.getenv("EMBEDDING_CACHE_SIZE", 2048))
+
+# 캐시 워밍업용 쿼리 로그 (정규화된 쿼리별 빈도, 미지정 시 검색 엔진 DB 경로의 query_log.json, 빈 값이면 기록 안 함)
+QUERY_LOG_PATH = os.getenv("QUERY_LOG_PATH")
+QUERY_LOG_MAX_ENTRIES = int(os.getenv("QUERY_LOG_MAX_ENTRIES", 1000))
+QUERY_LOG_FLUSH_INTERVAL = float(os.getenv("QUERY_LOG_FLUSH_INTERVAL", 30))
+
+# 시작 시 쿼리 로그 상위 쿼리로 캐시 워밍업 (재실행할 쿼리 수, 최대 소요 시간(초), 0이면 비활성화)
+WARMUP_TOP_N = int(os.getenv("WARMUP_TOP_N", 200))
+WARMUP_MAX_SECONDS = float(os.getenv("WARMUP_MAX_SECONDS", 300))
+
+# 요청 캡처 (/api/search, /api/filter, /profile/{id} 요청을 JSONL로 기록, 미지정 시 비활성화)
+# scripts/replay.py로 로컬 서버에 재생해 지연시간/오류율/결과 차이 비교
+CAPTURE_PATH = os.getenv("CAPTURE_PATH")
+CAPTURE_SAMPLE_RATE = float(os.getenv("CAPTURE_SAMPLE_RATE", 1.0))
+
+# 느린 쿼리 로그 (검색/필터/프로필 조회가 기준 시간(ms)을 넘으면 단계별 추적 기록, 0이면 비활성화)
+# 미지정 시 검색 엔진 DB 경로의 slow_queries.log (크기 기준 회전), 빈 값이면 최근 목록(/api/slow-queries)만 유지
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", 1000))
+SLOW_QUERY_SAMPLE_RATE = float(os.getenv("SLOW_QUERY_SAMPLE_RATE", 1.0))
+SLOW_QUERY_LOG_PATH = os.getenv("SLOW_QUERY_LOG_PATH")
+SLOW_QUERY_LOG_MAX_BYTES = int(os.getenv("SLOW_QUERY_LOG_MAX_BYTES", 10 * 1024 * 1024))
+SLOW_QUERY_LOG_BACKUPS = int(os.getenv("SLOW_QUERY_LOG_BACKUPS", 5))
+SLOW_QUERY_RECENT = int(os.getenv("SLOW_QUERY_RECENT", 100))
+
+# 검색 요청 수락 제어 (동시 실행 수, 대기열 크기, 대기 시간 초과(초))
+SEARCH_MAX_CONCURRENCY = int(os.getenv("SEARCH_MAX_CONCURRENCY", 4))
+SEARCH_MAX_QUEUE = int(os.getenv("SEARCH_MAX_QUEUE", 32))
+SEARCH_QUEUE_TIMEOUT = float(os.getenv("SEARCH_QUEUE_TIMEOUT", 2.0))
+
+# 인덱스(프로필/기술/경력) 동시 검색 스레드 수
+INDEX_QUERY_WORKERS = int(os.getenv("INDEX_QUERY_WORKERS", 12))
+
+# 벡터 저장소 모드 (embedded: 프로세스 내 DB_PATH 직접 사용, http: 별도로 실행한 Chroma 서버에 연결)
+# http 모드에서도 DB_PATH는 쿼리 로그/느린 쿼리 로그/축소 벡터 등 로컬 보조 파일 위치로 사용
+# 서버 실행 예: chroma run --path ./data/chroma_db --host 127.0.0.1 --port 8000
+CHROMA_MODE = os.getenv("CHROMA_MODE", "embedded")
+CHROMA_HOST = os.getenv("CHROMA_HOST", "127.0.0.1")
+CHROMA_PORT = int(os.getenv("CHROMA_PORT", 8000))
+# http 모드 연결 풀 (프로세스 내 검색 엔진이 공유하는 최대 연결 수, 유휴 연결 유지 시간(초))
+CHROMA_POOL_SIZE = int(os.getenv("CHROMA_POOL_SIZE", 16))
+CHROMA_KEEPALIVE_SECONDS = float(os.getenv("CHROMA_KEEPALIVE_SECONDS", 40))
+# http 모드 시간 초과(초) - 연결, 요청(읽기/쓰기), 풀에서 빈 연결 대기
+CHROMA_CONNECT_TIMEOUT = float(os.getenv("CHROMA_CONNECT_TIMEOUT", 2.0))
+CHROMA_REQUEST_TIMEOUT = float(os.getenv("CHROMA_REQUEST_TIMEOUT", 30.0))
+CHROMA_POOL_TIMEOUT = float(os.getenv("CHROMA_POOL_TIMEOUT", 5.0))
+# http 모드 재시도 (횟수, 첫 대기 시간(초) - 시도마다 2배)
+# 연결 실패는 모든 요청, 응답 시간 초과/5xx는 조회/upsert/삭제처럼 반복해도 안전한 요청만 재시도
+CHROMA_RETRIES = int(os.getenv("CHROMA_RETRIES", 2))
+CHROMA_RETRY_BACKOFF = float(os.getenv("CHROMA_RETRY_BACKOFF", 0.1))
+
+# 쿼리 플래너 (엄격 모드에서 예상 일치 개발자 수가 이 값 이하이면 필터 우선 실행,
+# 벡터 우선 실행 시 예상 선택도 대비 추가 조회 배수와 최대 조회 수)
+PLANNER_FILTER_FIRST_MAX = int(os.getenv("PLANNER_FILTER_FIRST_MAX", 500))
+PLANNER_OVERFETCH_MARGIN = float(os.getenv("PLANNER_OVERFETCH_MARGIN", 1.5))
+PLANNER_MAX_FETCH = int(os.getenv("PLANNER_MAX_FETCH", 500))
+
+# 백그라운드 수집 작업 설정 (워커 수, 대기 작업 수 상한, 배치당 개발자 수, 보관할 작업 기록 수)
+INGEST_WORKERS = int(os.getenv("INGEST_WORKERS", 1))
+INGEST_MAX_PENDING = int(os.getenv("INGEST_MAX_PENDING", 16))
+INGEST_BATCH_SIZE = int(os.getenv("INGEST_BATCH_SIZE", 64))
+INGEST_JOB_HISTORY = int(os.getenv("INGEST_JOB_HISTORY", 100))
+
+# 대량 재색인용 멀티 프로세스 임베딩 (scripts/reindex.py 기본 프로세스 수, 진행 중 배치 수 상한)
+EMBEDDING_PROCESSES = int(os.getenv("EMBEDDING_PROCESSES", os.cpu_count() or 1))
+EMBEDDING_MAX_IN_FLIGHT = int(os.getenv("EMBEDDING_MAX_IN_FLIGHT", 8))
+
+# 온라인 재색인 (POST /api/reindex - MODEL_NAME이나 임베딩 텍스트를 바꾼 뒤 검색을 멈추지 않고 새 컬렉션 세트로 교체)
+# 배치당 개발자 수, 배치 사이 대기(초), 검색 요청 처리 중일 때 재확인 간격(초), 교체 후 이전 세트 삭제까지 대기(초)
+REINDEX_BATCH_SIZE = int(os.getenv("REINDEX_BATCH_SIZE", 64))
+REINDEX_BATCH_PAUSE = float(os.getenv("REINDEX_BATCH_PAUSE", 0.05))
+REINDEX_IDLE_WAIT = float(os.getenv("REINDEX_IDLE_WAIT", 0.05))
+REINDEX_GC_DELAY = float(os.getenv("REINDEX_GC_DELAY", 30))
+# 같은 저장소를 쓰는 워커 간 세트 상태 공유: 상태 확인 주기(초, 0이면 시작 시에만 확인 - 여러 워커에서는 사용 금지),
+# 워커/재색인 작업 생존 기록 시한(초, 지나면 종료된 것으로 보고 이전 세트 삭제나 새 재색인을 진행)
+REINDEX_STATE_POLL_INTERVAL = float(os.getenv("REINDEX_STATE_POLL_INTERVAL", 1.0))
+REINDEX_WORKER_TIMEOUT = float(os.getenv("REINDEX_WORKER_TIMEOUT", 30))
+
+# 컬렉션별 벡터 인덱스(HNSW) 설정
+# space: cosine | l2 | ip, M: 노드당 연결 수, construction_ef: 생성 시 탐색 폭, search_ef: 검색 시 탐색 폭
+# scripts/tune_hnsw.py로 recall/지연시간을 측정해 조정
+HNSW_CONFIG = {
+    "profiles": {"space": "cosine", "M": 16, "construction_ef": 100, "search_ef": 64},
+    "skills": {"space": "cosine", "M": 16, "construction_ef": 100, "search_ef": 64},
+    "experience": {"space": "cosine", "M": 16, "construction_ef": 100, "search_ef": 64}
+}
+# 기존 컬렉션의 space/M/construction_ef가 설정과 다르면 시작 시 저장된 임베딩으로 재생성
+# 여러 워커나 공유 Chroma 서버에서는 프로세스마다 같은 컬렉션을 삭제/재생성하게 되므로 단일 프로세스에서만 사용
+# 기본값(False)은 경고만 기록 - 온라인 재색인(POST /api/reindex)으로 새 설정의 세트를 만들거나
+# 'python scripts/tune_hnsw.py --migrate'를 한 프로세스에서 실행
+HNSW_AUTO_MIGRATE = os.getenv("HNSW_AUTO_MIGRATE", "False").lower() == "true"
+
+# 2단계 검색 (축소 벡터로 넓게 후보 검색 후 원본 임베딩으로 재점수, 컬렉션별로 None이면 사용 안 함)
+# dims: 축소 차원, method: pca | truncate, quantize: int8 양자화, candidates: 조회 수 대비 1단계 후보 배수
+# scripts/benchmark.py two-stage로 메모리/지연시간/recall을 측정해 조정
+TWO_STAGE_ENABLED = os.getenv("TWO_STAGE_ENABLED", "False").lower() == "true"
+TWO_STAGE_CONFIG = {
+    "profiles": {"dims": 64, "method": "pca", "quantize": True, "candidates": 4},
+    "skills": {"dims": 64, "method": "pca", "quantize": True, "candidates": 4},
+    "experience": {"dims": 64, "method": "pca", "quantize": True, "candidates": 4}
+}
+
+# 비슷한 개발자 이웃 그래프의 개발자당 이웃 수 (/api/similar 최대 결과 수)
+SIMILAR_GRAPH_K = int(os.getenv("SIMILAR_GRAPH_K", 50))
+
+# 통계 설정 (상위 기술/회사 수, 컬렉션과 대조하는 주기(초), 0이면 대조 안 함)
+STATS_TOP_N = int(os.getenv("STATS_TOP_N", 10))
+STATS_RECONCILE_INTERVAL = float(os.getenv("STATS_RECONCILE_INTERVAL", 300))
+
 # 지원하는 검색 타입
 SEARCH_TYPES = ["comprehensive", "profile_only"]
 
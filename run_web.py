@@ -8,15 +8,31 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from fastapi import FastAPI, Request, Form
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
+from fastapi.concurrency import run_in_threadpool, iterate_in_threadpool
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from pydantic import BaseModel
+from typing import List, Optional
 import uvicorn
 import json
 import argparse
+import time
 
 from src.core.search_engine import SearchEngine
-from config.settings import WEB_HOST, WEB_PORT, DEBUG
+from src.core.jobs import IngestJobManager, JobQueueFull
+from src.core.reindex import OnlineReindexer
+from src.core.results import parse_fields
+from src.core.warmup import CacheWarmer
+from src.web.admission import AdmissionController, AdmissionRejected
+from src.web.capture import TrafficCapture
+from config.settings import (
+    WEB_HOST, WEB_PORT, DEBUG, DEFAULT_SEARCH_LIMIT, MAX_BATCH_QUERIES, DEFAULT_SAMPLE_COUNT,
+    SEARCH_MAX_CONCURRENCY, SEARCH_MAX_QUEUE, SEARCH_QUEUE_TIMEOUT,
+    INGEST_WORKERS, INGEST_MAX_PENDING, INGEST_BATCH_SIZE, INGEST_JOB_HISTORY,
+    WARMUP_TOP_N, WARMUP_MAX_SECONDS, CAPTURE_PATH, CAPTURE_SAMPLE_RATE,
+    REINDEX_BATCH_SIZE, REINDEX_BATCH_PAUSE, REINDEX_IDLE_WAIT, REINDEX_GC_DELAY
+)
 
 app = FastAPI(
     title="SKAX-RA-AI-SEARCH 웹 인터페이스",
@@ -30,6 +46,41 @@ templates = Jinja2Templates(directory="src/web/templates")
 
 # 시스템 인스턴스
 search_engine = SearchEngine()
+search_admission = AdmissionController(SEARCH_MAX_CONCURRENCY, SEARCH_MAX_QUEUE, SEARCH_QUEUE_TIMEOUT)
+traffic_capture = TrafficCapture(CAPTURE_PATH, CAPTURE_SAMPLE_RATE)
+ingest_jobs = IngestJobManager(search_engine, INGEST_WORKERS, INGEST_MAX_PENDING, INGEST_BATCH_SIZE, INGEST_JOB_HISTORY)
+# 실행 중이거나 대기 중인 검색 요청이 있으면 워밍업은 양보
+cache_warmer = CacheWarmer(
+    search_engine, WARMUP_TOP_N, busy=search_admission.busy, max_seconds=WARMUP_MAX_SECONDS
+)
+# 최근 온라인 재색인 작업 (한 번에 하나)
+reindexer: Optional[OnlineReindexer] = None
+
+@app.on_event("startup")
+async def start_cache_warmup():
+    """모델 로드 후 쿼리 로그 상위 쿼리로 캐시 워밍업 시작"""
+    if WARMUP_TOP_N > 0:
+        cache_warmer.start()
+
+@app.on_event("shutdown")
+async def stop_background_tasks():
+    """워밍업/재색인/세트 상태 확인 중단, 쿼리/느린 쿼리 로그 저장, 요청 캡처 종료"""
+    cache_warmer.stop()
+    if reindexer is not None:
+        reindexer.stop()
+        reindexer.join()
+    search_engine.index_watcher.stop()
+    search_engine.query_log.stop()
+    search_engine.slow_query_log.close()
+    traffic_capture.close()
+
+def rejected_response(e: AdmissionRejected) -> JSONResponse:
+    """과부하로 거절된 요청 응답"""
+    return JSONResponse(
+        status_code=e.status_code,
+        content={"success": False, "error": e.message},
+        headers={"Retry-After": "1"}
+    )
 
 @app.get("/", response_class=HTMLResponse)
 async def home(request: Request):
@@ -49,26 +100,31 @@ async def filter_page(request: Request):
 @app.get("/stats", response_class=HTMLResponse)
 async def stats_page(request: Request):
     """통계 페이지"""
-    stats = search_engine.get_stats()
+    stats = search_engine.get_detailed_stats()
     return templates.TemplateResponse("stats.html", {"request": request, "stats": stats})
 
 @app.get("/profile/{developer_id}", response_class=HTMLResponse)
 async def profile_page(request: Request, developer_id: str):
     """개발자 상세 프로필 페이지"""
+    started = time.perf_counter()
     try:
         # 개발자 데이터 가져오기
         developer_data = search_engine.get_developer_by_id(developer_id)
         if developer_data:
-            return templates.TemplateResponse("profile.html", {
+            response = templates.TemplateResponse("profile.html", {
                 "request": request, 
                 "developer": developer_data
             })
         else:
-            return templates.TemplateResponse("error.html", {
+            response = templates.TemplateResponse("error.html", {
                 "request": request,
                 "error": "개발자를 찾을 수 없습니다."
             })
+        traffic_capture.record("/profile", {"developer_id": developer_id}, started,
+                               success=bool(developer_data), ids=[developer_id] if developer_data else [])
+        return response
     except Exception as e:
+        traffic_capture.record("/profile", {"developer_id": developer_id}, started, 500, False)
         return templates.TemplateResponse("error.html", {
             "request": request,
             "error": f"오류가 발생했습니다: {str(e)}"
@@ -76,20 +132,27 @@ async def profile_page(request: Request, developer_id: str):
 
 @app.post("/api/search")
 async def api_search(query: str = Form(...), search_type: str = Form("comprehensive"), 
-                    filter_mode: str = Form("default"), limit: int = Form(10)):
-    """검색 API"""
+                    filter_mode: str = Form("default"), limit: int = Form(10), fields: str = Form(None),
+                    explain: bool = Form(False)):
+    """검색 API (fields: 쉼표로 구분한 반환 필드 - 결과 필드 또는 메타데이터 필드명, 없으면 전체,
+    explain: 쿼리 플래너의 실행 계획 포함)"""
+    started = time.perf_counter()
+    params = {"query": query, "search_type": search_type, "filter_mode": filter_mode, "limit": limit, "fields": fields}
     try:
-        # 필터 모드에 따른 검색 엔진 생성
-        search_engine_with_mode = SearchEngine(user_config=filter_mode)
+        # 필터 모드에 맞는 필터 엔진 (검색 엔진과 응답 캐시는 공유)
+        filter_engine = search_engine.get_filter_engine(filter_mode)
         
         # 필터 추출 정보도 함께 반환
-        extracted_filters = search_engine_with_mode.filter_engine.extract_filters(query)
-        results = search_engine_with_mode.search_developers(query, search_type, limit)
+        extracted_filters = filter_engine.extract_filters(query)
+        async with search_admission.admit():
+            results = await run_in_threadpool(
+                search_engine.search_developers, query, search_type, limit, filter_mode, parse_fields(fields)
+            )
         
         # 필터 정보 텍스트 생성
-        filter_info = search_engine_with_mode.filter_engine.get_filter_info(extracted_filters)
+        filter_info = filter_engine.get_filter_info(extracted_filters)
         
-        return {
+        response = {
             "success": True, 
             "results": results, 
             "query": query,
@@ -97,6 +160,86 @@ async def api_search(query: str = Form(...), search_type: str = Form("comprehens
             "filter_info": filter_info,
             "filter_mode": filter_mode
         }
+        if explain:
+            response["plan"] = search_engine.plan_search(query, search_type, limit, filter_mode).to_dict()
+        traffic_capture.record("/api/search", params, started, ids=[result["developer_id"] for result in results])
+        return response
+    except AdmissionRejected as e:
+        traffic_capture.record("/api/search", params, started, e.status_code, False)
+        return rejected_response(e)
+    except Exception as e:
+        traffic_capture.record("/api/search", params, started, 200, False)
+        return {"success": False, "error": str(e)}
+
+@app.post("/api/search/stream")
+async def api_search_stream(request: Request, query: str = Form(...), search_type: str = Form("comprehensive"),
+                            filter_mode: str = Form("default"), limit: int = Form(10), fields: str = Form(None)):
+    """단계별 검색 API - NDJSON(기본) 또는 SSE(Accept: text/event-stream)로 결과를 순차 전송"""
+    use_sse = "text/event-stream" in request.headers.get("accept", "")
+    
+    def encode_event(event: dict) -> str:
+        line = json.dumps(event, ensure_ascii=False)
+        return f"event: {event['event']}\ndata: {line}\n\n" if use_sse else line + "\n"
+    
+    async def event_stream():
+        # 실행 슬롯은 스트림 안에서 확보 (클라이언트가 끊겨 스트림이 시작되지 않으면 finally가 실행되지 않아 슬롯이 반환되지 않음)
+        try:
+            await search_admission.acquire()
+        except AdmissionRejected as e:
+            yield encode_event({"event": "error", "error": e.message, "status": e.status_code})
+            return
+        
+        try:
+            events = search_engine.search_developers_progressive(query, search_type, limit, filter_mode, parse_fields(fields))
+            async for event in iterate_in_threadpool(events):
+                event.update({"query": query, "filter_mode": filter_mode})
+                yield encode_event(event)
+        except Exception as e:
+            yield encode_event({"event": "error", "error": str(e)})
+        finally:
+            search_admission.release()
+    
+    media_type = "text/event-stream" if use_sse else "application/x-ndjson"
+    return StreamingResponse(event_stream(), media_type=media_type, headers={"Cache-Control": "no-cache"})
+
+class BatchSearchRequest(BaseModel):
+    """배치 검색 요청"""
+    queries: List[str]
+    search_type: str = "comprehensive"
+    filter_mode: str = "default"
+    limit: int = DEFAULT_SEARCH_LIMIT
+    fields: Optional[str] = None
+
+@app.post("/api/search/batch")
+async def api_search_batch(request: BatchSearchRequest):
+    """배치 검색 API - 여러 쿼리를 한 번의 임베딩/인덱스 질의로 처리"""
+    try:
+        if len(request.queries) > MAX_BATCH_QUERIES:
+            return JSONResponse(
+                status_code=413,
+                content={"success": False, "error": f"한 번에 최대 {MAX_BATCH_QUERIES}개 쿼리까지 검색할 수 있습니다."}
+            )
+        
+        filter_engine = search_engine.get_filter_engine(request.filter_mode)
+        async with search_admission.admit():
+            batch_results = await run_in_threadpool(
+                search_engine.search_developers_batch,
+                request.queries, request.search_type, request.limit, request.filter_mode, parse_fields(request.fields)
+            )
+        
+        items = []
+        for query, results in zip(request.queries, batch_results):
+            extracted_filters = filter_engine.extract_filters(query)
+            items.append({
+                "query": query,
+                "results": results,
+                "extracted_filters": extracted_filters,
+                "filter_info": filter_engine.get_filter_info(extracted_filters)
+            })
+        
+        return {"success": True, "results": items, "filter_mode": request.filter_mode}
+    except AdmissionRejected as e:
+        return rejected_response(e)
     except Exception as e:
         return {"success": False, "error": str(e)}
 
@@ -104,6 +247,9 @@ async def api_search(query: str = Form(...), search_type: str = Form("comprehens
 async def api_filter(seniority: str = Form(None), primary_role: str = Form(None), 
                     availability: str = Form(None), location: str = Form(None), limit: int = Form(10)):
     """필터 API"""
+    started = time.perf_counter()
+    params = {"seniority": seniority, "primary_role": primary_role, "availability": availability,
+              "location": location, "limit": limit}
     try:
         filters = {}
         if seniority:
@@ -116,21 +262,151 @@ async def api_filter(seniority: str = Form(None), primary_role: str = Form(None)
             filters["location"] = location
         
         results = search_engine.search_by_filters(filters, limit)
+        traffic_capture.record("/api/filter", params, started, ids=[result["developer_id"] for result in results])
         return {"success": True, "results": results, "filters": filters}
+    except Exception as e:
+        traffic_capture.record("/api/filter", params, started, 200, False)
+        return {"success": False, "error": str(e)}
+
+@app.get("/api/suggest")
+async def api_suggest(q: str = "", limit: int = 8):
+    """검색어 자동완성 API - 메모리 내 접두어 인덱스에서 조회 (임베딩/DB 조회 없음)"""
+    return {"success": True, "query": q, "suggestions": search_engine.suggest_index.complete(q, limit)}
+
+@app.get("/api/similar/{developer_id}")
+async def api_similar(developer_id: str, limit: int = DEFAULT_SEARCH_LIMIT):
+    """비슷한 개발자 API - 저장된 임베딩 기반 이웃 그래프에서 조회 (모델 추론 없음)"""
+    try:
+        results = await run_in_threadpool(search_engine.find_similar_developers, developer_id, limit)
+        if results is None:
+            return JSONResponse(status_code=404, content={"success": False, "error": "개발자를 찾을 수 없습니다."})
+        return {"success": True, "developer_id": developer_id, "results": results}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
+@app.get("/api/stats")
+async def api_stats():
+    """데이터베이스 통계 API (메모리 내 카운터, 컬렉션 조회 없음)"""
+    return {"success": True, "stats": search_engine.get_detailed_stats()}
+
+@app.get("/api/cache/stats")
+async def api_cache_stats():
+    """응답 캐시 통계 API"""
+    try:
+        return {
+            "success": True,
+            "cache": search_engine.get_cache_stats(),
+            "admission": search_admission.stats(),
+            "warmup": cache_warmer.stats(),
+            "capture": traffic_capture.stats()
+        }
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+@app.get("/api/slow-queries")
+async def api_slow_queries(limit: int = 20, operation: str = None):
+    """최근 느린 쿼리 API - 단계별 시간, 컬렉션별 후보 수, 캐시 적중, 실행 계획 (최신순)"""
+    return {
+        "success": True,
+        "queries": search_engine.slow_query_log.recent(limit, operation),
+        "stats": search_engine.slow_query_log.stats()
+    }
+
+class IngestRequest(BaseModel):
+    """개발자 데이터 수집 요청"""
+    developers: List[dict]
+
+def accepted_job_response(job, message: str) -> JSONResponse:
+    """수집 작업 등록 응답"""
+    return JSONResponse(
+        status_code=202,
+        content={"success": True, "message": message, "job_id": job.job_id, "job": job.to_dict()},
+        headers={"Location": f"/api/jobs/{job.job_id}"}
+    )
+
+@app.post("/api/ingest")
+async def api_ingest(request: IngestRequest):
+    """개발자 데이터 수집 API - 작업 ID를 즉시 반환하고 백그라운드에서 처리 (같은 ID의 기존 개발자는 교체)"""
+    try:
+        job = ingest_jobs.submit(request.developers, "ingest")
+        return accepted_job_response(job, f"{len(request.developers)}명의 개발자 데이터 수집을 시작했습니다.")
+    except JobQueueFull as e:
+        return JSONResponse(status_code=429, content={"success": False, "error": str(e)}, headers={"Retry-After": "5"})
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+@app.get("/api/jobs")
+async def api_jobs():
+    """최근 수집 작업 목록 API"""
+    return {"success": True, "jobs": ingest_jobs.list_jobs()}
+
+@app.get("/api/jobs/{job_id}")
+async def api_job_status(job_id: str):
+    """수집 작업 상태 API (진행률, 처리 건수, 처리량, 오류)"""
+    job = ingest_jobs.get(job_id)
+    if job is None:
+        return JSONResponse(status_code=404, content={"success": False, "error": "작업을 찾을 수 없습니다."})
+    
+    response = {"success": True, "job": job.to_dict()}
+    if job.done:
+        response["stats"] = search_engine.get_stats()
+    return response
+
 @app.post("/api/init-data")
 async def api_init_data():
-    """데이터 초기화 API"""
+    """데이터 초기화 API - 샘플 데이터 수집 작업 등록 (이미 있는 개발자는 건너뛰고 새 개발자만 추가)"""
     try:
-        developers = search_engine.create_sample_data(30)
-        search_engine.add_developers(developers)
-        stats = search_engine.get_stats()
-        return {"success": True, "message": f"{len(developers)}명의 개발자 데이터가 추가되었습니다.", "stats": stats}
+        developers = search_engine.create_sample_data(DEFAULT_SAMPLE_COUNT)
+        job = ingest_jobs.submit(developers, "sample-data", replace=False)
+        return accepted_job_response(job, f"{len(developers)}명의 개발자 데이터 생성을 시작했습니다.")
+    except JobQueueFull as e:
+        return JSONResponse(status_code=429, content={"success": False, "error": str(e)}, headers={"Retry-After": "5"})
     except Exception as e:
         return {"success": False, "error": str(e)}
 
+class ReindexRequest(BaseModel):
+    """온라인 재색인 요청 (model_name이 없으면 설정된 MODEL_NAME)"""
+    model_name: Optional[str] = None
+
+def reindex_status() -> dict:
+    """사용 중인 컬렉션 세트와 최근 재색인 작업 상태"""
+    return {
+        "success": True,
+        "index": search_engine.index_status(),
+        "reindex": reindexer.stats() if reindexer is not None else None
+    }
+
+@app.post("/api/reindex")
+async def api_reindex(request: Optional[ReindexRequest] = None):
+    """온라인 재색인 API - 새 컬렉션 세트를 백그라운드에서 만들고 완료 시 검색 대상을 교체
+    
+    검색 요청이 처리 중이면 배치를 미루며, 그동안 기존 세트로 검색하고 쓰기는 양쪽 세트에 기록한다.
+    같은 저장소를 쓰는 다른 워커도 세트 상태를 읽어 양쪽 쓰기와 교체를 따라간다.
+    """
+    global reindexer
+    if (reindexer is not None and reindexer.running) or search_engine.index_status()["reindexing"] is not None:
+        return JSONResponse(status_code=409, content={**reindex_status(), "success": False, "error": "이미 재색인 중입니다."})
+    
+    reindexer = OnlineReindexer(
+        search_engine, request.model_name if request else None, REINDEX_BATCH_SIZE, REINDEX_BATCH_PAUSE,
+        busy=search_admission.busy, idle_wait=REINDEX_IDLE_WAIT, gc_delay=REINDEX_GC_DELAY
+    )
+    reindexer.start()
+    return JSONResponse(status_code=202, content={**reindex_status(), "message": "온라인 재색인을 시작했습니다."})
+
+@app.get("/api/reindex")
+async def api_reindex_status():
+    """온라인 재색인 상태 API (진행률, 교체 여부, 사용 중인 세트 버전/모델)"""
+    return reindex_status()
+
+@app.delete("/api/reindex")
+async def api_reindex_stop():
+    """온라인 재색인 중단 (교체 전이면 새 세트 삭제)"""
+    if reindexer is None or not reindexer.running:
+        return JSONResponse(status_code=404, content={"success": False, "error": "진행 중인 재색인이 없습니다."})
+    reindexer.stop()
+    return reindex_status()
+
 def main():
     """메인 함수"""
     parser = argparse.ArgumentParser(description="SKAX-RA-AI-SEARCH 웹 인터페이스")
@@ -0,0 +1,616 @@
+#!/usr/bin/env python3
+"""
+SKAX-RA-AI-SEARCH 성능 측정 스크립트
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import json
+import random
+import resource
+import shutil
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import requests
+
+import numpy as np
+
+from src.core.search_engine import SearchEngine
+from src.core.embedding_pool import EmbeddingPool
+from src.core.dynamic_filter import DynamicFilterEngine
+from src.core.dynamic_filter import company_matches, skill_filter_roles
+from src.core.profile_fields import (
+    ROLE_SKILL_KEYWORDS, build_profile_filter_fields, build_where_clause, company_flag, has_filter_fields, skill_flag
+)
+from src.core.results import parse_fields
+from src.core.planner import QueryPlanner, QueryPlan, PLAN_VECTOR_FIRST
+from src.core.warmup import CacheWarmer
+import src.core.store_client as store_client
+from config.filter_config import FILTER_PRIORITY
+from config.settings import MODEL_NAME, EMBEDDING_MAX_IN_FLIGHT
+
+# 쿼리 생성용 구성 요소
+QUERY_TERMS = {
+    "seniority": ["시니어", "주니어", "중급", ""],
+    "skill": ["React", "Vue", "Python", "Java", "Spring", "Django", "AWS", "Kubernetes", "Node.js", ""],
+    "role": ["프론트엔드", "백엔드", "풀스택", ""],
+    "location": ["서울거주", "경기지역", "부산", ""],
+    "extra": ["3년 이상", "5년 이상", "즉시 가능한", "네이버 경험", "카카오 출신", ""]
+}
+
+def make_queries(count: int, seed: int = 42) -> List[str]:
+    """서로 다른 검색 쿼리 생성"""
+    rng = random.Random(seed)
+    queries = []
+    seen = set()
+    while len(queries) < count:
+        parts = [rng.choice(options) for options in QUERY_TERMS.values()]
+        query = " ".join(p for p in parts if p) + " 개발자"
+        # 조합이 부족하면 번호를 붙여 구분
+        if query in seen:
+            query = f"{query} {len(queries)}"
+        seen.add(query)
+        queries.append(query)
+    return queries
+
+def prepare_engine(args) -> SearchEngine:
+    """측정용 검색 엔진 준비 (DB 경로 미지정 시 임시 DB에 샘플 데이터 적재)"""
+    if args.db_path:
+        return SearchEngine(db_path=args.db_path)
+
+    engine = SearchEngine(db_path=tempfile.mkdtemp(prefix="skax_bench_"))
+    engine.add_developers(engine.create_sample_data(args.developers))
+    return engine
+
+def bench_batch(args):
+    """배치 검색 vs 단건 검색 처리량 비교"""
+    engine = prepare_engine(args)
+    # 캐시 효과를 배제하고 순수 계산 비용만 비교
+    engine.result_cache.enabled = False
+    queries = make_queries(args.queries)
+
+    start = time.perf_counter()
+    single_results = [engine.search_developers(q, args.search_type, args.limit) for q in queries]
+    single_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch_results = engine.search_developers_batch(queries, args.search_type, args.limit)
+    batch_elapsed = time.perf_counter() - start
+
+    same = sum(
+        [r['developer_id'] for r in a] == [r['developer_id'] for r in b]
+        for a, b in zip(single_results, batch_results)
+    )
+
+    print(f"📊 배치 검색 처리량 ({len(queries)}개 쿼리, 타입: {args.search_type})")
+    print(f"  단건 호출: {single_elapsed:.3f}s ({len(queries) / single_elapsed:.1f} qps)")
+    print(f"  배치 호출: {batch_elapsed:.3f}s ({len(queries) / batch_elapsed:.1f} qps)")
+    print(f"  속도 향상: {single_elapsed / batch_elapsed:.2f}x")
+    print(f"  결과 일치: {same}/{len(queries)}")
+
+def make_candidates(count: int, seed: int = 42) -> List[dict]:
+    """필터 측정용 후보 결과 생성 (비정규화 필드가 있는 프로필 검색 결과와 같은 형태)"""
+    rng = random.Random(seed)
+    companies = ["네이버", "카카오", "쿠팡", "토스", "라인", "삼성전자", "LG CNS", "SK C&C"]
+    skills = ["JavaScript", "Python", "Java", "React", "Vue", "Spring", "AWS", "Docker"]
+    candidates = []
+    for i in range(count):
+        developer = {
+            "salary_range": f"{rng.randint(3, 8)}000-{rng.randint(8, 15)}000",
+            "skills": [{"name": rng.choice(skills)} for _ in range(rng.randint(3, 6))],
+            "experience": [{"company": rng.choice(companies)} for _ in range(rng.randint(1, 3))]
+        }
+        metadata = {
+            "developer_id": f"dev_{i + 1:05d}",
+            "location": rng.choice(["서울", "경기", "부산", "대구", "대전", "광주", "인천"]),
+            "seniority": rng.choice(["junior", "mid", "senior"]),
+            "primary_role": rng.choice(["frontend", "backend", "fullstack", "devops"]),
+            "years_experience": rng.randint(1, 15),
+            "availability": rng.choice(["available", "busy", "considering"])
+        }
+        metadata.update(build_profile_filter_fields(developer))
+        candidates.append({
+            "developer_id": metadata["developer_id"],
+            "total_score": rng.random(),
+            "metadata": metadata,
+            "experience": developer["experience"]
+        })
+    candidates.sort(key=lambda x: x["total_score"], reverse=True)
+    return candidates
+
+def rowwise_check_filter(result: dict, filter_type: str, filter_value) -> bool:
+    """단일 결과의 필터 조건 확인 - 컴파일 전 행 단위 판정 (비교 기준)"""
+    metadata = result.get("metadata", {})
+    if filter_type == "companies":
+        if not isinstance(filter_value, str):
+            return True
+        if has_filter_fields(metadata):
+            return company_flag(filter_value) in metadata
+        return company_matches(result, filter_value.lower())
+
+    if filter_type == "experience_years":
+        years = metadata.get("years_experience", 0)
+        bounds = filter_value if isinstance(filter_value, dict) else {}
+        return bounds.get("min", years) <= years <= bounds.get("max", years)
+
+    if filter_type == "salary":
+        bounds = filter_value if isinstance(filter_value, dict) else {}
+        if "min" in bounds and metadata.get("salary_max", bounds["min"]) < bounds["min"]:
+            return False
+        return not ("max" in bounds and metadata.get("salary_min", bounds["max"]) > bounds["max"])
+
+    if filter_type == "skills":
+        if not isinstance(filter_value, str):
+            return False
+        primary_role = metadata.get("primary_role", "").lower()
+        role_keywords = ROLE_SKILL_KEYWORDS.get(filter_value.lower())
+        if role_keywords:
+            return primary_role in role_keywords
+        if has_filter_fields(metadata):
+            return skill_flag(filter_value) in metadata
+        return primary_role in skill_filter_roles(filter_value)
+
+    # 기본 필터 (seniority, availability, location) - 메타데이터에 없는 항목은 통과
+    return filter_type not in metadata or metadata[filter_type] == filter_value
+
+def rowwise_apply_filters(engine: DynamicFilterEngine, results: List[dict], filters: dict) -> List[dict]:
+    """결과마다 필터를 두 번(매칭, 우선순위) 평가하는 행 단위 방식 (비교 기준)"""
+    filtered = []
+    for result in results:
+        result = dict(result)
+        mismatch = sum(not rowwise_check_filter(result, ft, fv) for ft, fv in filters.items())
+        if mismatch and engine.strict_mode:
+            continue
+        original = result.get("total_score", result.get("score", 1.0))
+        if mismatch:
+            result["total_score"] = max(original * (1 - mismatch / len(filters) * 0.5), 0.1)
+        else:
+            result["total_score"] = min(original, 1.0)
+        filtered.append(result)
+
+    def priority_score(result):
+        return sum(
+            FILTER_PRIORITY.get(ft, 1)
+            for ft, fv in filters.items()
+            if rowwise_check_filter(result, ft, fv)
+        )
+    filtered.sort(key=priority_score, reverse=True)
+    return filtered
+
+def bench_filters(args):
+    """컴파일된 필터 vs 행 단위 필터 처리 시간 비교"""
+    filters = {
+        "seniority": "senior", "location": "서울", "experience_years": {"min": 3},
+        "skills": "React", "companies": "네이버", "salary": {"min": 9000}
+    }
+    for mode in ("default", "strict"):
+        engine = DynamicFilterEngine(mode)
+        for count in args.candidates:
+            candidates = make_candidates(count)
+
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                rowwise = rowwise_apply_filters(engine, candidates, filters)
+            rowwise_elapsed = (time.perf_counter() - start) / args.repeat
+
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                compiled = engine.compile_filters(filters).apply(candidates, args.limit)
+            compiled_elapsed = (time.perf_counter() - start) / args.repeat
+
+            rowwise = rowwise[:args.limit]
+            same = [(r["developer_id"], r["total_score"]) for r in rowwise] == [(r["developer_id"], r["total_score"]) for r in compiled]
+            print(f"📊 필터 적용 ({mode} 모드, 후보 {count}개)")
+            print(f"  행 단위: {rowwise_elapsed * 1000:.2f}ms")
+            print(f"  컴파일: {compiled_elapsed * 1000:.2f}ms ({rowwise_elapsed / compiled_elapsed:.2f}x)")
+            print(f"  결과 일치: {same}")
+
+def bench_embedding(args):
+    """멀티 프로세스 임베딩 처리량 - 프로세스 수 1..N 확장성 측정"""
+    engine = SearchEngine(db_path=tempfile.mkdtemp(prefix="skax_bench_"))
+    developers = engine.create_sample_data(args.developers)
+    texts = [
+        text
+        for start in range(0, len(developers), args.chunk)
+        for items in engine._build_index_entries(developers[start:start + args.chunk]).values()
+        for text, _ in items.values()
+    ]
+    chunks = [texts[i:i + args.chunk] for i in range(0, len(texts), args.chunk)]
+
+    start = time.perf_counter()
+    engine.embedding_model.encode(texts)
+    baseline = len(texts) / (time.perf_counter() - start)
+    print(f"📊 임베딩 처리량 (텍스트 {len(texts)}개, 청크 {args.chunk}개)")
+    print(f"  단일 프로세스 encode: {baseline:.1f} texts/s")
+
+    first = None
+    for processes in range(1, args.processes + 1):
+        with EmbeddingPool(MODEL_NAME, processes, args.max_in_flight) as pool:
+            # 워커 시작/모델 로드 시간 제외
+            list(pool.imap((None, chunks[0]) for _ in range(processes)))
+
+            start = time.perf_counter()
+            count = sum(len(vectors) for _, vectors in pool.imap((None, chunk) for chunk in chunks))
+            throughput = count / (time.perf_counter() - start)
+
+        first = first or throughput
+        print(f"  {processes}개 프로세스: {throughput:.1f} texts/s "
+              f"(x{throughput / first:.2f}, 효율 {throughput / first / processes * 100:.0f}%)")
+    print(f"  부모 프로세스 최대 RSS: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f}MB")
+
+def peak_allocation(calls) -> float:
+    """호출별 최대 메모리 할당량 평균 (바이트)"""
+    peaks = []
+    tracemalloc.start()
+    for call in calls:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        call()
+        peaks.append(tracemalloc.get_traced_memory()[1] - before)
+    tracemalloc.stop()
+    return sum(peaks) / len(peaks)
+
+def bench_payload(args):
+    """필드 선택 응답 크기와 쿼리당 메모리 할당 측정"""
+    engine = prepare_engine(args)
+    engine.result_cache.enabled = False
+    queries = make_queries(args.queries)
+    fields = parse_fields(args.fields)
+
+    def payload_bytes(projection) -> float:
+        sizes = [
+            len(json.dumps(
+                engine.search_developers(q, args.search_type, args.limit, fields=projection), ensure_ascii=False
+            ).encode("utf-8"))
+            for q in queries
+        ]
+        return sum(sizes) / len(sizes)
+
+    def timed(projection) -> float:
+        start = time.perf_counter()
+        for q in queries:
+            engine.search_developers(q, args.search_type, args.limit, fields=projection)
+        return (time.perf_counter() - start) / len(queries) * 1000
+
+    full_bytes, projected_bytes = payload_bytes(None), payload_bytes(fields)
+    full_ms, projected_ms = timed(None), timed(fields)
+    full_peak = peak_allocation(
+        lambda q=q: engine.search_developers(q, args.search_type, args.limit) for q in queries)
+    projected_peak = peak_allocation(
+        lambda q=q: engine.search_developers(q, args.search_type, args.limit, fields=fields) for q in queries)
+
+    print(f"📊 응답 크기 ({len(queries)}개 쿼리, 타입: {args.search_type}, 필드: {','.join(fields)})")
+    print(f"  전체 필드: {full_bytes / 1024:.1f}KB/응답, {full_ms:.2f}ms/쿼리, 쿼리당 최대 할당 {full_peak / 1024:.1f}KB")
+    print(f"  필드 선택: {projected_bytes / 1024:.1f}KB/응답 ({projected_bytes / full_bytes * 100:.0f}%), "
+          f"{projected_ms:.2f}ms/쿼리, 쿼리당 최대 할당 {projected_peak / 1024:.1f}KB")
+
+    # 인덱스 질의에서 문서 본문을 가져올 때와 빼고 가져올 때의 쿼리당 할당량
+    embeddings = engine.embedding_model.encode(queries).tolist()
+    n_results = args.limit * 3 * 2
+    for include in (['documents', 'metadatas', 'distances'], ['metadatas', 'distances']):
+        def query_indexes(embedding, include=include):
+            for name in ('profiles', 'skills', 'experience'):
+                engine.collections[name].query(query_embeddings=[embedding], n_results=n_results, include=include)
+        start = time.perf_counter()
+        for embedding in embeddings:
+            query_indexes(embedding)
+        elapsed = (time.perf_counter() - start) / len(queries) * 1000
+        peak = peak_allocation(lambda e=e: query_indexes(e) for e in embeddings)
+        print(f"  인덱스 질의 include={include}: {elapsed:.2f}ms/쿼리, 쿼리당 최대 할당 {peak / 1024:.1f}KB")
+
+class FixedOverfetchPlanner(QueryPlanner):
+    """비교용 - 항상 벡터 우선, limit * 3 고정 조회 (플래너 도입 전 동작)"""
+
+    def plan(self, filters, search_type, limit, strict_mode):
+        where = build_where_clause(filters) if strict_mode and search_type == "profile_only" else None
+        return QueryPlan(PLAN_VECTOR_FIRST, limit if where else limit * 3, where, reason="고정 조회")
+
+def bench_planner(args):
+    """쿼리 플래너 vs 고정 추가 조회 - 지연시간, 조회 수, 결과 부족 쿼리 수"""
+    engine = prepare_engine(args)
+    engine.result_cache.enabled = False
+    queries = make_queries(args.queries)
+    planner = engine.query_planner
+
+    for mode in ("default", "strict"):
+        filter_engine = engine.get_filter_engine(mode)
+        # 엄격 모드에서 실제 일치 개발자 수 (결과가 limit보다 적게 나온 쿼리 판정용)
+        matches = {}
+        for query in queries:
+            where = build_where_clause(filter_engine.extract_filters(query))
+            matches[query] = len(engine.collections['profiles'].get(where=where, include=[])['ids']) if where else None
+
+        for label, active in (("고정 조회", FixedOverfetchPlanner(planner.histograms)), ("플래너", planner)):
+            engine.query_planner = active
+            strategies = {}
+            fetched = 0
+            short = 0
+            start = time.perf_counter()
+            for query in queries:
+                plan = engine.plan_search(query, args.search_type, args.limit, mode)
+                strategies[plan.strategy] = strategies.get(plan.strategy, 0) + 1
+                fetched += plan.fetch
+                results = engine.search_developers(query, args.search_type, args.limit, mode)
+                expected = min(args.limit, matches[query]) if mode == "strict" and matches[query] is not None else args.limit
+                short += len(results) < expected
+            elapsed = (time.perf_counter() - start) / len(queries) * 1000
+            print(f"📊 {label} ({mode} 모드, 타입: {args.search_type}): {elapsed:.2f}ms/쿼리, "
+                  f"평균 조회 수 {fetched / len(queries):.1f}, 결과 부족 {short}/{len(queries)}, 계획 {strategies}")
+        engine.query_planner = planner
+
+def parse_two_stage_spec(spec: str, candidates: int) -> dict:
+    """2단계 검색 설정 문자열 파싱 ("pca:64:int8" -> {"method": "pca", "dims": 64, "quantize": True, ...})"""
+    method, dims, precision = (spec.split(":") + ["int8"])[:3]
+    return {"method": method, "dims": int(dims), "quantize": precision == "int8", "candidates": candidates}
+
+def bench_two_stage(args):
+    """2단계 검색 vs 단일 단계(HNSW) - 문서당 메모리, 지연시간, 정확 검색 대비 recall@k"""
+    engine = prepare_engine(args)
+    engine.result_cache.enabled = False
+    names = ("profiles", "skills", "experience")
+    embeddings = engine.embedding_model.encode(make_queries(args.queries)).tolist()
+    corpora = {name: engine.collections[name].get(include=['embeddings', 'metadatas']) for name in names}
+    dimension = len(embeddings[0])
+
+    # 정답: 전체 임베딩 전수 검색 - 거리가 같은 항목이 많으므로 k번째 거리(점수) 이내면 적중으로 계산
+    exact = {
+        name: [dict(zip(result['ids'][0], result['distances'][0])) for result in (
+            engine._exact_query(name, [e], corpora[name], len(corpora[name]['ids'])) for e in embeddings
+        )]
+        for name in names
+    }
+    thresholds = {name: [sorted(d.values())[min(args.k, len(d)) - 1] for d in exact[name]] for name in names}
+    depth = args.limit * 3 * 2
+    exact_merged = [
+        {hit.developer_id: hit.total_score for hit in engine._merge_index_results(
+            *[engine._exact_query(name, [e], corpora[name], depth) for name in names])}
+        for e in embeddings
+    ]
+    merged_thresholds = [sorted(scores.values(), reverse=True)[min(args.limit, len(scores)) - 1] for scores in exact_merged]
+    plan = QueryPlan(PLAN_VECTOR_FIRST, args.limit * 3)
+    epsilon = 1e-5
+
+    def run(label: str, bytes_per_document: float):
+        print(f"📊 {label} (문서당 상주 벡터 {bytes_per_document:.0f}B, 원본 대비 {bytes_per_document / (dimension * 4) * 100:.0f}%)")
+        for name in names:
+            latencies, hits = [], 0
+            for i, embedding in enumerate(embeddings):
+                start = time.perf_counter()
+                result = engine._query_index(name, [embedding], args.k)
+                latencies.append((time.perf_counter() - start) * 1000)
+                hits += sum(exact[name][i][entry_id] <= thresholds[name][i] + epsilon for entry_id in result['ids'][0])
+            print(f"  {name:<10} recall@{args.k} {hits / (len(embeddings) * args.k):.3f}, "
+                  f"p50 {np.percentile(latencies, 50):.2f}ms, p99 {np.percentile(latencies, 99):.2f}ms")
+
+        latencies, hits = [], 0
+        for i, embedding in enumerate(embeddings):
+            start = time.perf_counter()
+            merged = engine._execute_plan(plan, [embedding], "comprehensive")[0][:args.limit]
+            latencies.append((time.perf_counter() - start) * 1000)
+            hits += sum(
+                exact_merged[i].get(hit.developer_id, -np.inf) >= merged_thresholds[i] - epsilon for hit in merged
+            )
+        print(f"  {'종합 검색':<9} recall@{args.limit} {hits / (len(embeddings) * args.limit):.3f}, "
+              f"p50 {np.percentile(latencies, 50):.2f}ms, p99 {np.percentile(latencies, 99):.2f}ms")
+
+    engine.configure_two_stage({})
+    run("단일 단계 (HNSW)", dimension * 4)
+    for spec in args.configs:
+        params = parse_two_stage_spec(spec, args.candidates)
+        engine.configure_two_stage({name: params for name in names})
+        run(f"2단계 {spec} (후보 x{args.candidates})", engine.compact_indexes["profiles"].bytes_per_document())
+
+def bench_warmup(args):
+    """재시작 직후 콜드 캐시 vs 쿼리 로그 워밍업 - 워밍업 시간, 이후 요청의 캐시 적중률/지연시간"""
+    engine = prepare_engine(args)
+    db_path = engine.db_path
+    # 쿼리 빈도는 Zipf 분포 (소수의 인기 쿼리에 요청 집중)
+    queries = make_queries(args.distinct)
+    weights = [1 / (rank + 1) ** args.zipf for rank in range(len(queries))]
+    rng = random.Random(1)
+    history = rng.choices(queries, weights, k=args.requests)
+    traffic = rng.choices(queries, weights, k=args.requests)
+
+    # 재시작 전 트래픽으로 쿼리 로그 기록
+    for query in history:
+        engine.search_developers(query, limit=args.limit)
+    engine.query_log.flush()
+    print(f"📊 쿼리 로그: {engine.query_log.stats()['queries']}개 쿼리, {len(history)}건 기록")
+
+    for label, warm in (("콜드 캐시", False), (f"워밍업 (상위 {args.top_n}개)", True)):
+        restarted = SearchEngine(db_path=db_path)
+        warmup = ""
+        if warm:
+            warmer = CacheWarmer(restarted, args.top_n)
+            warmer.start()
+            warmer.join()
+            stats = warmer.stats()
+            warmup = f"워밍업 {stats['elapsed_seconds']:.2f}초 ({stats['warmed']}개 계산), "
+        result_before = restarted.result_cache.stats()
+        embedding_before = restarted.embedding_cache.stats()
+
+        latencies = []
+        for i, query in enumerate(traffic):
+            if args.write_every and i and i % args.write_every == 0:
+                # 쓰기 후와 같은 응답 캐시 무효화 (임베딩 캐시는 유지)
+                restarted._bump_generation()
+            start = time.perf_counter()
+            restarted.search_developers(query, limit=args.limit)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+        result_after = restarted.result_cache.stats()
+        embedding_after = restarted.embedding_cache.stats()
+        result_hits = result_after["hits"] - result_before["hits"]
+        embedding_lookups = (embedding_after["hits"] + embedding_after["misses"]
+                             - embedding_before["hits"] - embedding_before["misses"])
+        embedding_hits = embedding_after["hits"] - embedding_before["hits"]
+        first = latencies[:args.requests // 10 or 1]
+        print(f"📊 {label}: {warmup}응답 캐시 적중률 {result_hits / len(traffic):.1%}, "
+              f"임베딩 캐시 적중률 {embedding_hits / embedding_lookups if embedding_lookups else 0:.1%}, "
+              f"처음 10% 요청 p50 {np.percentile(first, 50):.2f}ms / p99 {np.percentile(first, 99):.2f}ms, "
+              f"전체 p50 {np.percentile(latencies, 50):.2f}ms")
+
+def start_chroma_server(db_path: str, port: int, timeout: float = 60.0) -> subprocess.Popen:
+    """DB 복사본으로 로컬 Chroma 서버 실행 후 응답할 때까지 대기"""
+    server = subprocess.Popen(
+        ["chroma", "run", "--path", db_path, "--host", "127.0.0.1", "--port", str(port)],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"Chroma 서버 실행 실패 (종료 코드 {server.returncode})")
+        try:
+            requests.get(f"http://127.0.0.1:{port}/api/v2/heartbeat", timeout=1).raise_for_status()
+            return server
+        except requests.RequestException:
+            time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError("Chroma 서버 응답 대기 시간 초과")
+
+def measure_throughput(engine: SearchEngine, queries: List[str], concurrency: int, search_type: str,
+                       limit: int) -> dict:
+    """동시 요청 수별 폐쇄 루프 검색 처리량과 지연시간"""
+    latencies = []
+
+    def run(query):
+        start = time.perf_counter()
+        engine.search_developers(query, search_type, limit)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(run, queries))
+    elapsed = time.perf_counter() - start
+    return {
+        "qps": len(queries) / elapsed,
+        "p50_ms": float(np.percentile(latencies, 50)),
+        "p99_ms": float(np.percentile(latencies, 99))
+    }
+
+def bench_store(args):
+    """프로세스 내 저장소(embedded) vs 로컬 Chroma 서버(http) 검색 처리량 비교"""
+    engine = prepare_engine(args)
+    engine.result_cache.enabled = False
+    queries = make_queries(args.queries)
+    # 임베딩 계산은 두 모드가 같으므로 미리 채워 저장소 비용만 비교
+    engine._encode_queries(queries)
+
+    server = None
+    server_path = None
+    if args.port is None:
+        server_path = tempfile.mkdtemp(prefix="skax_chroma_")
+        shutil.copytree(engine.db_path, server_path, dirs_exist_ok=True)
+        port = args.server_port
+        server = start_chroma_server(server_path, port)
+        print(f"🚀 로컬 Chroma 서버 실행: 127.0.0.1:{port} ({server_path})")
+    else:
+        port = args.port
+        print(f"🔗 실행 중인 Chroma 서버 사용: {args.host}:{port}")
+
+    try:
+        store_client.CHROMA_MODE = store_client.MODE_HTTP
+        store_client.CHROMA_HOST = args.host
+        store_client.CHROMA_PORT = port
+        store_client.CHROMA_POOL_SIZE = args.pool_size
+        remote = SearchEngine(db_path=tempfile.mkdtemp(prefix="skax_bench_local_"))
+        remote.result_cache.enabled = False
+        remote._encode_queries(queries)
+
+        print(f"📊 저장소 모드별 검색 처리량 ({len(queries)}개 쿼리, 타입: {args.search_type}, "
+              f"연결 풀 {args.pool_size}개)")
+        for concurrency in args.concurrency:
+            for label, target in (("embedded", engine), ("http", remote)):
+                stats = measure_throughput(target, queries, concurrency, args.search_type, args.limit)
+                print(f"  동시 {concurrency:>3} {label:<9} {stats['qps']:>8.1f} qps, "
+                      f"p50 {stats['p50_ms']:.2f}ms, p99 {stats['p99_ms']:.2f}ms")
+    finally:
+        store_client.CHROMA_MODE = store_client.MODE_EMBEDDED
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=10)
+            shutil.rmtree(server_path, ignore_errors=True)
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="SKAX-RA-AI-SEARCH 성능 측정")
+    parser.add_argument("--db-path", default=None, help="측정할 DB 경로 (미지정 시 임시 샘플 DB)")
+    parser.add_argument("--developers", type=int, default=1000, help="임시 DB에 적재할 개발자 수")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    batch_parser = subparsers.add_parser("batch", help="배치 검색 처리량 측정")
+    batch_parser.add_argument("--queries", type=int, default=200, help="쿼리 수")
+    batch_parser.add_argument("--search-type", default="comprehensive", help="검색 타입")
+    batch_parser.add_argument("--limit", type=int, default=10, help="쿼리당 결과 수")
+    batch_parser.set_defaults(func=bench_batch)
+
+    filters_parser = subparsers.add_parser("filters", help="필터 적용 시간 측정 (임시 DB 불필요)")
+    filters_parser.add_argument("--candidates", type=int, nargs="+", default=[1000, 10000, 50000], help="후보 수")
+    filters_parser.add_argument("--repeat", type=int, default=5, help="반복 횟수")
+    filters_parser.add_argument("--limit", type=int, default=30, help="정렬 후 사용할 상위 결과 수")
+    filters_parser.set_defaults(func=bench_filters)
+
+    embedding_parser = subparsers.add_parser("embedding", help="멀티 프로세스 임베딩 확장성 측정")
+    embedding_parser.add_argument("--processes", type=int, default=os.cpu_count() or 1, help="측정할 최대 프로세스 수")
+    embedding_parser.add_argument("--chunk", type=int, default=64, help="워커에 보낼 청크당 텍스트 수")
+    embedding_parser.add_argument("--max-in-flight", type=int, default=EMBEDDING_MAX_IN_FLIGHT, help="진행 중 청크 수 상한")
+    embedding_parser.set_defaults(func=bench_embedding)
+
+    payload_parser = subparsers.add_parser("payload", help="필드 선택 응답 크기/할당량 측정")
+    payload_parser.add_argument("--queries", type=int, default=100, help="쿼리 수")
+    payload_parser.add_argument("--search-type", default="comprehensive", help="검색 타입")
+    payload_parser.add_argument("--limit", type=int, default=10, help="쿼리당 결과 수")
+    payload_parser.add_argument("--fields", default="name,primary_role,seniority,availability,location,years_experience,salary_range",
+                                help="선택할 필드 (쉼표 구분)")
+    payload_parser.set_defaults(func=bench_payload)
+
+    planner_parser = subparsers.add_parser("planner", help="쿼리 플래너 vs 고정 추가 조회 비교")
+    planner_parser.add_argument("--queries", type=int, default=100, help="쿼리 수")
+    planner_parser.add_argument("--search-type", default="comprehensive", help="검색 타입")
+    planner_parser.add_argument("--limit", type=int, default=10, help="쿼리당 결과 수")
+    planner_parser.set_defaults(func=bench_planner)
+
+    two_stage_parser = subparsers.add_parser("two-stage", help="2단계 검색 메모리/지연시간/recall 측정")
+    two_stage_parser.add_argument("--queries", type=int, default=100, help="쿼리 수")
+    two_stage_parser.add_argument("--k", type=int, default=10, help="컬렉션별 recall@k의 k")
+    two_stage_parser.add_argument("--limit", type=int, default=10, help="종합 검색 결과 수")
+    two_stage_parser.add_argument("--candidates", type=int, default=4, help="조회 수 대비 1단계 후보 배수")
+    two_stage_parser.add_argument("--configs", nargs="+",
+                                  default=["pca:32:int8", "pca:64:int8", "pca:128:int8", "pca:64:float32", "truncate:64:int8"],
+                                  help="측정할 설정 (방식:차원:int8|float32)")
+    two_stage_parser.set_defaults(func=bench_two_stage)
+
+    warmup_parser = subparsers.add_parser("warmup", help="재시작 후 콜드 캐시 vs 쿼리 로그 워밍업 비교")
+    warmup_parser.add_argument("--distinct", type=int, default=300, help="서로 다른 쿼리 수")
+    warmup_parser.add_argument("--requests", type=int, default=1000, help="재시작 전/후 요청 수")
+    warmup_parser.add_argument("--zipf", type=float, default=1.1, help="쿼리 빈도 Zipf 지수")
+    warmup_parser.add_argument("--top-n", type=int, default=100, help="워밍업할 상위 쿼리 수")
+    warmup_parser.add_argument("--limit", type=int, default=10, help="쿼리당 결과 수")
+    warmup_parser.add_argument("--write-every", type=int, default=0, help="N건마다 응답 캐시 무효화 (0이면 없음)")
+    warmup_parser.set_defaults(func=bench_warmup)
+
+    store_parser = subparsers.add_parser("store", help="embedded vs Chroma 서버(http) 모드 처리량 비교")
+    store_parser.add_argument("--queries", type=int, default=200, help="쿼리 수")
+    store_parser.add_argument("--search-type", default="comprehensive", help="검색 타입")
+    store_parser.add_argument("--limit", type=int, default=10, help="쿼리당 결과 수")
+    store_parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16], help="측정할 동시 요청 수")
+    store_parser.add_argument("--pool-size", type=int, default=16, help="http 모드 연결 풀 크기")
+    store_parser.add_argument("--host", default="127.0.0.1", help="Chroma 서버 주소")
+    store_parser.add_argument("--port", type=int, default=None,
+                              help="실행 중인 Chroma 서버 포트 (미지정 시 DB 복사본으로 서버를 직접 실행)")
+    store_parser.add_argument("--server-port", type=int, default=8123, help="직접 실행하는 서버 포트")
+    store_parser.set_defaults(func=bench_store)
+
+    args = parser.parse_args()
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+SKAX-RA-AI-SEARCH 대량 재색인 스크립트
+프로필/기술/경력 텍스트 임베딩을 여러 워커 프로세스에 분산해 개발자 데이터를 일괄 갱신
+(사용 중인 컬렉션 세트의 모델로 임베딩 - 모델 교체는 웹 서버의 온라인 재색인 POST /api/reindex 사용)
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import json
+import time
+
+from src.core.search_engine import SearchEngine
+from src.core.embedding_pool import EmbeddingPool
+from config.settings import DB_PATH, INGEST_BATCH_SIZE, EMBEDDING_PROCESSES, EMBEDDING_MAX_IN_FLIGHT
+
+def load_developers(args, engine: SearchEngine):
+    """재색인할 개발자 데이터 (JSON 파일 또는 샘플 생성)"""
+    if args.input:
+        with open(args.input, encoding="utf-8") as f:
+            return json.load(f)
+
+    developers = engine.create_sample_data(args.sample)
+    for i, dev in enumerate(developers):
+        dev["developer_id"] = f"dev_{i + 1:06d}"
+    return developers
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="SKAX-RA-AI-SEARCH 대량 재색인")
+    parser.add_argument("--db-path", default=DB_PATH, help="대상 DB 경로")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--input", help="개발자 목록 JSON 파일")
+    source.add_argument("--sample", type=int, help="샘플 개발자 수 (측정용)")
+    parser.add_argument("--processes", type=int, default=EMBEDDING_PROCESSES, help="임베딩 워커 프로세스 수")
+    parser.add_argument("--batch-size", type=int, default=INGEST_BATCH_SIZE, help="워커에 보낼 배치당 개발자 수")
+    parser.add_argument("--max-in-flight", type=int, default=EMBEDDING_MAX_IN_FLIGHT, help="진행 중 배치 수 상한")
+    args = parser.parse_args()
+
+    engine = SearchEngine(db_path=args.db_path)
+    developers = load_developers(args, engine)
+    print(f"🔄 재색인 시작: {len(developers)}명 ({args.processes}개 프로세스, 배치 {args.batch_size}명)")
+
+    processed = 0
+    start = time.perf_counter()
+    with EmbeddingPool(engine.model_name, args.processes, args.max_in_flight) as pool:
+        for written in engine.update_developers_parallel(developers, pool, args.batch_size):
+            processed += written
+            elapsed = time.perf_counter() - start
+            print(f"  {processed}/{len(developers)}명 ({processed / elapsed:.1f}명/초)", end="\r")
+
+    elapsed = time.perf_counter() - start
+    print(f"\n✅ 재색인 완료: {processed}명, {elapsed:.2f}초 ({processed / elapsed:.1f}명/초)")
+    print(f"📊 {engine.get_stats()}")
+
+if __name__ == "__main__":
+    main()
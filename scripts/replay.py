@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+SKAX-RA-AI-SEARCH 요청 재생 스크립트
+캡처한 요청(CAPTURE_PATH)을 로컬 서버에 개방 루프(open-loop)로 재생해 지연시간/오류율을 측정하고 빌드 간 결과 차이 비교
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import json
+import random
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import requests
+
+# 재생하는 엔드포인트
+ENDPOINTS = ("/api/search", "/api/filter", "/profile")
+
+def load_entries(path: str, endpoints: Tuple[str, ...] = ENDPOINTS, limit: int = None) -> List[Dict[str, Any]]:
+    """캡처/재생 결과 JSONL 읽기 (손상된 줄은 건너뜀)"""
+    entries = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if entry.get("endpoint") in endpoints:
+                entries.append(entry)
+            if limit and len(entries) >= limit:
+                break
+    return entries
+
+def schedule(entries: List[Dict[str, Any]], qps: Optional[float], speed: float, seed: int = 0) -> List[float]:
+    """요청별 전송 시각(시작 기준 초) - qps 지정 시 포아송 도착, 아니면 캡처 시각 간격을 speed배로 재생"""
+    if qps:
+        rng = random.Random(seed)
+        offsets, now = [], 0.0
+        for _ in entries:
+            offsets.append(now)
+            now += rng.expovariate(qps)
+        return offsets
+    start = entries[0]["ts"] if entries else 0.0
+    return [max(0.0, (entry["ts"] - start) / speed) for entry in entries]
+
+class Replayer:
+    """개방 루프 재생기 - 응답을 기다리지 않고 예정 시각에 요청을 보내며 지연시간은 예정 시각부터 측정
+    (동시 요청 수 상한에 걸려 늦게 보낸 시간도 지연시간에 포함)"""
+
+    def __init__(self, base_url: str, concurrency: int, timeout: float):
+        self.base_url = base_url.rstrip("/")
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+
+    def send(self, entry: Dict[str, Any]) -> Tuple[int, bool, List[str], Optional[str]]:
+        """요청 한 건 전송 - (상태 코드, 성공 여부, 결과 ID, 오류)"""
+        params = entry["params"]
+        endpoint = entry["endpoint"]
+        if endpoint == "/profile":
+            response = self._session().get(f"{self.base_url}/profile/{params['developer_id']}", timeout=self.timeout)
+            # 프로필 페이지는 HTML - 상태 코드만 비교
+            ok = response.status_code == 200
+            return response.status_code, ok, [params["developer_id"]] if ok else [], None if ok else response.text[:200]
+
+        response = self._session().post(f"{self.base_url}{endpoint}", data=params, timeout=self.timeout)
+        try:
+            body = response.json()
+        except ValueError:
+            return response.status_code, False, [], response.text[:200]
+        success = response.status_code == 200 and bool(body.get("success"))
+        ids = [result["developer_id"] for result in body.get("results", [])] if success else []
+        return response.status_code, success, ids, None if success else str(body.get("error"))
+
+    def run(self, entries: List[Dict[str, Any]], offsets: List[float]) -> List[Dict[str, Any]]:
+        """예정 시각에 맞춰 전체 요청 재생 (입력 순서대로 결과 반환)"""
+        results: List[Optional[Dict[str, Any]]] = [None] * len(entries)
+        start = time.perf_counter()
+
+        def execute(index: int, entry: Dict[str, Any], scheduled: float):
+            sent = time.perf_counter()
+            try:
+                status, success, ids, error = self.send(entry)
+            except requests.RequestException as e:
+                status, success, ids, error = 0, False, [], str(e)
+            finished = time.perf_counter()
+            results[index] = {
+                "seq": index,
+                "endpoint": entry["endpoint"],
+                "params": entry["params"],
+                "status": status,
+                "success": success,
+                "elapsed_ms": round((finished - start - scheduled) * 1000, 2),
+                "service_ms": round((finished - sent) * 1000, 2),
+                "ids": ids,
+                "error": error
+            }
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for index, (entry, offset) in enumerate(zip(entries, offsets)):
+                delay = start + offset - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                executor.submit(execute, index, entry, offset)
+        return results
+
+def summarize(results: List[Dict[str, Any]], elapsed: float) -> None:
+    """엔드포인트별 지연시간 백분위수와 오류율 출력"""
+    groups = defaultdict(list)
+    for result in results:
+        groups[result["endpoint"]].append(result)
+    groups["전체"] = results
+
+    print(f"📊 재생: {len(results)}건, {elapsed:.1f}초 ({len(results) / elapsed if elapsed else 0:.1f} req/s)")
+    for endpoint, items in groups.items():
+        latencies = [item["elapsed_ms"] for item in items]
+        errors = sum(not item["success"] for item in items)
+        p50, p90, p99 = np.percentile(latencies, [50, 90, 99])
+        print(f"  {endpoint:<12} {len(items):>6}건, 오류 {errors}건 ({errors / len(items):.1%}), "
+              f"p50 {p50:.1f}ms, p90 {p90:.1f}ms, p99 {p99:.1f}ms, 최대 {max(latencies):.1f}ms")
+
+    failures = defaultdict(int)
+    for result in results:
+        if not result["success"]:
+            failures[f"{result['status']} {result.get('error') or ''}"[:120]] += 1
+    for message, count in sorted(failures.items(), key=lambda item: -item[1])[:5]:
+        print(f"  ⚠️ {count}건: {message}")
+
+def diff_results(baseline: List[Dict[str, Any]], candidate: List[Dict[str, Any]], examples: int = 5) -> Dict[str, Any]:
+    """같은 순서의 두 요청 결과 목록 비교 (둘 다 성공한 요청만 대상)"""
+    compared = identical = reordered = top1_changed = 0
+    overlaps = []
+    worst = []
+    for index, (before, after) in enumerate(zip(baseline, candidate)):
+        if not (before.get("success") and after.get("success")):
+            continue
+        if before["endpoint"] == "/profile":
+            continue
+        compared += 1
+        before_ids, after_ids = before["ids"], after["ids"]
+        if before_ids == after_ids:
+            identical += 1
+            overlaps.append(1.0)
+            continue
+        union = set(before_ids) | set(after_ids)
+        overlap = len(set(before_ids) & set(after_ids)) / len(union) if union else 1.0
+        overlaps.append(overlap)
+        if set(before_ids) == set(after_ids):
+            reordered += 1
+        if before_ids[:1] != after_ids[:1]:
+            top1_changed += 1
+        worst.append((overlap, index, before, after))
+
+    worst.sort(key=lambda item: item[0])
+    return {
+        "compared": compared,
+        "identical": identical,
+        "reordered": reordered,
+        "top1_changed": top1_changed,
+        "mean_jaccard": float(np.mean(overlaps)) if overlaps else None,
+        "examples": [
+            {"index": index, "endpoint": before["endpoint"], "params": before["params"], "jaccard": round(overlap, 3),
+             "baseline": before["ids"], "candidate": after["ids"]}
+            for overlap, index, before, after in worst[:examples]
+        ]
+    }
+
+def print_diff(diff: Dict[str, Any]) -> None:
+    """결과 차이 요약 출력"""
+    compared = diff["compared"]
+    if not compared:
+        print("📊 결과 비교: 비교할 요청 없음")
+        return
+    print(f"📊 결과 비교: {compared}건 중 동일 {diff['identical']}건 ({diff['identical'] / compared:.1%}), "
+          f"순서만 다름 {diff['reordered']}건, 1위 변경 {diff['top1_changed']}건, 평균 Jaccard {diff['mean_jaccard']:.3f}")
+    for example in diff["examples"]:
+        print(f"  #{example['index']} {example['endpoint']} {json.dumps(example['params'], ensure_ascii=False)} "
+              f"Jaccard {example['jaccard']}: {example['baseline'][:5]} → {example['candidate'][:5]}")
+
+def command_replay(args):
+    """캡처 재생"""
+    entries = load_entries(args.capture, tuple(args.endpoints), args.max_requests)
+    if not entries:
+        print("❌ 재생할 요청이 없습니다.")
+        return
+    offsets = schedule(entries, args.qps, args.speed, args.seed)
+    mode = f"포아송 {args.qps} req/s" if args.qps else f"캡처 간격 x{args.speed}"
+    print(f"🚀 {len(entries)}건 재생: {args.url} ({mode}, 동시 요청 최대 {args.concurrency}개)")
+
+    replayer = Replayer(args.url, args.concurrency, args.timeout)
+    start = time.perf_counter()
+    results = replayer.run(entries, offsets)
+    summarize(results, time.perf_counter() - start)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            for result in results:
+                f.write(json.dumps(result, ensure_ascii=False) + "\n")
+        print(f"💾 재생 결과 저장: {args.output}")
+    if args.diff_capture:
+        print_diff(diff_results(entries, results, args.examples))
+
+def command_diff(args):
+    """두 재생 결과(또는 캡처) 비교"""
+    baseline = load_entries(args.baseline)
+    candidate = load_entries(args.candidate)
+    if len(baseline) != len(candidate):
+        print(f"⚠️ 요청 수가 다름: {len(baseline)}건 vs {len(candidate)}건 (앞부분만 비교)")
+    print_diff(diff_results(baseline, candidate, args.examples))
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="SKAX-RA-AI-SEARCH 요청 재생/결과 비교")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    replay_parser = subparsers.add_parser("replay", help="캡처한 요청을 서버에 재생")
+    replay_parser.add_argument("capture", help="캡처 JSONL 파일")
+    replay_parser.add_argument("--url", default="http://127.0.0.1:8080", help="대상 서버 주소")
+    replay_parser.add_argument("--qps", type=float, default=None, help="목표 초당 요청 수 (포아송 도착, 미지정 시 캡처 간격 사용)")
+    replay_parser.add_argument("--speed", type=float, default=1.0, help="캡처 간격 재생 배속")
+    replay_parser.add_argument("--concurrency", type=int, default=64, help="동시 요청 수 상한")
+    replay_parser.add_argument("--timeout", type=float, default=30.0, help="요청 시간 초과(초)")
+    replay_parser.add_argument("--max-requests", type=int, default=None, help="재생할 최대 요청 수")
+    replay_parser.add_argument("--endpoints", nargs="+", default=list(ENDPOINTS), help="재생할 엔드포인트")
+    replay_parser.add_argument("--seed", type=int, default=0, help="도착 간격 난수 시드")
+    replay_parser.add_argument("--output", help="재생 결과 JSONL 저장 경로 (diff 명령으로 빌드 간 비교)")
+    replay_parser.add_argument("--diff-capture", action="store_true", help="캡처 당시 결과 ID와 비교")
+    replay_parser.add_argument("--examples", type=int, default=5, help="출력할 차이 예시 수")
+    replay_parser.set_defaults(func=command_replay)
+
+    diff_parser = subparsers.add_parser("diff", help="두 재생 결과 비교")
+    diff_parser.add_argument("baseline", help="기준 빌드 재생 결과 (또는 캡처) JSONL")
+    diff_parser.add_argument("candidate", help="비교할 빌드 재생 결과 JSONL")
+    diff_parser.add_argument("--examples", type=int, default=5, help="출력할 차이 예시 수")
+    diff_parser.set_defaults(func=command_diff)
+
+    args = parser.parse_args()
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
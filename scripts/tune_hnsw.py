@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+SKAX-RA-AI-SEARCH HNSW 파라미터 튜닝 스크립트
+저장된 임베딩으로 M/ef 조합별 recall@k(정확 검색 대비)와 p99 지연시간을 측정해 설정 추천
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import shutil
+import tempfile
+import time
+from typing import Dict, List
+
+import chromadb
+import numpy as np
+
+from config.settings import DB_PATH, MODEL_NAME, HNSW_CONFIG
+from src.core.index_config import hnsw_metadata, set_search_ef
+from src.core.reindex import collection_name as index_collection_name, load_index_state
+from src.core.store_client import create_client
+
+def load_embeddings(client, name: str) -> np.ndarray:
+    """사용 중인 세트의 컬렉션에 저장된 임베딩 로드"""
+    version = load_index_state(client).active_version
+    data = client.get_collection(index_collection_name(name, version)).get(include=['embeddings'])
+    return np.asarray(data['embeddings'], dtype=np.float32)
+
+def normalize(vectors: np.ndarray) -> np.ndarray:
+    """L2 정규화"""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+def make_query_vectors(args, corpus: np.ndarray) -> np.ndarray:
+    """측정용 쿼리 벡터 (생성 쿼리 임베딩 또는 저장된 벡터에 잡음 추가)"""
+    rng = np.random.default_rng(args.seed)
+    if args.query_source == "generated":
+        from sentence_transformers import SentenceTransformer
+        from benchmark import make_queries
+        model = SentenceTransformer(args.model_name)
+        return normalize(np.asarray(model.encode(make_queries(args.queries, args.seed)), dtype=np.float32))
+
+    picks = corpus[rng.integers(0, len(corpus), size=args.queries)]
+    noise = rng.normal(scale=args.noise, size=picks.shape).astype(np.float32)
+    return normalize(picks + noise)
+
+def exact_top_k(corpus: np.ndarray, queries: np.ndarray, k: int) -> List[set]:
+    """정확(전수) 코사인 검색 top-k"""
+    similarities = queries @ normalize(corpus).T
+    top = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+    return [set(row.tolist()) for row in top]
+
+def measure(collection, queries: np.ndarray, truth: List[set], k: int) -> Dict[str, float]:
+    """recall@k와 지연시간 측정 (쿼리 단건 호출)"""
+    latencies = []
+    hits = 0
+    for query, expected in zip(queries, truth):
+        start = time.perf_counter()
+        result = collection.query(query_embeddings=[query.tolist()], n_results=k, include=[])
+        latencies.append(time.perf_counter() - start)
+        hits += len({int(i) for i in result['ids'][0]} & expected)
+    latencies = np.asarray(latencies) * 1000
+    return {
+        "recall": hits / (len(truth) * k),
+        "p50_ms": float(np.percentile(latencies, 50)),
+        "p99_ms": float(np.percentile(latencies, 99))
+    }
+
+def tune_collection(args, client, name: str) -> Dict:
+    """단일 컬렉션 튜닝"""
+    corpus = load_embeddings(client, name)
+    if len(corpus) == 0:
+        print(f"⚠️  {name}: 데이터가 없습니다.")
+        return None
+    k = min(args.k, len(corpus))
+    queries = make_query_vectors(args, corpus)
+    truth = exact_top_k(corpus, queries, k)
+
+    print(f"\n📊 {name} (문서 {len(corpus)}개, 쿼리 {len(queries)}개, recall@{k})")
+    print(f"  {'M':>4} {'ef':>5} {'recall':>8} {'p50(ms)':>9} {'p99(ms)':>9} {'build(s)':>9}")
+
+    work_dir = tempfile.mkdtemp(prefix="skax_tune_")
+    results = []
+    try:
+        tune_client = chromadb.PersistentClient(path=work_dir)
+        for m in args.m_values:
+            params = {"space": "cosine", "M": m, "construction_ef": args.construction_ef, "search_ef": args.ef_values[0]}
+            collection_name = f"tune_{name}_m{m}"
+            start = time.perf_counter()
+            collection = tune_client.create_collection(collection_name, metadata=hnsw_metadata(params))
+            for offset in range(0, len(corpus), 1000):
+                chunk = corpus[offset:offset + 1000]
+                collection.add(
+                    ids=[str(i) for i in range(offset, offset + len(chunk))],
+                    embeddings=chunk.tolist()
+                )
+            build_seconds = time.perf_counter() - start
+
+            for ef in args.ef_values:
+                set_search_ef(collection, ef)
+                collection = tune_client.get_collection(collection_name)
+                stats = measure(collection, queries, truth, k)
+                stats.update({"M": m, "search_ef": ef, "build_s": build_seconds})
+                results.append(stats)
+                print(f"  {m:>4} {ef:>5} {stats['recall']:>8.3f} {stats['p50_ms']:>9.2f} {stats['p99_ms']:>9.2f} {build_seconds:>9.2f}")
+            tune_client.delete_collection(collection_name)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    # 목표 recall을 만족하는 조합 중 p99가 가장 낮은 설정 (동률이면 작은 M)
+    eligible = [r for r in results if r["recall"] >= args.target_recall]
+    if eligible:
+        best = min(eligible, key=lambda r: (round(r["p99_ms"], 2), r["M"], r["search_ef"]))
+    else:
+        best = max(results, key=lambda r: r["recall"])
+        print(f"  ⚠️  목표 recall {args.target_recall}을 만족하는 조합이 없어 recall이 가장 높은 설정을 추천합니다.")
+    print(f"  ✅ 추천: M={best['M']}, search_ef={best['search_ef']} "
+          f"(recall {best['recall']:.3f}, p99 {best['p99_ms']:.2f}ms)")
+    return {"space": "cosine", "M": best["M"], "construction_ef": args.construction_ef, "search_ef": best["search_ef"]}
+
+def migrate(args):
+    """현재 설정(HNSW_CONFIG)으로 기존 컬렉션 마이그레이션"""
+    from src.core.search_engine import SearchEngine
+    import src.core.search_engine as search_engine_module
+
+    # 시작 시 자동 마이그레이션 여부와 관계없이 명시적으로 실행
+    search_engine_module.HNSW_AUTO_MIGRATE = False
+    engine = SearchEngine(db_path=args.db_path)
+    migrated = engine.migrate_collections()
+    print(f"✅ 마이그레이션 완료: {', '.join(migrated) if migrated else '변경 없음'}")
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="SKAX-RA-AI-SEARCH HNSW 파라미터 튜닝")
+    parser.add_argument("--db-path", default=DB_PATH, help="측정할 DB 경로")
+    parser.add_argument("--collections", nargs="+", default=list(HNSW_CONFIG.keys()), help="튜닝할 컬렉션")
+    parser.add_argument("--k", type=int, default=10, help="recall@k의 k")
+    parser.add_argument("--queries", type=int, default=200, help="측정 쿼리 수")
+    parser.add_argument("--query-source", choices=["generated", "stored"], default="generated",
+                        help="generated: 샘플 쿼리 임베딩, stored: 저장된 벡터 + 잡음")
+    parser.add_argument("--noise", type=float, default=0.05, help="stored 쿼리에 더할 잡음 크기")
+    parser.add_argument("--m-values", type=int, nargs="+", default=[8, 16, 32], help="측정할 M 값")
+    parser.add_argument("--ef-values", type=int, nargs="+", default=[10, 32, 64, 128, 256], help="측정할 search_ef 값")
+    parser.add_argument("--construction-ef", type=int, default=100, help="인덱스 생성 시 탐색 폭")
+    parser.add_argument("--target-recall", type=float, default=0.95, help="목표 recall@k")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--migrate", action="store_true", help="측정 대신 현재 설정으로 기존 컬렉션 마이그레이션")
+    args = parser.parse_args()
+
+    if args.migrate:
+        migrate(args)
+        return
+
+    # 측정 대상 컬렉션은 설정된 저장소(CHROMA_MODE)에서 읽고, 후보 인덱스는 임시 로컬 DB에 생성
+    client = create_client(args.db_path)
+    # 쿼리는 저장된 임베딩과 같은 모델(사용 중인 세트의 모델)로 임베딩
+    args.model_name = load_index_state(client).model_name or MODEL_NAME
+    recommended = {}
+    for name in args.collections:
+        params = tune_collection(args, client, name)
+        if params:
+            recommended[name] = params
+
+    if recommended:
+        print("\n🔧 config/settings.py 추천 설정:")
+        print("HNSW_CONFIG = {")
+        lines = [f'    "{name}": {params}'.replace("'", '"') for name, params in recommended.items()]
+        print(",\n".join(lines))
+        print("}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+"""
+검색 응답 캐시
+인덱스 세대(generation) 기반으로 무효화되는 LRU 응답 캐시
+"""
+
+import copy
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+class MemoryCacheBackend:
+    """프로세스 내 LRU 캐시 저장소"""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[int, Any]]" = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Tuple[int, Any]]:
+        """저장된 (세대, 값) 조회"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0], copy.deepcopy(entry[1])
+
+    def set(self, key: str, generation: int, value: Any) -> None:
+        """값 저장 (용량 초과 시 가장 오래된 항목 제거)"""
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (generation, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """항목 삭제"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def get_generation(self) -> int:
+        """현재 인덱스 세대"""
+        return self._generation
+
+    def bump_generation(self) -> int:
+        """인덱스 세대 증가"""
+        with self._lock:
+            self._generation += 1
+            return self._generation
+
+    def size(self) -> int:
+        """저장된 항목 수"""
+        return len(self._entries)
+
+class SqliteCacheBackend:
+    """같은 호스트의 워커들이 공유하는 SQLite 캐시 저장소"""
+
+    name = "sqlite"
+
+    def __init__(self, path: str, max_entries: int):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=5, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, generation INTEGER NOT NULL, value TEXT NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries(accessed)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+        self._conn.execute("INSERT OR IGNORE INTO meta (name, value) VALUES ('generation', 0)")
+
+    def get(self, key: str) -> Optional[Tuple[int, Any]]:
+        """저장된 (세대, 값) 조회"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT generation, value FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+        return row[0], json.loads(row[1])
+
+    def set(self, key: str, generation: int, value: Any) -> None:
+        """값 저장 (용량 초과 시 가장 오래 사용되지 않은 항목 제거)"""
+        payload = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, generation, value, accessed) VALUES (?, ?, ?, ?)",
+                (key, generation, payload, time.time())
+            )
+            overflow = self.size() - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    "DELETE FROM entries WHERE key IN "
+                    "(SELECT key FROM entries ORDER BY accessed ASC LIMIT ?)",
+                    (overflow,)
+                )
+
+    def delete(self, key: str) -> None:
+        """항목 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def get_generation(self) -> int:
+        """현재 인덱스 세대 (다른 워커의 쓰기도 반영)"""
+        with self._lock:
+            return self._conn.execute("SELECT value FROM meta WHERE name = 'generation'").fetchone()[0]
+
+    def bump_generation(self) -> int:
+        """인덱스 세대 증가"""
+        with self._lock:
+            self._conn.execute("UPDATE meta SET value = value + 1 WHERE name = 'generation'")
+            return self._conn.execute("SELECT value FROM meta WHERE name = 'generation'").fetchone()[0]
+
+    def size(self) -> int:
+        """저장된 항목 수"""
+        return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+class ResponseCache:
+    """인덱스 세대 기반 검색 응답 캐시"""
+
+    def __init__(self, max_entries: int = 1024, path: str = None):
+        """캐시 초기화 (path 지정 시 공유 디스크 캐시 사용)"""
+        self.enabled = max_entries > 0
+        if path:
+            self.backend = SqliteCacheBackend(path, max(max_entries, 1))
+        else:
+            self.backend = MemoryCacheBackend(max(max_entries, 1))
+
+        self._hits = 0
+        self._misses = 0
+        self._stale = 0
+        self._stats_lock = threading.Lock()
+
+        logger.info(f"응답 캐시 초기화: {self.backend.name} (최대 {max_entries}개)")
+
+    @staticmethod
+    def make_key(query: str, search_type: str, filter_mode: str, limit: int) -> str:
+        """정규화된 입력으로 캐시 키 생성"""
+        normalized_query = " ".join(query.split())
+        return json.dumps([normalized_query, search_type, filter_mode, limit], ensure_ascii=False)
+
+    @property
+    def generation(self) -> int:
+        """현재 인덱스 세대"""
+        return self.backend.get_generation()
+
+    def bump_generation(self) -> int:
+        """인덱스 세대 증가 (이전 세대의 항목은 모두 무효화)"""
+        generation = self.backend.bump_generation()
+        logger.debug(f"인덱스 세대 증가: {generation}")
+        return generation
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 조회 (현재 세대가 아닌 항목은 미스로 처리)"""
+        if not self.enabled:
+            return None
+
+        entry = self.backend.get(key)
+        if entry is not None and entry[0] == self.generation:
+            self._record(hit=True)
+            return entry[1]
+
+        if entry is not None:
+            self.backend.delete(key)
+            with self._stats_lock:
+                self._stale += 1
+        self._record(hit=False)
+        return None
+
+    def set(self, key: str, value: Any, generation: int) -> None:
+        """캐시 저장 (계산 시작 시점의 세대로 기록)"""
+        if not self.enabled or value is None:
+            return
+        self.backend.set(key, generation, value)
+
+    def _record(self, hit: bool) -> None:
+        """적중/미스 통계 기록"""
+        with self._stats_lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        with self._stats_lock:
+            hits, misses, stale = self._hits, self._misses, self._stale
+        total = hits + misses
+        return {
+            "enabled": self.enabled,
+            "backend": self.backend.name,
+            "entries": self.backend.size(),
+            "max_entries": self.backend.max_entries,
+            "generation": self.generation,
+            "hits": hits,
+            "misses": misses,
+            "stale": stale,
+            "hit_rate": hits / total if total else 0.0
+        }
+
+class EmbeddingCache:
+    """모델/정규화된 쿼리별 임베딩 LRU 캐시 (인덱스 세대와 무관, 재색인 중에는 세트별 모델의 임베딩이 함께 저장됨)"""
+
+    def __init__(self, max_entries: int = 2048):
+        """임베딩 캐시 초기화 (0이면 비활성화)"""
+        self.enabled = max_entries > 0
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def make_key(query: str, model_name: str = "") -> Tuple[str, str]:
+        return model_name, " ".join(query.split())
+
+    def get(self, query: str, model_name: str = "") -> Optional[List[float]]:
+        """임베딩 조회 (호출한 쪽에서 수정하지 않아야 함)"""
+        if not self.enabled:
+            return None
+        key = self.make_key(query, model_name)
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return embedding
+
+    def set(self, query: str, embedding: List[float], model_name: str = "") -> None:
+        """임베딩 저장 (용량 초과 시 가장 오래된 항목 제거)"""
+        if not self.enabled:
+            return
+        key = self.make_key(query, model_name)
+        with self._lock:
+            self._entries[key] = embedding
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """임베딩 캐시 통계"""
+        with self._lock:
+            hits, misses, entries = self._hits, self._misses, len(self._entries)
+        total = hits + misses
+        return {
+            "enabled": self.enabled,
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / total if total else 0.0
+        }
@@ -0,0 +1,265 @@
+"""
+2단계 검색용 축소 벡터 인덱스
+PCA 투영(또는 앞부분 차원) + 선택적 int8 양자화 벡터로 넓게 후보를 찾고, 재점수는 원본 임베딩으로 수행
+"""
+
+import glob
+import logging
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .index_config import exact_distances
+
+logger = logging.getLogger(__name__)
+
+# PCA 투영을 학습할 최대 벡터 수 (표본)
+FIT_SAMPLE_SIZE = 20000
+
+class CompactIndex:
+    """축소 벡터 전수 검색 + 원본 벡터 재점수 인덱스
+
+    1단계 점수는 원래 공간의 내적 근사: (q - m)P · (y - m)P + m · y (l2 공간은 -|y|^2 / 2 추가).
+    문서별 m · y 항은 정확한 값을 따로 저장한다.
+    재점수용 원본 벡터는 store_path가 있으면 디스크 memmap에 두어 상주 메모리는 축소 벡터만 사용한다.
+    """
+
+    def __init__(self, dims: int, method: str = "pca", quantize: bool = True, space: str = "cosine",
+                 store_path: str = None, block_size: int = 65536):
+        """축소 벡터 인덱스 초기화"""
+        if method not in ("pca", "truncate"):
+            raise ValueError(f"지원하지 않는 축소 방식: {method}")
+        self.dims = dims
+        self.method = method
+        self.quantize = quantize
+        self.space = space
+        self.block_size = block_size
+        self.store_path = store_path
+        self._store_generation = 0
+        self._lock = threading.RLock()
+        self._mean: Optional[np.ndarray] = None
+        self._components: Optional[np.ndarray] = None
+        self._fitted_size = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        """항목 비우기 (투영은 유지)"""
+        self._ids: List[Optional[str]] = []
+        self._owners: List[Optional[str]] = []
+        self._slots: Dict[str, int] = {}
+        self._by_owner: Dict[str, List[str]] = {}
+        self._free: List[int] = []
+        dtype = np.int8 if self.quantize else np.float32
+        self._codes = np.zeros((0, self.dims), dtype=dtype)
+        self._scales = np.zeros(0, dtype=np.float32)
+        self._bias = np.zeros(0, dtype=np.float32)
+        self._alive = np.zeros(0, dtype=bool)
+        self._vectors = np.zeros((0, 0), dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    @property
+    def fitted(self) -> bool:
+        return self._mean is not None
+
+    def needs_refit(self) -> bool:
+        """투영 학습 이후 문서 수가 크게 늘었는지 (4배 이상)"""
+        return self.method == "pca" and self.fitted and len(self._slots) > max(self._fitted_size, 1) * 4
+
+    def build(self, ids: List[str], vectors: np.ndarray, owners: List[str]) -> None:
+        """투영 학습 후 전체 항목 적재"""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        with self._lock:
+            self._fit(self._prepare(vectors))
+            self._reset()
+            self._clear_store()
+            self._insert(ids, vectors, owners)
+            logger.info(f"축소 벡터 인덱스 생성 완료: {len(self._slots)}개 ({self.method}, {self.dims}차원, "
+                        f"{'int8' if self.quantize else 'float32'}, 문서당 {self.bytes_per_document():.0f}B)")
+
+    def upsert(self, ids: List[str], vectors: np.ndarray, owners: List[str]) -> None:
+        """항목 추가/갱신 (투영이 없으면 무시 - 다음 build에서 반영)"""
+        if not ids:
+            return
+        with self._lock:
+            if not self.fitted:
+                return
+            self._insert(ids, np.asarray(vectors, dtype=np.float32), owners)
+
+    def remove_owners(self, owners: Iterable[str]) -> None:
+        """개발자별 항목 삭제"""
+        with self._lock:
+            for owner in owners:
+                for entry_id in self._by_owner.pop(owner, []):
+                    slot = self._slots.pop(entry_id, None)
+                    if slot is None:
+                        continue
+                    self._ids[slot] = None
+                    self._owners[slot] = None
+                    self._alive[slot] = False
+                    self._free.append(slot)
+
+    def close(self) -> None:
+        """항목을 비우고 memmap 파일 삭제"""
+        with self._lock:
+            self._reset()
+            self._clear_store()
+
+    def search(self, queries: np.ndarray, candidates: int, n_results: int) -> List[List[Tuple[str, float]]]:
+        """쿼리별 1단계 근사 점수 상위 candidates개를 원본 벡터로 재점수한 (항목 ID, 거리) 상위 n_results개"""
+        with self._lock:
+            if not self.fitted or not self._slots:
+                return [[] for _ in range(len(queries))]
+            codes, scales, bias, alive, vectors = self._codes, self._scales, self._bias, self._alive, self._vectors
+            size = len(self._ids)
+
+        queries = np.asarray(queries, dtype=np.float32)
+        candidate_slots = self._candidates(self._project(self._prepare(queries)), codes, scales, bias, alive, size,
+                                           min(candidates, size))
+
+        results = []
+        with self._lock:
+            for query, slots in zip(queries, candidate_slots):
+                distances = exact_distances(query, np.asarray(vectors[slots]), self.space)
+                order = np.argsort(distances, kind="stable")[:n_results]
+                results.append([
+                    (self._ids[slots[i]], float(distances[i])) for i in order if self._ids[slots[i]] is not None
+                ])
+        return results
+
+    def _candidates(self, projected: np.ndarray, codes, scales, bias, alive, size: int, k: int) -> List[np.ndarray]:
+        """축소 벡터 블록 단위 전수 검색으로 쿼리별 상위 k개 슬롯"""
+        best_scores = np.full((len(projected), 0), -np.inf, dtype=np.float32)
+        best_slots = np.zeros((len(projected), 0), dtype=np.int64)
+        for start in range(0, size, self.block_size):
+            end = min(start + self.block_size, size)
+            scores = (projected @ codes[start:end].astype(np.float32).T) * scales[start:end] + bias[start:end]
+            scores[:, ~alive[start:end]] = -np.inf
+            scores = np.concatenate([best_scores, scores], axis=1)
+            slots = np.concatenate([best_slots, np.broadcast_to(np.arange(start, end), (len(projected), end - start))], axis=1)
+            if scores.shape[1] > k:
+                top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+                scores = np.take_along_axis(scores, top, axis=1)
+                slots = np.take_along_axis(slots, top, axis=1)
+            best_scores, best_slots = scores, slots
+        return [row_slots[row_scores > -np.inf] for row_slots, row_scores in zip(best_slots, best_scores)]
+
+    def bytes_per_document(self) -> float:
+        """문서당 축소 벡터 메모리 (코드 + 스케일 + 보정항)"""
+        return self._codes.itemsize * self.dims + self._scales.itemsize + self._bias.itemsize
+
+    def stats(self) -> Dict[str, object]:
+        """인덱스 통계"""
+        return {
+            "documents": len(self._slots),
+            "method": self.method,
+            "dims": self.dims,
+            "quantized": self.quantize,
+            "bytes_per_document": self.bytes_per_document(),
+            "rescore_store": "memmap" if self.store_path else "memory",
+            "fitted_size": self._fitted_size
+        }
+
+    def _prepare(self, vectors) -> np.ndarray:
+        """코사인 공간은 정규화된 벡터 기준으로 점수 계산"""
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, np.shape(vectors)[-1])
+        if self.space == "cosine":
+            vectors = vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+        return vectors
+
+    def _fit(self, vectors: np.ndarray) -> None:
+        """투영 학습 (PCA: 공분산 상위 고유벡터, truncate: 앞부분 차원)"""
+        dimension = vectors.shape[1]
+        self.dims = min(self.dims, dimension)
+        if self.method == "truncate" or len(vectors) < 2:
+            self._mean = np.zeros(dimension, dtype=np.float32)
+            self._components = np.eye(dimension, self.dims, dtype=np.float32)
+        else:
+            sample = vectors
+            if len(sample) > FIT_SAMPLE_SIZE:
+                sample = sample[np.random.default_rng(0).choice(len(sample), FIT_SAMPLE_SIZE, replace=False)]
+            self._mean = sample.mean(axis=0)
+            centered = sample - self._mean
+            eigenvalues, eigenvectors = np.linalg.eigh(centered.T @ centered)
+            self._components = np.ascontiguousarray(eigenvectors[:, ::-1][:, :self.dims], dtype=np.float32)
+        self._fitted_size = len(vectors)
+
+    def _project(self, vectors: np.ndarray) -> np.ndarray:
+        return (vectors - self._mean) @ self._components
+
+    def _insert(self, ids: List[str], vectors: np.ndarray, owners: List[str]) -> None:
+        """잠금을 잡은 상태에서 항목 저장 (기존 항목은 같은 슬롯 재사용)"""
+        raw = vectors
+        vectors = self._prepare(raw)
+        projected = self._project(vectors)
+        bias = vectors @ self._mean
+        if self.space == "l2":
+            bias -= 0.5 * np.einsum("ij,ij->i", vectors, vectors)
+        if self.quantize:
+            scales = np.maximum(np.abs(projected).max(axis=1), 1e-12) / 127.0
+            codes = np.clip(np.rint(projected / scales[:, None]), -127, 127).astype(np.int8)
+        else:
+            scales = np.ones(len(projected), dtype=np.float32)
+            codes = projected.astype(np.float32)
+
+        for row, (entry_id, owner) in enumerate(zip(ids, owners)):
+            slot = self._slots.get(entry_id)
+            if slot is None:
+                if self._free:
+                    slot = self._free.pop()
+                else:
+                    slot = len(self._ids)
+                    self._grow(slot + 1, raw.shape[1])
+                    self._ids.append(None)
+                    self._owners.append(None)
+                self._slots[entry_id] = slot
+                self._by_owner.setdefault(owner, []).append(entry_id)
+            self._ids[slot] = entry_id
+            self._owners[slot] = owner
+            self._codes[slot] = codes[row]
+            self._scales[slot] = scales[row]
+            self._bias[slot] = bias[row]
+            self._vectors[slot] = raw[row]
+            self._alive[slot] = True
+
+    def _grow(self, size: int, dimension: int) -> None:
+        """슬롯 배열 확장 (2배씩)"""
+        if size <= len(self._alive):
+            return
+        capacity = max(size, len(self._alive) * 2, 16)
+        self._vectors = self._grow_store(capacity, dimension)
+        codes = np.zeros((capacity, self.dims), dtype=self._codes.dtype)
+        codes[:len(self._codes)] = self._codes
+        scales = np.zeros(capacity, dtype=np.float32)
+        scales[:len(self._scales)] = self._scales
+        bias = np.zeros(capacity, dtype=np.float32)
+        bias[:len(self._bias)] = self._bias
+        alive = np.zeros(capacity, dtype=bool)
+        alive[:len(self._alive)] = self._alive
+        self._codes, self._scales, self._bias, self._alive = codes, scales, bias, alive
+
+    def _grow_store(self, capacity: int, dimension: int) -> np.ndarray:
+        """재점수용 원본 벡터 저장소 확장 (memmap은 새 파일에 복사 후 이전 파일 삭제)"""
+        previous = self._vectors
+        if not self.store_path:
+            vectors = np.zeros((capacity, dimension), dtype=np.float32)
+        else:
+            os.makedirs(os.path.dirname(self.store_path), exist_ok=True)
+            self._store_generation += 1
+            path = f"{self.store_path}.{self._store_generation}.f32"
+            vectors = np.memmap(path, dtype=np.float32, mode="w+", shape=(capacity, dimension))
+        if len(previous):
+            vectors[:len(previous)] = previous
+        if self.store_path and isinstance(previous, np.memmap):
+            # 진행 중인 검색은 이전 매핑을 계속 사용할 수 있음 (파일 삭제 후에도 매핑 유지)
+            os.remove(previous.filename)
+        return vectors
+
+    def _clear_store(self) -> None:
+        """이전 실행에서 남은 memmap 파일 정리"""
+        if self.store_path:
+            for path in glob.glob(f"{glob.escape(self.store_path)}.*.f32"):
+                os.remove(path)
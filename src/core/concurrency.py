@@ -0,0 +1,144 @@
+"""
+동시 실행 제어 유틸리티
+동일한 검색의 동시 실행을 하나로 병합 (single-flight), 개발자별 쓰기 직렬화, 인덱스 세트 교체용 읽기/쓰기 락
+"""
+
+import copy
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterable, Tuple
+
+logger = logging.getLogger(__name__)
+
+class _Call:
+    """진행 중인 계산"""
+
+    __slots__ = ("event", "result", "error", "waiters")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+class SingleFlight:
+    """같은 키로 동시에 들어온 호출을 한 번의 계산으로 처리"""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self._executed = 0
+        self._coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Tuple[Any, bool]:
+        """fn 실행 결과와 다른 호출의 결과를 공유했는지 여부 반환"""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self._coalesced += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self._executed += 1
+                leader = True
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            # 대기자마다 독립된 결과 사본 전달
+            return copy.deepcopy(call.result), True
+
+        try:
+            call.result = fn(*args, **kwargs)
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            if call.waiters:
+                logger.debug(f"동시 요청 병합: {call.waiters}개 요청이 결과 공유")
+            call.event.set()
+
+        return call.result, False
+
+    def stats(self) -> Dict[str, int]:
+        """병합 통계"""
+        with self._lock:
+            return {
+                "executed": self._executed,
+                "coalesced": self._coalesced,
+                "in_flight": len(self._calls)
+            }
+
+class KeyedLocks:
+    """키(개발자 ID)별 쓰기 직렬화 - 고정 개수의 락에 키를 분산"""
+
+    def __init__(self, stripes: int = 64):
+        self._locks = [threading.RLock() for _ in range(stripes)]
+
+    @contextmanager
+    def hold(self, keys: Iterable[Hashable]):
+        """여러 키의 락을 정해진 순서로 획득 (교착 방지)"""
+        indexes = sorted({hash(key) % len(self._locks) for key in keys})
+        for index in indexes:
+            self._locks[index].acquire()
+        try:
+            yield
+        finally:
+            for index in reversed(indexes):
+                self._locks[index].release()
+
+class ReadWriteLock:
+    """읽기 공유/쓰기 배타 락 - 쓰기 대기 중에는 새 읽기를 막아 쓰기가 밀리지 않음
+
+    스레드가 아닌 획득 횟수로 관리한다. 재진입은 지원하지 않으므로 읽기를 잡은 채 다시 읽기를 잡으면 안 되며,
+    쓰기 대기 중에는 새 읽기가 모두 멈추므로 읽기 구간은 짧게 유지해야 한다.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+
+    def acquire_read(self) -> None:
+        with self._condition:
+            while self._writer or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+
+    def release_read(self) -> None:
+        with self._condition:
+            self._readers -= 1
+            if not self._readers:
+                self._condition.notify_all()
+
+    @contextmanager
+    def read(self):
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self):
+        with self._condition:
+            self._waiting_writers += 1
+            try:
+                while self._writer or self._readers:
+                    self._condition.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writer = False
+                self._condition.notify_all()
@@ -4,12 +4,243 @@
 """
 
 import re
+import json
 import logging
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional
+import numpy as np
 from config.filter_config import FILTER_PATTERNS, USER_FILTER_CONFIGS, FILTER_PRIORITY
+from .profile_fields import (
+    PROFILE_FIELDS_VERSION, ROLE_SKILL_KEYWORDS, company_flag, skill_flag
+)
 
 logger = logging.getLogger(__name__)
 
+# 기술 스택 필터 값 → 매칭되는 primary_role
+FRONTEND_SKILL_KEYWORDS = frozenset(['frontend', '프론트', '프론트엔드', 'react', 'vue', 'angular', 'javascript', 'typescript'])
+BACKEND_SKILL_KEYWORDS = frozenset(['backend', '백엔드', 'java', 'python', 'spring', 'django', 'node.js'])
+
+# 쿼리별 컴파일된 필터 재사용 개수
+COMPILED_FILTER_CACHE_SIZE = 256
+
+def skill_filter_roles(filter_value: Any) -> frozenset:
+    """기술 스택 필터 값과 매칭되는 primary_role 집합"""
+    if not isinstance(filter_value, str):
+        return frozenset()
+    skill_lower = filter_value.lower()
+    if skill_lower in FRONTEND_SKILL_KEYWORDS:
+        return frozenset(['frontend', 'fullstack'])
+    if skill_lower in BACKEND_SKILL_KEYWORDS:
+        return frozenset(['backend', 'fullstack'])
+    # 풀스택 키워드와 그 외 기술은 풀스택 개발자만 매칭
+    return frozenset(['fullstack'])
+
+def company_matches(result: Dict, company_lower: str) -> bool:
+    """회사 경험 필터링 확인 (company_lower: 소문자로 정규화된 회사명)"""
+    # experience 데이터에서 확인
+    experience_data = result.get('experience')
+    if isinstance(experience_data, list):
+        # experience가 리스트인 경우 (경력 정보 배열)
+        for exp in experience_data:
+            if isinstance(exp, dict) and 'company' in exp and company_lower in exp['company'].lower():
+                return True
+    elif isinstance(experience_data, str):
+        # experience가 문자열인 경우
+        return company_lower in experience_data.lower()
+    
+    # metadata에서 company 확인
+    company_name = result.get('metadata', {}).get('company')
+    if isinstance(company_name, str):
+        return company_lower in company_name.lower()
+    
+    # 둘 다 없는 경우 기본적으로 True 반환
+    return True
+
+class CompiledFilterSet:
+    """쿼리 단위로 한 번 컴파일되어 후보 배치 전체를 한 번에 판정하는 필터"""
+    
+    def __init__(self, filters: Dict[str, Any], strict_mode: bool):
+        """필터 컴파일 - 필터별 매칭 함수와 우선순위를 미리 계산"""
+        self.filters = filters
+        self.strict_mode = strict_mode
+        # (필터 매칭 함수, 우선순위) - 행 단위 판정이 필요한 필터는 마지막에 평가
+        predicates = [
+            (self._compile(filter_type, filter_value), FILTER_PRIORITY.get(filter_type, 1))
+            for filter_type, filter_value in filters.items()
+        ]
+        self._predicates = sorted(predicates, key=lambda p: getattr(p[0], 'rowwise', False))
+    
+    def _compile(self, filter_type: str, filter_value: Any):
+        """단일 필터를 배치 매칭 함수로 변환"""
+        if filter_type == "experience_years":
+            bounds = filter_value if isinstance(filter_value, dict) else {}
+            
+            def match(batch):
+                years = batch.numeric('years_experience', 0)
+                matched = np.ones(len(years), dtype=bool)
+                if 'min' in bounds:
+                    matched &= years >= bounds['min']
+                if 'max' in bounds:
+                    matched &= years <= bounds['max']
+                return matched
+            return match
+        
+        if filter_type == "salary":
+            # 수집 시 파싱된 희망 연봉 범위와 겹치는지 확인 (연봉 정보가 없으면 통과)
+            bounds = filter_value if isinstance(filter_value, dict) else {}
+            
+            def match(batch):
+                matched = np.ones(len(batch), dtype=bool)
+                if 'min' in bounds:
+                    upper = batch.numeric('salary_max', np.nan)
+                    matched &= np.isnan(upper) | (upper >= bounds['min'])
+                if 'max' in bounds:
+                    lower = batch.numeric('salary_min', np.nan)
+                    matched &= np.isnan(lower) | (lower <= bounds['max'])
+                return matched
+            return match
+        
+        if filter_type == "companies":
+            if not isinstance(filter_value, str):
+                return batch_all
+            company_lower = filter_value.lower()
+            field = company_flag(filter_value)
+            
+            def match(batch, rows=None):
+                # 비정규화 필드가 있는 프로필은 회사 플래그로 판정
+                matched = batch.column(field)[1].copy()
+                # 필드가 없는 이전 데이터만 경력 정보로 행 단위 판정 (엄격 모드에서는 아직 탈락하지 않은 행만)
+                legacy_rows = np.flatnonzero(~batch.denormalized())
+                if rows is not None:
+                    legacy_rows = np.intersect1d(legacy_rows, rows)
+                results = batch.results
+                matched[legacy_rows] = [company_matches(results[i], company_lower) for i in legacy_rows]
+                return matched
+            match.rowwise = True
+            return match
+        
+        if filter_type == "skills":
+            if not isinstance(filter_value, str):
+                return batch_none
+            role_keywords = ROLE_SKILL_KEYWORDS.get(filter_value.lower())
+            if role_keywords:
+                # 역할 키워드는 primary_role로 판정
+                def match(batch):
+                    return np.isin(batch.lowered('primary_role'), role_keywords)
+                return match
+            
+            field = skill_flag(filter_value)
+            legacy_roles = list(skill_filter_roles(filter_value))
+            
+            def match(batch):
+                # 보유 기술 플래그로 판정, 필드가 없는 이전 데이터는 primary_role로 근사
+                flagged = batch.column(field)[1]
+                return np.where(batch.denormalized(), flagged, np.isin(batch.lowered('primary_role'), legacy_roles))
+            return match
+        
+        # 기본 필터 (seniority, availability, location) - 메타데이터에 없는 항목은 통과
+        def match(batch):
+            values, present = batch.column(filter_type)
+            return ~present | (values == filter_value)
+        return match
+    
+    def evaluate(self, results: List[Dict]) -> tuple:
+        """한 번의 패스로 (매칭 마스크, 불일치 수, 우선순위 점수) 계산
+        
+        우선순위 점수에는 실제로 일치한 필터만 더한다 (이전 행 단위 구현은 회사 필터를 항상 일치로 계산).
+        """
+        batch = _CandidateBatch(results)
+        mismatch_count = np.zeros(len(batch), dtype=np.int32)
+        priority_score = np.zeros(len(batch), dtype=np.int32)
+        
+        for match, priority in self._predicates:
+            if self.strict_mode and getattr(match, 'rowwise', False):
+                # 이미 탈락한 행은 제외되므로 판정 생략
+                matched = match(batch, np.flatnonzero(mismatch_count == 0))
+            else:
+                matched = match(batch)
+            mismatch_count += ~matched
+            priority_score += priority * matched
+        
+        mask = mismatch_count == 0 if self.strict_mode else np.ones(len(batch), dtype=bool)
+        return mask, mismatch_count, priority_score
+    
+    def apply(self, results: List[Dict], limit: int = None) -> List[Dict]:
+        """필터 적용 후 우선순위 순으로 정렬된 새 결과 목록 반환 (입력은 변경하지 않음)
+        
+        limit을 지정하면 상위 limit개만 결과 dict로 만든다.
+        """
+        if not results:
+            return []
+        
+        mask, mismatch_count, priority_score = self.evaluate(results)
+        
+        # 우선순위 점수 내림차순, 동점은 입력 순서를 유지하는 단일 정렬 키
+        candidates = np.flatnonzero(mask)
+        sort_key = -priority_score[candidates].astype(np.int64) * len(results) + candidates
+        if limit is not None and limit < len(candidates):
+            top = np.argpartition(sort_key, limit)[:limit]
+            order = candidates[top[np.argsort(sort_key[top])]]
+        else:
+            order = candidates[np.argsort(sort_key)]
+        
+        # 엄격 모드가 아닌 경우 불일치 비율만큼만 차감 (최대 50%, 최저 0.1)
+        ranked = []
+        penalty_unit = 0.5 / max(len(self.filters), 1)
+        for i in order:
+            result = results[i].copy()
+            original = result.get('total_score', result.get('score', 1.0))
+            if mismatch_count[i] > 0 and not self.strict_mode:
+                score = max(original * (1 - mismatch_count[i] * penalty_unit), 0.1)
+            else:
+                score = min(original, 1.0)
+            result['total_score'] = float(score)
+            if 'score' in result:
+                result['score'] = float(score)
+            ranked.append(result)
+        return ranked
+
+def batch_all(batch) -> np.ndarray:
+    """항상 매칭되는 필터"""
+    return np.ones(len(batch), dtype=bool)
+
+def batch_none(batch) -> np.ndarray:
+    """항상 매칭되지 않는 필터"""
+    return np.zeros(len(batch), dtype=bool)
+
+class _CandidateBatch:
+    """후보 메타데이터를 필드별 배열로 한 번씩만 추출"""
+    
+    def __init__(self, results: List[Dict]):
+        self.results = results
+        self.metadatas = [r.get('metadata', {}) for r in results]
+        self._columns = {}
+    
+    def __len__(self) -> int:
+        return len(self.results)
+    
+    def column(self, key: str) -> tuple:
+        """(값 배열, 존재 여부 배열)"""
+        if key not in self._columns:
+            missing = object()
+            values = np.empty(len(self.metadatas), dtype=object)
+            values[:] = [m.get(key, missing) for m in self.metadatas]
+            self._columns[key] = (values, values != missing)
+        return self._columns[key]
+    
+    def numeric(self, key: str, default: float) -> np.ndarray:
+        """숫자 필드 배열"""
+        return np.fromiter((m.get(key, default) for m in self.metadatas), dtype=np.float64, count=len(self.metadatas))
+    
+    def denormalized(self) -> np.ndarray:
+        """비정규화 필터 필드가 있는 프로필 메타데이터 여부"""
+        values, _ = self.column('filter_fields_version')
+        return values == PROFILE_FIELDS_VERSION
+    
+    def lowered(self, key: str) -> np.ndarray:
+        """소문자로 정규화된 문자열 필드 배열"""
+        return np.array([str(m.get(key, '')).lower() for m in self.metadatas], dtype=object)
+
 class DynamicFilterEngine:
     """동적 필터 엔진"""
     
@@ -20,6 +251,8 @@ class DynamicFilterEngine:
         self.enabled_filters = self.config["enabled_filters"]
         self.strict_mode = self.config["strict_mode"]
         self.min_score_threshold = self.config["min_score_threshold"]
+        # 컴파일된 필터 집합 (필터 내용 + 엄격 모드 기준)
+        self._compiled_filters: "OrderedDict[str, CompiledFilterSet]" = OrderedDict()
         
         logger.info(f"동적 필터 엔진 초기화: {user_config} 모드")
     
@@ -82,159 +315,29 @@ class DynamicFilterEngine:
         
         return None
     
-    def apply_filters(self, results: List[Dict], filters: Dict[str, Any]) -> List[Dict]:
-        """결과에 필터 적용"""
+    def compile_filters(self, filters: Dict[str, Any]) -> CompiledFilterSet:
+        """필터 집합을 컴파일 (같은 필터 집합은 재사용)"""
+        key = json.dumps([filters, self.strict_mode], sort_keys=True, ensure_ascii=False, default=str)
+        compiled = self._compiled_filters.get(key)
+        if compiled is None:
+            compiled = CompiledFilterSet(filters, self.strict_mode)
+            self._compiled_filters[key] = compiled
+            if len(self._compiled_filters) > COMPILED_FILTER_CACHE_SIZE:
+                self._compiled_filters.popitem(last=False)
+        else:
+            self._compiled_filters.move_to_end(key)
+        return compiled
+    
+    def apply_filters(self, results: List[Dict], filters: Dict[str, Any], limit: int = None) -> List[Dict]:
+        """결과에 필터 적용 (우선순위 정렬된 새 목록 반환, 입력 결과는 변경하지 않음)"""
         if not filters:
-            return results
-        
-        filtered_results = []
+            return results[:limit] if limit is not None else results
         
-        for result in results:
-            if self._matches_filters(result, filters):
-                filtered_results.append(result)
-        
-        # 우선순위에 따른 정렬
-        filtered_results = self._sort_by_priority(filtered_results, filters)
+        filtered_results = self.compile_filters(filters).apply(results, limit)
         
         logger.info(f"필터 적용: {len(results)} -> {len(filtered_results)}개")
         return filtered_results
     
-    def _matches_filters(self, result: Dict, filters: Dict[str, Any]) -> bool:
-        """결과가 필터 조건과 일치하는지 확인"""
-        metadata = result.get('metadata', {})
-        
-        # 필터 조건에 맞지 않는 항목 수 계산
-        mismatch_count = 0
-        total_filters = len(filters)
-        
-        for filter_type, filter_value in filters.items():
-            # 회사 경험 필터링은 별도 처리
-            if filter_type == "companies":
-                if not self._check_company_filter(result, filter_value):
-                    if self.strict_mode:
-                        return False
-                    mismatch_count += 1
-            else:
-                if not self._check_single_filter(metadata, filter_type, filter_value):
-                    if self.strict_mode:
-                        return False
-                    mismatch_count += 1
-        
-        # 엄격 모드가 아닌 경우 점수 조정 (한 번만 적용)
-        if mismatch_count > 0 and not self.strict_mode:
-            # 기존 점수 유지하되, 필터 불일치 비율만큼만 차감
-            original_score = result.get('total_score', result.get('score', 1.0))
-            penalty = (mismatch_count / total_filters) * 0.5  # 최대 50% 차감
-            adjusted_score = original_score * (1 - penalty)
-            # 점수가 0.1 미만이 되지 않도록 보장
-            result['total_score'] = max(adjusted_score, 0.1)
-            if 'score' in result:
-                result['score'] = max(adjusted_score, 0.1)
-        else:
-            # 모든 필터가 일치하는 경우 점수 보정
-            original_score = result.get('total_score', result.get('score', 1.0))
-            result['total_score'] = min(original_score, 1.0)  # 최대 100%
-            if 'score' in result:
-                result['score'] = min(original_score, 1.0)
-        
-        return True
-    
-    def _check_single_filter(self, metadata: Dict, filter_type: str, filter_value: Any) -> bool:
-        """단일 필터 조건 확인"""
-        if filter_type == "experience_years":
-            years = metadata.get('years_experience', 0)
-            if isinstance(filter_value, dict):
-                if 'min' in filter_value and years < filter_value['min']:
-                    return False
-                if 'max' in filter_value and years > filter_value['max']:
-                    return False
-            return True
-        
-        elif filter_type == "salary":
-            # 연봉 필터링 (실제 구현 시 salary_range 파싱 필요)
-            return True
-        
-        elif filter_type == "companies":
-            # 회사 경험 필터링은 _check_company_filter에서 처리
-            return True
-        
-        elif filter_type == "skills":
-            # 기술 스택 필터링 - primary_role과 비교
-            primary_role = metadata.get('primary_role', '').lower()
-            if isinstance(filter_value, str):
-                skill_lower = filter_value.lower()
-                # 프론트엔드 관련 기술
-                if skill_lower in ['frontend', '프론트', '프론트엔드', 'react', 'vue', 'angular', 'javascript', 'typescript']:
-                    return primary_role in ['frontend', 'fullstack']
-                # 백엔드 관련 기술
-                elif skill_lower in ['backend', '백엔드', 'java', 'python', 'spring', 'django', 'node.js']:
-                    return primary_role in ['backend', 'fullstack']
-                # 풀스택 관련 기술
-                elif skill_lower in ['fullstack', '풀스택']:
-                    return primary_role == 'fullstack'
-                # 풀스택은 모든 기술에 매칭
-                elif primary_role == 'fullstack':
-                    return True
-            return False
-        
-        else:
-            # 기본 필터 (seniority, availability, location)
-            if filter_type in metadata:
-                return metadata[filter_type] == filter_value
-        
-        return True
-    
-    def _check_company_filter(self, result: Dict, filter_value: Any) -> bool:
-        """회사 경험 필터링 확인"""
-        # experience 데이터에서 확인
-        if 'experience' in result:
-            experience_data = result['experience']
-            if isinstance(experience_data, list):
-                # experience가 리스트인 경우 (경력 정보 배열)
-                for exp in experience_data:
-                    if isinstance(exp, dict) and 'company' in exp:
-                        company_name = exp['company'].lower()
-                        if isinstance(filter_value, str):
-                            company_lower = filter_value.lower()
-                            if company_lower in company_name:
-                                return True
-            elif isinstance(experience_data, str):
-                # experience가 문자열인 경우
-                experience_text = experience_data.lower()
-                if isinstance(filter_value, str):
-                    company_lower = filter_value.lower()
-                    return company_lower in experience_text
-        
-        # metadata에서 company 확인
-        metadata = result.get('metadata', {})
-        if 'company' in metadata:
-            company_name = metadata['company']
-            if isinstance(company_name, str):
-                company_name = company_name.lower()
-                if isinstance(filter_value, str):
-                    company_lower = filter_value.lower()
-                    return company_lower in company_name
-        
-        # 둘 다 없는 경우 기본적으로 True 반환
-        return True
-    
-    def _sort_by_priority(self, results: List[Dict], filters: Dict[str, Any]) -> List[Dict]:
-        """우선순위에 따른 정렬"""
-        def priority_score(result):
-            score = 0
-            metadata = result.get('metadata', {})
-            
-            for filter_type, filter_value in filters.items():
-                priority = FILTER_PRIORITY.get(filter_type, 1)
-                if self._check_single_filter(metadata, filter_type, filter_value):
-                    score += priority
-            
-            return score
-        
-        # 우선순위 점수로 정렬
-        results.sort(key=priority_score, reverse=True)
-        return results
-    
     def get_filter_info(self, filters: Dict[str, Any]) -> str:
         """필터 정보를 사용자 친화적 텍스트로 변환"""
         if not filters:
@@ -0,0 +1,93 @@
+"""
+멀티 프로세스 임베딩 풀
+대량 재색인 시 텍스트 묶음을 워커 프로세스(프로세스별 모델 보유)에 분산하고 입력 순서대로 결과 반환
+"""
+
+import logging
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 워커 프로세스 전역 모델
+_worker_model = None
+
+def _init_worker(model_name: str, threads: int) -> None:
+    """워커 프로세스 초기화 - 모델 로드와 연산 스레드 수 제한"""
+    global _worker_model
+    try:
+        import torch
+        torch.set_num_threads(threads)
+    except ImportError:
+        pass
+
+    from sentence_transformers import SentenceTransformer
+    _worker_model = SentenceTransformer(model_name)
+
+def _encode_texts(texts: List[str], batch_size: int) -> np.ndarray:
+    """워커에서 텍스트 묶음 임베딩"""
+    return np.asarray(_worker_model.encode(texts, batch_size=batch_size), dtype=np.float32)
+
+class EmbeddingPool:
+    """워커 프로세스 풀 기반 임베딩 - 진행 중인 묶음 수를 제한해 메모리 사용량 유지"""
+
+    def __init__(self, model_name: str, processes: int, max_in_flight: int = None, encode_batch_size: int = 32):
+        """임베딩 풀 초기화 (워커는 첫 사용 시 시작)"""
+        self.model_name = model_name
+        self.processes = max(1, processes)
+        self.max_in_flight = max_in_flight or self.processes * 2
+        self.encode_batch_size = encode_batch_size
+        # 프로세스 간 코어 과다 경쟁 방지
+        self.threads_per_process = max(1, (os.cpu_count() or 1) // self.processes)
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """워커 풀 생성 (spawn - 부모의 모델/스레드 상태를 물려받지 않음)"""
+        if self._executor is None:
+            logger.info(f"임베딩 워커 시작: {self.processes}개 프로세스 (프로세스당 {self.threads_per_process}스레드)")
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.processes,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.model_name, self.threads_per_process)
+            )
+        return self._executor
+
+    def imap(self, batches: Iterable[Tuple[Any, List[str]]]) -> Iterator[Tuple[Any, np.ndarray]]:
+        """(payload, 텍스트 목록) 묶음을 임베딩해 입력 순서대로 (payload, 임베딩) 반환"""
+        executor = self._get_executor()
+        in_flight = deque()
+
+        for payload, texts in batches:
+            # 진행 중인 묶음이 상한이면 가장 오래된 묶음 결과를 먼저 내보냄
+            while len(in_flight) >= self.max_in_flight:
+                done_payload, future = in_flight.popleft()
+                yield done_payload, future.result()
+            in_flight.append((payload, executor.submit(_encode_texts, texts, self.encode_batch_size)))
+
+        while in_flight:
+            done_payload, future = in_flight.popleft()
+            yield done_payload, future.result()
+
+    def encode(self, texts: List[str], chunk_size: int = 256) -> np.ndarray:
+        """텍스트 목록 임베딩 (청크로 나눠 병렬 처리)"""
+        chunks = ((None, texts[i:i + chunk_size]) for i in range(0, len(texts), chunk_size))
+        embeddings = [result for _, result in self.imap(chunks)]
+        return np.vstack(embeddings) if embeddings else np.zeros((0, 0), dtype=np.float32)
+
+    def close(self) -> None:
+        """워커 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
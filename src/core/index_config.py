@@ -0,0 +1,83 @@
+"""
+벡터 인덱스(HNSW) 설정
+컬렉션별 거리 공간과 HNSW 파라미터 적용, 거리 → 유사도 변환
+"""
+
+import logging
+from typing import Any, Dict
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Chroma 기본값 (설정 없이 생성된 컬렉션)
+CHROMA_DEFAULT_HNSW = {"space": "l2", "M": 16, "construction_ef": 100, "search_ef": 10}
+
+# 인덱스를 다시 만들어야 바뀌는 파라미터
+REBUILD_PARAMS = ("space", "M", "construction_ef")
+
+def hnsw_metadata(params: Dict[str, Any]) -> Dict[str, Any]:
+    """HNSW 설정을 컬렉션 메타데이터로 변환"""
+    return {
+        "hnsw:space": params["space"],
+        "hnsw:M": params["M"],
+        "hnsw:construction_ef": params["construction_ef"],
+        "hnsw:search_ef": params["search_ef"]
+    }
+
+def collection_hnsw_params(collection) -> Dict[str, Any]:
+    """기존 컬렉션의 HNSW 설정 조회"""
+    params = dict(CHROMA_DEFAULT_HNSW)
+
+    # Chroma 1.x는 configuration, 이전 버전은 메타데이터에 저장
+    configuration = getattr(collection, "configuration", None)
+    hnsw = configuration.get("hnsw") if isinstance(configuration, dict) else None
+    if hnsw:
+        params.update({
+            "space": hnsw.get("space", params["space"]),
+            "M": hnsw.get("max_neighbors", params["M"]),
+            "construction_ef": hnsw.get("ef_construction", params["construction_ef"]),
+            "search_ef": hnsw.get("ef_search", params["search_ef"])
+        })
+        return params
+
+    metadata = collection.metadata or {}
+    params.update({
+        "space": metadata.get("hnsw:space", params["space"]),
+        "M": metadata.get("hnsw:M", params["M"]),
+        "construction_ef": metadata.get("hnsw:construction_ef", params["construction_ef"]),
+        "search_ef": metadata.get("hnsw:search_ef", params["search_ef"])
+    })
+    return params
+
+def needs_rebuild(current: Dict[str, Any], desired: Dict[str, Any]) -> bool:
+    """설정 변경에 인덱스 재생성이 필요한지 확인"""
+    return any(current[key] != desired[key] for key in REBUILD_PARAMS)
+
+def set_search_ef(collection, search_ef: int) -> None:
+    """검색 시 탐색 폭(ef) 변경 - 인덱스 재생성 없이 적용"""
+    try:
+        collection.modify(configuration={"hnsw": {"ef_search": search_ef}})
+    except TypeError:
+        # configuration을 지원하지 않는 이전 버전
+        metadata = dict(collection.metadata or {})
+        metadata["hnsw:search_ef"] = search_ef
+        collection.modify(metadata=metadata)
+
+def distance_to_similarity(distance: float, space: str) -> float:
+    """거리 값을 유사도 점수로 변환 (정규화된 임베딩 기준 코사인 유사도)"""
+    if space == "l2":
+        # Chroma의 l2는 제곱 거리: |a - b|^2 = 2 - 2cos
+        return 1 - distance / 2
+    # cosine: 1 - cos, ip: 1 - a·b
+    return 1 - distance
+
+def exact_distances(query: np.ndarray, vectors: np.ndarray, space: str) -> np.ndarray:
+    """질의 벡터와 저장된 벡터들의 정확한 거리 (Chroma 거리 공간과 같은 정의)"""
+    if space == "l2":
+        diff = vectors - query
+        return np.einsum("ij,ij->i", diff, diff)
+    if space == "ip":
+        return 1 - vectors @ query
+    norms = np.linalg.norm(vectors, axis=1) * np.linalg.norm(query)
+    return 1 - (vectors @ query) / np.maximum(norms, 1e-12)
@@ -0,0 +1,164 @@
+"""
+백그라운드 수집 작업
+개발자 데이터 수집을 요청 처리와 분리해 제한된 워커 풀에서 배치 단위로 실행
+"""
+
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 작업 상태
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+# 작업당 보관할 오류 메시지 수
+MAX_JOB_ERRORS = 20
+
+class JobQueueFull(Exception):
+    """대기 중인 작업이 상한에 도달"""
+
+class IngestJob:
+    """수집 작업 진행 상태"""
+
+    def __init__(self, description: str, total: int, replace: bool = True):
+        self.job_id = uuid.uuid4().hex
+        self.description = description
+        # True: 같은 ID의 개발자 교체, False: 이미 있는 개발자는 건너뜀
+        self.replace = replace
+        self.status = JOB_QUEUED
+        self.total = total
+        self.processed = 0
+        self.failed = 0
+        self.skipped = 0
+        self.batches = 0
+        self.errors: List[str] = []
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    @property
+    def done(self) -> bool:
+        """작업 종료 여부"""
+        return self.status in (JOB_COMPLETED, JOB_FAILED)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """작업 상태 응답"""
+        elapsed = None
+        throughput = None
+        if self.started_at is not None:
+            elapsed = (self.finished_at or time.time()) - self.started_at
+            if elapsed > 0:
+                throughput = round(self.processed / elapsed, 2)
+
+        return {
+            "job_id": self.job_id,
+            "description": self.description,
+            "status": self.status,
+            "total": self.total,
+            "processed": self.processed,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "replace": self.replace,
+            "progress": round((self.processed + self.failed) / self.total, 4) if self.total else 1.0,
+            "batches": self.batches,
+            "elapsed_seconds": round(elapsed, 3) if elapsed is not None else None,
+            "throughput_per_second": throughput,
+            "errors": list(self.errors),
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at
+        }
+
+class IngestJobManager:
+    """제한된 워커 풀 기반 수집 작업 큐"""
+
+    def __init__(self, search_engine, max_workers: int, max_pending: int, batch_size: int, history_size: int):
+        """작업 관리자 초기화"""
+        self.search_engine = search_engine
+        self.max_pending = max_pending
+        self.batch_size = max(1, batch_size)
+        self.history_size = history_size
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ingest")
+        self._jobs: "OrderedDict[str, IngestJob]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, developers: List[Dict], description: str = "ingest", replace: bool = True) -> IngestJob:
+        """수집 작업 등록 (대기 작업이 상한이면 JobQueueFull)
+        
+        replace가 True면 같은 ID의 기존 개발자를 교체하고, False면 기존 개발자는 건너뛰고 새 개발자만 추가한다.
+        """
+        with self._lock:
+            pending = sum(1 for job in self._jobs.values() if job.status == JOB_QUEUED)
+            if pending >= self.max_pending:
+                raise JobQueueFull("대기 중인 수집 작업이 많습니다. 잠시 후 다시 시도해주세요.")
+
+            job = IngestJob(description, len(developers), replace)
+            self._jobs[job.job_id] = job
+            self._trim_history()
+
+        self._executor.submit(self._run, job, developers)
+        logger.info(f"수집 작업 등록: {job.job_id} ({description}, {len(developers)}명)")
+        return job
+
+    def get(self, job_id: str) -> Optional[IngestJob]:
+        """작업 조회"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list_jobs(self) -> List[Dict[str, Any]]:
+        """최근 작업 목록 (최신순)"""
+        with self._lock:
+            jobs = list(self._jobs.values())
+        return [job.to_dict() for job in reversed(jobs)]
+
+    def shutdown(self, wait: bool = True) -> None:
+        """워커 풀 종료"""
+        self._executor.shutdown(wait=wait)
+
+    def _trim_history(self) -> None:
+        """종료된 오래된 작업 기록 정리"""
+        excess = len(self._jobs) - self.history_size
+        if excess <= 0:
+            return
+        for job_id in [job_id for job_id, job in self._jobs.items() if job.done][:excess]:
+            del self._jobs[job_id]
+
+    def _run(self, job: IngestJob, developers: List[Dict]) -> None:
+        """작업 실행 - 배치 단위로 갱신하고 실패한 배치는 기록 후 계속 진행"""
+        job.status = JOB_RUNNING
+        job.started_at = time.time()
+
+        try:
+            for start in range(0, len(developers), self.batch_size):
+                batch = developers[start:start + self.batch_size]
+                try:
+                    if job.replace:
+                        self.search_engine.update_developers(batch)
+                    else:
+                        job.skipped += len(batch) - self.search_engine.add_developers(batch)
+                    job.processed += len(batch)
+                except Exception as e:
+                    job.failed += len(batch)
+                    if len(job.errors) < MAX_JOB_ERRORS:
+                        job.errors.append(f"{start}-{start + len(batch) - 1}: {e}")
+                    logger.error(f"수집 배치 실패 ({job.job_id}, {start}~): {e}")
+                job.batches += 1
+        except Exception as e:
+            job.errors.append(str(e))
+            logger.error(f"수집 작업 실패 ({job.job_id}): {e}")
+
+        job.finished_at = time.time()
+        job.status = JOB_FAILED if job.failed or job.processed < job.total else JOB_COMPLETED
+        logger.info(
+            f"수집 작업 종료: {job.job_id} ({job.status}, 성공 {job.processed}명(건너뜀 {job.skipped}명), 실패 {job.failed}명, "
+            f"{job.finished_at - job.started_at:.2f}초)"
+        )
@@ -0,0 +1,220 @@
+"""
+선택도 기반 쿼리 플래너
+프로필 필드별 값 히스토그램으로 필터 일치 개발자 수를 추정해 필터 우선/벡터 우선 실행과 조회 수 결정
+"""
+
+import math
+import threading
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from .profile_fields import (
+    COMPANY_FLAG_PREFIX, SKILL_FLAG_PREFIX, ROLE_SKILL_KEYWORDS,
+    build_where_clause, company_flag, skill_flag
+)
+
+PLAN_FILTER_FIRST = "filter_first"
+PLAN_VECTOR_FIRST = "vector_first"
+
+# 필터 우선 실행 시 예상 일치 수 상한 대비 실제로 가져올 수 있는 최대 배수 (추정 오차 허용, 넘으면 벡터 우선으로 전환)
+FILTER_FIRST_OVERFLOW_FACTOR = 4
+
+# 값 분포를 집계하는 범주형 필드
+CATEGORICAL_FIELDS = ("seniority", "primary_role", "location", "availability")
+
+class FieldHistograms:
+    """프로필 메타데이터 필드별 값 히스토그램 (쓰기마다 증분 갱신)"""
+
+    def __init__(self):
+        """히스토그램 초기화"""
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._counts = Counter()
+        self._years = Counter()
+        self._salaries = Counter()
+        # 개발자별 반영된 (범주형/플래그 키, 연차, 연봉 범위) - 갱신/삭제 시 차감
+        self._contributions: Dict[str, Tuple[Tuple, Any, Any]] = {}
+
+    @property
+    def total(self) -> int:
+        return len(self._contributions)
+
+    def build(self, profile_metadatas: List[Dict]) -> None:
+        """전체 히스토그램 생성"""
+        with self._lock:
+            self._reset()
+            for metadata in profile_metadatas:
+                self._add(metadata["developer_id"], metadata)
+
+    def on_write(self, upserted: Dict[str, Dict], removed: List[str]) -> None:
+        """쓰기 리스너 - 바뀐 개발자의 기여분만 갱신"""
+        with self._lock:
+            for developer_id in removed:
+                self._remove(developer_id)
+            for developer_id, metadata in upserted.items():
+                self._remove(developer_id)
+                self._add(developer_id, metadata)
+
+    def estimate(self, filters: Dict[str, Any]) -> Tuple[float, Dict[str, float]]:
+        """필터별 일치 비율과 전체 예상 일치 개발자 수 (필터 간 독립 가정)"""
+        with self._lock:
+            total = self.total
+            if not total:
+                return 0.0, {filter_type: 0.0 for filter_type in filters}
+            fractions = {
+                filter_type: min(self._matching(filter_type, value) / total, 1.0)
+                for filter_type, value in filters.items()
+            }
+        return total * math.prod(fractions.values()), fractions
+
+    def stats(self) -> Dict[str, int]:
+        """히스토그램 통계"""
+        with self._lock:
+            return {"developers": self.total, "keys": len(self._counts), "years": len(self._years), "salaries": len(self._salaries)}
+
+    def _matching(self, filter_type: str, value: Any) -> float:
+        """필터 하나에 일치하는 개발자 수 (추정할 수 없는 필터는 전체)"""
+        if filter_type == "experience_years":
+            if not isinstance(value, dict):
+                return self.total
+            low, high = value.get("min", -math.inf), value.get("max", math.inf)
+            return sum(count for years, count in self._years.items() if low <= years <= high)
+        if filter_type == "min_years_experience":
+            return sum(count for years, count in self._years.items() if years >= value)
+        if filter_type == "salary":
+            if not isinstance(value, dict):
+                return self.total
+            low, high = value.get("min", -math.inf), value.get("max", math.inf)
+            # 연봉 정보가 없는 개발자는 필터를 통과
+            unknown = self.total - sum(self._salaries.values())
+            return unknown + sum(
+                count for (salary_min, salary_max), count in self._salaries.items()
+                if salary_max >= low and salary_min <= high
+            )
+        if filter_type == "companies":
+            return self._counts[("flag", company_flag(value))] if isinstance(value, str) else self.total
+        if filter_type == "skills":
+            if not isinstance(value, str):
+                return self.total
+            roles = ROLE_SKILL_KEYWORDS.get(value.lower())
+            if roles:
+                return sum(self._counts[("primary_role", role)] for role in roles)
+            return self._counts[("flag", skill_flag(value))]
+        if filter_type in CATEGORICAL_FIELDS:
+            return self._counts[(filter_type, value)]
+        return self.total
+
+    def _add(self, developer_id: str, metadata: Dict) -> None:
+        keys = tuple(
+            [(field, metadata[field]) for field in CATEGORICAL_FIELDS if field in metadata]
+            + [("flag", key) for key in metadata if key.startswith((COMPANY_FLAG_PREFIX, SKILL_FLAG_PREFIX))]
+        )
+        years = metadata.get("years_experience")
+        salary = (metadata["salary_min"], metadata["salary_max"]) if "salary_min" in metadata else None
+        self._counts.update(keys)
+        if years is not None:
+            self._years[years] += 1
+        if salary is not None:
+            self._salaries[salary] += 1
+        self._contributions[developer_id] = (keys, years, salary)
+
+    def _remove(self, developer_id: str) -> None:
+        contribution = self._contributions.pop(developer_id, None)
+        if contribution is None:
+            return
+        keys, years, salary = contribution
+        for counter, items in ((self._counts, keys), (self._years, [years]), (self._salaries, [salary])):
+            for item in items:
+                if item is None:
+                    continue
+                counter[item] -= 1
+                if counter[item] <= 0:
+                    del counter[item]
+
+class QueryPlan:
+    """쿼리 실행 계획"""
+
+    __slots__ = ("strategy", "fetch", "where", "fill", "estimated_matches", "total", "selectivity",
+                 "filter_selectivity", "reason")
+
+    def __init__(self, strategy: str, fetch: int, where: Optional[Dict] = None, estimated_matches: float = None,
+                 total: int = 0, filter_selectivity: Dict[str, float] = None, reason: str = "", fill: bool = False):
+        self.strategy = strategy
+        # 벡터 우선: 인덱스별 조회 수 기준 / 필터 우선: 일치 후보 내 인덱스별 정확 점수 계산 수 기준
+        self.fetch = fetch
+        # 프로필 컬렉션에 전달할 where 절
+        self.where = where
+        # 필터 우선 결과에 벡터 우선 결과를 더해 부분 일치 후보 보충 (엄격 모드가 아닐 때)
+        self.fill = fill
+        self.estimated_matches = estimated_matches
+        self.total = total
+        self.selectivity = estimated_matches / total if total and estimated_matches is not None else None
+        self.filter_selectivity = filter_selectivity or {}
+        self.reason = reason
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "strategy": self.strategy,
+            "fetch": self.fetch,
+            "where": self.where,
+            "fill": self.fill,
+            "estimated_matches": round(self.estimated_matches, 1) if self.estimated_matches is not None else None,
+            "total": self.total,
+            "selectivity": round(self.selectivity, 4) if self.selectivity is not None else None,
+            "filter_selectivity": {key: round(value, 4) for key, value in self.filter_selectivity.items()},
+            "reason": self.reason
+        }
+
+class QueryPlanner:
+    """필터 선택도로 쿼리별 실행 계획 결정"""
+
+    def __init__(self, histograms: FieldHistograms, filter_first_max: int = 500,
+                 overfetch_margin: float = 1.5, max_fetch: int = 500):
+        """쿼리 플래너 초기화"""
+        self.histograms = histograms
+        self.filter_first_max = filter_first_max
+        self.overfetch_margin = overfetch_margin
+        self.max_fetch = max_fetch
+
+    @property
+    def filter_first_limit(self) -> int:
+        """필터 우선 실행에서 가져올 최대 프로필 수"""
+        return self.filter_first_max * FILTER_FIRST_OVERFLOW_FACTOR
+
+    def plan(self, filters: Dict[str, Any], search_type: str, limit: int, strict_mode: bool) -> QueryPlan:
+        """쿼리 실행 계획
+
+        - 필터 우선: 예상 일치 개발자가 filter_first_max 이하이면 조건에 맞는 프로필만 가져와 정확한 점수 계산
+          (엄격 모드가 아니면 부분 일치 후보를 위해 기본 벡터 검색 결과를 함께 사용)
+        - 벡터 우선: 예상 선택도로 필터 후 limit개가 남을 만큼 조회 (종합 검색은 병합 깊이 유지를 위해 limit * 3 이상)
+          조회 수는 max_fetch로 제한하므로 넓은 필터라도 요청마다 코퍼스 대부분을 가져오지 않는다
+          (엄격 모드에서 선택도가 낮으면 limit개보다 적게 반환될 수 있음)
+        """
+        floor = limit * 3 if search_type == "comprehensive" else limit
+        if not filters:
+            return QueryPlan(PLAN_VECTOR_FIRST, floor, total=self.histograms.total, reason="필터 없음")
+
+        estimated, fractions = self.histograms.estimate(filters)
+        total = self.histograms.total
+        where = build_where_clause(filters)
+        selectivity = estimated / total if total else 0.0
+        needed = math.ceil(limit / max(selectivity, 1e-9) * self.overfetch_margin)
+
+        def plan(strategy, fetch, reason, plan_where=None):
+            fill = strategy == PLAN_FILTER_FIRST and not strict_mode
+            return QueryPlan(strategy, fetch, plan_where, estimated, total, fractions, reason, fill)
+
+        if where is not None and estimated <= self.filter_first_max:
+            return plan(PLAN_FILTER_FIRST, floor, f"예상 일치 {estimated:.0f}명 <= {self.filter_first_max}명", where)
+        if strict_mode and where is not None:
+            if search_type == "profile_only":
+                # 단일 인덱스는 where 절을 인덱스 검색에 바로 전달
+                return plan(PLAN_VECTOR_FIRST, limit, "인덱스 조건 검색", where)
+
+        fetch = min(max(needed, floor), max(self.max_fetch, floor))
+        reason = f"선택도 {selectivity:.3f} 기준 {fetch}개 조회"
+        if needed > fetch:
+            reason += f" (필요 조회 수 {needed}개, 상한 적용)"
+        return plan(PLAN_VECTOR_FIRST, fetch, reason)
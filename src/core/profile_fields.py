@@ -0,0 +1,116 @@
+"""
+프로필 비정규화 필터 필드
+수집 시점에 회사/기술/연봉 정보를 프로필 메타데이터에 펼쳐 단일 컬렉션에서 필터링
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from config.filter_config import FILTER_PATTERNS
+
+# 비정규화 필드 버전 (필드 구성이 바뀌면 증가시켜 재생성)
+PROFILE_FIELDS_VERSION = 1
+
+COMPANY_FLAG_PREFIX = "company__"
+SKILL_FLAG_PREFIX = "skill__"
+
+# primary_role로 판정하는 역할 키워드 (실제 기술명이 아님)
+ROLE_SKILL_KEYWORDS = {
+    "frontend": ["frontend", "fullstack"],
+    "프론트": ["frontend", "fullstack"],
+    "프론트엔드": ["frontend", "fullstack"],
+    "backend": ["backend", "fullstack"],
+    "백엔드": ["backend", "fullstack"],
+    "fullstack": ["fullstack"],
+    "풀스택": ["fullstack"]
+}
+
+def normalize_term(value: str) -> str:
+    """회사명/기술명 정규화 (소문자, 공백 제거)"""
+    return re.sub(r"\s+", "", str(value)).lower()
+
+def company_flag(company: str) -> str:
+    """회사 경험 플래그 필드명"""
+    return COMPANY_FLAG_PREFIX + normalize_term(company)
+
+def skill_flag(skill: str) -> str:
+    """보유 기술 플래그 필드명"""
+    return SKILL_FLAG_PREFIX + normalize_term(skill)
+
+# 필터로 추출될 수 있는 회사명 - 포함 관계인 회사에도 플래그를 설정해 기존 부분 일치 동작 유지
+_FILTER_COMPANY_TERMS = sorted({normalize_term(value) for _, value in FILTER_PATTERNS["companies"]["patterns"]})
+
+def parse_salary_range(salary_range: Any) -> Tuple[Optional[int], Optional[int]]:
+    """연봉 범위 문자열 파싱 ("5000-12000" -> (5000, 12000), 단위: 만원)"""
+    numbers = [int(n) for n in re.findall(r"\d+", str(salary_range or ""))]
+    if not numbers:
+        return None, None
+    return min(numbers), max(numbers)
+
+def build_profile_filter_fields(developer: Dict) -> Dict[str, Any]:
+    """프로필 메타데이터에 추가할 비정규화 필터 필드 생성"""
+    fields: Dict[str, Any] = {"filter_fields_version": PROFILE_FIELDS_VERSION}
+
+    salary_min, salary_max = parse_salary_range(developer.get("salary_range"))
+    if salary_min is not None:
+        fields["salary_min"] = salary_min
+        fields["salary_max"] = salary_max
+
+    companies = list(dict.fromkeys(exp["company"] for exp in developer.get("experience", [])))
+    fields["companies"] = ", ".join(companies)
+    for company in companies:
+        normalized = normalize_term(company)
+        fields[company_flag(company)] = True
+        for term in _FILTER_COMPANY_TERMS:
+            if term in normalized:
+                fields[COMPANY_FLAG_PREFIX + term] = True
+
+    skill_names = list(dict.fromkeys(skill["name"] for skill in developer.get("skills", [])))
+    fields["skill_names"] = ", ".join(skill_names)
+    for skill in skill_names:
+        fields[skill_flag(skill)] = True
+
+    return fields
+
+def has_filter_fields(metadata: Dict) -> bool:
+    """비정규화 필터 필드가 있는 프로필 메타데이터인지 확인"""
+    return metadata.get("filter_fields_version") == PROFILE_FIELDS_VERSION
+
+def build_where_clause(filters: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """필터 조건을 프로필 컬렉션용 Chroma where 절로 변환 (변환할 조건이 없으면 None)"""
+    clauses: List[Dict[str, Any]] = []
+
+    for filter_type, value in filters.items():
+        if filter_type in ("experience_years", "salary"):
+            if not isinstance(value, dict):
+                continue
+            if filter_type == "experience_years":
+                if "min" in value:
+                    clauses.append({"years_experience": {"$gte": value["min"]}})
+                if "max" in value:
+                    clauses.append({"years_experience": {"$lte": value["max"]}})
+            else:
+                # 희망 연봉 범위가 조건과 겹치는 개발자
+                if "min" in value:
+                    clauses.append({"salary_max": {"$gte": value["min"]}})
+                if "max" in value:
+                    clauses.append({"salary_min": {"$lte": value["max"]}})
+        elif filter_type == "min_years_experience":
+            clauses.append({"years_experience": {"$gte": value}})
+        elif filter_type == "companies":
+            if isinstance(value, str):
+                clauses.append({company_flag(value): True})
+        elif filter_type == "skills":
+            if not isinstance(value, str):
+                continue
+            roles = ROLE_SKILL_KEYWORDS.get(value.lower())
+            if roles:
+                clauses.append({"primary_role": {"$in": roles}})
+            else:
+                clauses.append({skill_flag(value): True})
+        else:
+            clauses.append({filter_type: value})
+
+    if not clauses:
+        return None
+    return clauses[0] if len(clauses) == 1 else {"$and": clauses}
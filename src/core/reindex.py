@@ -0,0 +1,393 @@
+"""
+온라인 재색인
+새 버전의 프로필/기술/경력 컬렉션 세트를 백그라운드에서 만들고 (진행 중 쓰기는 양쪽 세트에 기록),
+완료되면 검색 대상을 한 번에 교체한 뒤 이전 세트를 삭제
+
+세트 상태(사용 중인 세트, 재색인 중인 세트)는 저장소의 상태 컬렉션에 기록하므로 같은 저장소를 쓰는
+모든 워커 프로세스가 상태를 읽어 스스로 전환하고, 워커별로 보고 있는 세트 버전을 남긴다.
+이전 세트는 살아 있는 모든 워커가 새 세트로 전환한 뒤에 삭제한다.
+"""
+
+import logging
+import re
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 세트를 이루는 컬렉션
+INDEX_NAMES = ("profiles", "skills", "experience")
+# 세트 상태(컬렉션 메타데이터)와 워커별 사용 중인 세트(레코드)를 기록하는 컬렉션
+STATE_COLLECTION = "index_state"
+WORKER_PREFIX = "worker:"
+# 프로필 메타데이터의 기록 시각 (시간순 정렬되는 문자열, 재색인 복사본은 원본 값 유지)
+INDEX_STAMP_FIELD = "index_stamp"
+
+# 재색인 상태
+REINDEX_PENDING = "pending"
+REINDEX_RUNNING = "running"
+REINDEX_SWAPPED = "swapped"
+REINDEX_COMPLETED = "completed"
+REINDEX_STOPPED = "stopped"
+REINDEX_FAILED = "failed"
+
+_VERSIONED_NAME = re.compile(rf"^({'|'.join(INDEX_NAMES)})_v(\d+)$")
+
+def collection_name(name: str, version: int) -> str:
+    """세트 버전의 컬렉션 이름 (버전 0은 기존 이름 그대로)"""
+    return name if version == 0 else f"{name}_v{version}"
+
+def index_versions(client) -> List[int]:
+    """저장소에 컬렉션이 남아 있는 세트 버전 목록"""
+    versions = set()
+    for collection in client.list_collections():
+        name = getattr(collection, "name", collection)
+        if name in INDEX_NAMES:
+            versions.add(0)
+            continue
+        match = _VERSIONED_NAME.match(name)
+        if match:
+            versions.add(int(match.group(2)))
+    return sorted(versions)
+
+def new_index_stamp() -> str:
+    """쓰기 기록 시각 (같은 시각의 쓰기도 구분되도록 임의 접미사 추가)"""
+    return f"{time.time_ns():020d}-{uuid.uuid4().hex[:8]}"
+
+class IndexState:
+    """저장소에 기록된 세트 상태 - 사용 중인 세트와 재색인 중인 세트(없으면 None)"""
+
+    __slots__ = ("active_version", "model_name", "target_version", "target_model_name", "heartbeat_at", "swapped_at")
+
+    def __init__(self, active_version: int = 0, model_name: Optional[str] = None, target_version: Optional[int] = None,
+                 target_model_name: Optional[str] = None, heartbeat_at: float = 0.0, swapped_at: float = 0.0):
+        self.active_version = active_version
+        self.model_name = model_name
+        self.target_version = target_version
+        self.target_model_name = target_model_name
+        # 재색인 작업이 마지막으로 살아 있음을 기록한 시각 (오래되면 중단된 재색인으로 간주)
+        self.heartbeat_at = heartbeat_at
+        self.swapped_at = swapped_at
+
+    def reindex_alive(self, timeout: float) -> bool:
+        """재색인 작업이 진행 중인지 (timeout초 안에 생존 기록)"""
+        return self.target_version is not None and time.time() - self.heartbeat_at < timeout
+
+    @classmethod
+    def from_metadata(cls, metadata: Dict[str, Any]) -> "IndexState":
+        target_version = int(metadata.get("target_version", -1))
+        return cls(
+            int(metadata.get("active_version", 0)), metadata.get("model_name"),
+            target_version if target_version >= 0 else None, metadata.get("target_model_name") or None,
+            float(metadata.get("heartbeat_at", 0.0)), float(metadata.get("swapped_at", 0.0))
+        )
+
+    def to_metadata(self) -> Dict[str, Any]:
+        # 컬렉션 메타데이터에는 None을 저장할 수 없어 재색인이 없으면 -1/빈 문자열
+        return {
+            "active_version": self.active_version,
+            "model_name": self.model_name,
+            "target_version": self.target_version if self.target_version is not None else -1,
+            "target_model_name": self.target_model_name or "",
+            "heartbeat_at": self.heartbeat_at,
+            "swapped_at": self.swapped_at
+        }
+
+def load_index_state(client) -> IndexState:
+    """저장된 세트 상태 - 기록이 없으면 버전 0, 모델 None"""
+    try:
+        metadata = client.get_collection(STATE_COLLECTION).metadata or {}
+    except Exception:
+        return IndexState()
+    return IndexState.from_metadata(metadata)
+
+def save_index_state(client, state: IndexState) -> None:
+    """세트 상태 기록 (재색인 시작/생존 기록/교체/취소 시점, 전체 덮어쓰기)"""
+    metadata = state.to_metadata()
+    try:
+        client.get_collection(STATE_COLLECTION).modify(metadata=metadata)
+    except Exception:
+        client.create_collection(STATE_COLLECTION, metadata=metadata)
+
+def register_worker(client, worker_id: str, active_version: int, target_version: Optional[int]) -> None:
+    """워커가 쓰고 있는 세트 버전 기록 (이전 세트 삭제 전 확인용)"""
+    client.get_or_create_collection(STATE_COLLECTION).upsert(
+        ids=[WORKER_PREFIX + worker_id],
+        embeddings=[[0.0]],
+        metadatas=[{
+            "active_version": active_version,
+            "target_version": target_version if target_version is not None else -1,
+            "seen_at": time.time()
+        }]
+    )
+
+def unregister_worker(client, worker_id: str) -> None:
+    try:
+        client.get_collection(STATE_COLLECTION).delete(ids=[WORKER_PREFIX + worker_id])
+    except Exception:
+        pass
+
+def live_workers(client, timeout: float) -> Dict[str, Dict[str, Any]]:
+    """timeout초 안에 기록을 남긴 워커별 {active_version, target_version(없으면 None), seen_at}"""
+    try:
+        records = client.get_collection(STATE_COLLECTION).get(include=['metadatas'])
+    except Exception:
+        return {}
+    now = time.time()
+    workers = {}
+    for record_id, metadata in zip(records['ids'], records['metadatas']):
+        if not record_id.startswith(WORKER_PREFIX) or now - metadata["seen_at"] >= timeout:
+            continue
+        workers[record_id[len(WORKER_PREFIX):]] = {
+            "active_version": metadata["active_version"],
+            "target_version": metadata["target_version"] if metadata["target_version"] >= 0 else None,
+            "seen_at": metadata["seen_at"]
+        }
+    return workers
+
+class IndexSet:
+    """한 버전의 컬렉션 세트와 그 세트를 임베딩한 모델"""
+
+    __slots__ = ("version", "model_name", "embedding_model", "collections", "spaces")
+
+    def __init__(self, version: int, model_name: str, embedding_model, collections: Dict[str, Any],
+                 spaces: Dict[str, str]):
+        self.version = version
+        self.model_name = model_name
+        self.embedding_model = embedding_model
+        self.collections = collections
+        # 컬렉션별 실제 거리 공간 (점수 계산에 사용)
+        self.spaces = spaces
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "model_name": self.model_name,
+            "collections": {name: collection.name for name, collection in self.collections.items()}
+        }
+
+class IndexStateWatcher:
+    """저장소의 세트 상태를 주기적으로 읽어 엔진의 검색/쓰기 세트를 맞추고 워커 생존 기록
+
+    다른 프로세스가 재색인을 시작하면 쓰기를 새 세트에도 기록하고, 교체하면 새 세트로 전환한다.
+    """
+
+    def __init__(self, engine, interval: float = 1.0, heartbeat: float = 10.0):
+        """상태 확인 주기(interval)와 변화가 없을 때의 생존 기록 주기(heartbeat)"""
+        self.engine = engine
+        self.interval = interval
+        self.heartbeat = heartbeat
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self) -> None:
+        """상태 확인 스레드 시작 (interval <= 0이면 비활성화 - 시작 시점의 상태만 사용하는 단일 워커 전용)"""
+        if self.interval <= 0 or self._thread is not None:
+            return
+        self.engine.report_worker()
+        self._thread = threading.Thread(target=self._run, name="index-state-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """상태 확인 중지 후 워커 기록 삭제 (재색인 작업이 이 워커를 기다리지 않도록)"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+            self.engine.unregister_worker()
+
+    def _run(self) -> None:
+        reported = time.monotonic()
+        while not self._stop.wait(self.interval):
+            try:
+                changed = self.engine.refresh_index_state()
+                if changed or time.monotonic() - reported >= self.heartbeat:
+                    self.engine.report_worker()
+                    reported = time.monotonic()
+            except Exception as e:
+                logger.error(f"세트 상태 확인 오류: {e}")
+
+class OnlineReindexer:
+    """백그라운드 재색인 작업
+
+    모든 워커가 새 세트에도 쓰기 시작하면 현재 세트의 개발자를 배치 단위로 새 세트에 복사하고,
+    배치 사이에는 쉬며 실시간 요청이 처리 중이면(busy) 끝날 때까지 기다린다.
+    교체 직전에 두 세트의 기록 시각을 대조해 복사 중 바뀐 개발자를 다시 복사하고,
+    교체 후에는 모든 워커가 새 세트로 전환하고 gc_delay초가 지나면 이전 세트를 삭제한다.
+    """
+
+    def __init__(self, engine, model_name: str = None, batch_size: int = 64, pause: float = 0.05,
+                 busy: Callable[[], bool] = None, idle_wait: float = 0.05, gc_delay: float = 30.0,
+                 poll: float = 0.5, worker_wait: float = 60.0):
+        """재색인 작업 초기화 (model_name이 없으면 설정된 MODEL_NAME)
+
+        poll: 워커 전환 확인 주기, worker_wait: 워커 전환을 기다리는 최대 시간
+        """
+        self.engine = engine
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.pause = pause
+        self.busy = busy or (lambda: False)
+        self.idle_wait = idle_wait
+        self.gc_delay = gc_delay
+        self.poll = poll
+        self.worker_wait = worker_wait
+        self.state = REINDEX_PENDING
+        self.error: Optional[str] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._target: Optional[Dict[str, Any]] = None
+        self._previous: Optional[Dict[str, Any]] = None
+        self._total = 0
+        self._processed = 0
+        self._reconciled = 0
+        self._started_at: Optional[float] = None
+        self._swapped_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+        self._yielded = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self.state in (REINDEX_PENDING, REINDEX_RUNNING, REINDEX_SWAPPED) and self._thread is not None
+
+    def start(self) -> None:
+        """백그라운드 재색인 시작"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="online-reindex", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """재색인 중단 (교체 전이면 새 세트 삭제, 교체 후면 이전 세트는 다음 시작 시 정리)"""
+        self._stop.set()
+
+    def join(self, timeout: float = None) -> None:
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        self._started_at = time.time()
+        self.state = REINDEX_RUNNING
+        try:
+            target = self.engine.begin_reindex(self.model_name)
+        except Exception as e:
+            self._fail(e)
+            return
+        self._target = target.to_dict()
+
+        try:
+            # 모든 워커가 쓰기를 새 세트에도 기록하기 시작한 뒤 복사 (그 전의 쓰기는 교체 전 대조에서 반영)
+            self._wait_for_workers(lambda worker: worker["target_version"] == target.version)
+            developer_ids = self.engine.developer_ids()
+            self._total = len(developer_ids)
+            logger.info(f"온라인 재색인 시작: {self._total}명 -> 버전 {target.version} ({target.model_name})")
+            for start in range(0, len(developer_ids), self.batch_size):
+                if not self._wait_for_idle():
+                    break
+                self.engine.reindex_developers(developer_ids[start:start + self.batch_size])
+                self._processed += len(developer_ids[start:start + self.batch_size])
+                if self.pause > 0:
+                    self._stop.wait(self.pause)
+
+            if not self._stop.is_set():
+                self._reconciled = self.engine.reconcile_index_sets()
+            if self._stop.is_set():
+                self._abort()
+                self._finish(REINDEX_STOPPED)
+                logger.info(f"온라인 재색인 중단: {self._processed}/{self._total}명 처리, 새 세트 삭제")
+                return
+            previous = self.engine.commit_reindex()
+        except Exception as e:
+            self._abort()
+            self._fail(e)
+            return
+
+        self._previous = previous.to_dict()
+        self._swapped_at = time.time()
+        self.state = REINDEX_SWAPPED
+        logger.info(f"온라인 재색인 전환: 버전 {previous.version} -> {target.version} "
+                    f"({self._swapped_at - self._started_at:.1f}초, 양보 {self._yielded:.1f}초, "
+                    f"교체 전 대조 {self._reconciled}명)")
+
+        # 모든 워커가 새 세트로 전환하고 진행 중이던 요청이 이전 세트를 다 쓰고 난 뒤 삭제
+        if (self._wait_for_workers(lambda worker: worker["active_version"] != previous.version)
+                and not self._stop.wait(self.gc_delay)):
+            try:
+                self.engine.drop_index_set(previous)
+            except Exception as e:
+                logger.warning(f"이전 컬렉션 세트 삭제 실패 (다음 시작 시 정리): {e}")
+        else:
+            logger.info(f"이전 컬렉션 세트 유지 (버전 {previous.version}, 다음 시작 시 정리)")
+        self._finish(REINDEX_COMPLETED)
+
+    def _abort(self) -> None:
+        """재색인 취소 - 모든 워커가 새 세트 쓰기를 멈춘 뒤 삭제"""
+        try:
+            target = self.engine.abort_reindex()
+            if target is not None:
+                self._wait_for_workers(lambda worker: worker["target_version"] != target.version, interruptible=False)
+                self.engine.drop_index_set(target)
+        except Exception as e:
+            logger.warning(f"재색인 세트 삭제 실패 (다음 재색인 시작 시 정리): {e}")
+
+    def _wait_for_workers(self, ready: Callable[[Dict[str, Any]], bool], interruptible: bool = True) -> bool:
+        """살아 있는 모든 워커가 세트 상태를 반영할 때까지 대기 (중단되거나 worker_wait초가 지나면 False)
+
+        기록이 끊긴 워커는 생존 기록 시한이 지나면 대상에서 빠진다.
+        """
+        deadline = time.monotonic() + self.worker_wait
+        while True:
+            if interruptible and self._stop.is_set():
+                return False
+            waiting = [worker_id for worker_id, worker in self.engine.live_workers().items() if not ready(worker)]
+            if not waiting:
+                return True
+            if time.monotonic() >= deadline:
+                logger.warning(f"세트 상태를 반영하지 않은 워커: {waiting}")
+                return False
+            self.engine.heartbeat_reindex()
+            time.sleep(self.poll)
+
+    def _wait_for_idle(self) -> bool:
+        """실시간 요청이 없을 때까지 대기 (중단 시 False)"""
+        while True:
+            if self._stop.is_set():
+                return False
+            self.engine.heartbeat_reindex()
+            if not self.busy():
+                return True
+            start = time.perf_counter()
+            self._stop.wait(self.idle_wait)
+            self._yielded += time.perf_counter() - start
+
+    def _fail(self, error: Exception) -> None:
+        self.error = str(error)
+        self._finish(REINDEX_FAILED)
+        logger.error(f"온라인 재색인 실패: {error}")
+
+    def _finish(self, state: str) -> None:
+        self._finished_at = time.time()
+        self.state = state
+
+    def stats(self) -> Dict[str, Any]:
+        """재색인 진행 상태"""
+        end = self._finished_at or time.time()
+        return {
+            "state": self.state,
+            "error": self.error,
+            "target": self._target,
+            "previous": self._previous,
+            "total": self._total,
+            "processed": self._processed,
+            # 교체 직전 대조에서 다시 복사한(복사 중 바뀐) 개발자 수
+            "reconciled": self._reconciled,
+            "elapsed_seconds": round(end - self._started_at, 3) if self._started_at else None,
+            "swapped_at": self._swapped_at,
+            "yielded_seconds": round(self._yielded, 3)
+        }
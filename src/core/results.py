@@ -0,0 +1,95 @@
+"""
+검색 결과 표현
+후보 단계에서는 슬롯 객체로 다루고, 반환할 페이지만 사전으로 변환해 요청한 필드만 남김
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .profile_fields import COMPANY_FLAG_PREFIX, SKILL_FLAG_PREFIX
+from .reindex import INDEX_STAMP_FIELD
+
+# 결과 최상위 필드 (그 외 필드명은 메타데이터 필드로 취급)
+RESULT_FIELDS = ("developer_id", "score", "total_score", "experience", "document")
+
+# 응답에서 제외하는 내부 필터용/재색인용 메타데이터 필드
+INTERNAL_METADATA_PREFIXES = (COMPANY_FLAG_PREFIX, SKILL_FLAG_PREFIX)
+INTERNAL_METADATA_FIELDS = frozenset(["filter_fields_version", INDEX_STAMP_FIELD])
+
+class SearchHit:
+    """검색 후보 - 필터 엔진과의 호환을 위해 사전식 접근 지원 (값이 None인 필드는 없는 것으로 취급)"""
+
+    __slots__ = ("developer_id", "metadata", "total_score", "score", "experience", "document")
+
+    def __init__(self, developer_id: str, metadata: Dict, total_score: float = None, score: float = None,
+                 experience: List[Dict] = None, document: str = None):
+        self.developer_id = developer_id
+        self.metadata = metadata
+        self.total_score = total_score
+        self.score = score
+        self.experience = experience
+        self.document = document
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = getattr(self, key, None) if key in self.__slots__ else None
+        return default if value is None else value
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def copy(self) -> "SearchHit":
+        return SearchHit(self.developer_id, self.metadata, self.total_score, self.score, self.experience, self.document)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """응답/캐시용 사전 (내부 필터 필드 제외)"""
+        result = {"developer_id": self.developer_id, "metadata": public_metadata(self.metadata)}
+        for field in ("score", "total_score", "experience", "document"):
+            value = getattr(self, field)
+            if value is not None:
+                result[field] = value
+        return result
+
+def public_metadata(metadata: Dict) -> Dict:
+    """회사/기술 플래그 등 필터 전용 필드를 뺀 메타데이터"""
+    return {
+        key: value for key, value in metadata.items()
+        if key not in INTERNAL_METADATA_FIELDS and not key.startswith(INTERNAL_METADATA_PREFIXES)
+    }
+
+def parse_fields(value: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """쉼표로 구분된 필드 목록 파싱 ("name, location" -> ("name", "location"), 비어 있으면 None)"""
+    if not value:
+        return None
+    fields = tuple(dict.fromkeys(field.strip() for field in value.split(",") if field.strip()))
+    return fields or None
+
+def needs_documents(fields: Optional[Iterable[str]]) -> bool:
+    """필드 목록에 프로필 문서가 포함되는지"""
+    return fields is not None and "document" in fields
+
+def project_result(result: Dict, fields: Tuple[str, ...]) -> Dict[str, Any]:
+    """요청한 필드만 남긴 결과 (developer_id는 항상 포함, "metadata"는 메타데이터 전체)"""
+    projected = {"developer_id": result["developer_id"]}
+    metadata = result.get("metadata", {})
+    selected = {}
+    for field in fields:
+        if field == "metadata":
+            selected.update(metadata)
+        elif field in RESULT_FIELDS:
+            if field in result:
+                projected[field] = result[field]
+        elif field in metadata:
+            selected[field] = metadata[field]
+    if selected:
+        projected["metadata"] = selected
+    return projected
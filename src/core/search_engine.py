@@ -3,14 +3,55 @@ SKAX-RA-AI-SEARCH 검색 엔진
 벡터 데이터베이스 기반 개발자 검색 시스템
 """
 
-import chromadb
+import copy
+import json
 import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from sentence_transformers import SentenceTransformer
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterator, Callable, Optional, Set, Tuple
 import numpy as np
 
-from config.settings import DB_PATH, MODEL_NAME, SEARCH_WEIGHTS, DEFAULT_SEARCH_LIMIT, MAX_SEARCH_LIMIT
+from config.settings import (
+    DB_PATH, MODEL_NAME, SEARCH_WEIGHTS, DEFAULT_SEARCH_LIMIT, MAX_SEARCH_LIMIT,
+    RESPONSE_CACHE_SIZE, RESPONSE_CACHE_PATH, INDEX_QUERY_WORKERS, HNSW_CONFIG, HNSW_AUTO_MIGRATE,
+    SIMILAR_GRAPH_K, STATS_TOP_N, STATS_RECONCILE_INTERVAL,
+    PLANNER_FILTER_FIRST_MAX, PLANNER_OVERFETCH_MARGIN, PLANNER_MAX_FETCH,
+    TWO_STAGE_ENABLED, TWO_STAGE_CONFIG,
+    EMBEDDING_CACHE_SIZE, QUERY_LOG_PATH, QUERY_LOG_MAX_ENTRIES, QUERY_LOG_FLUSH_INTERVAL,
+    SLOW_QUERY_THRESHOLD_MS, SLOW_QUERY_SAMPLE_RATE, SLOW_QUERY_LOG_PATH, SLOW_QUERY_LOG_MAX_BYTES,
+    SLOW_QUERY_LOG_BACKUPS, SLOW_QUERY_RECENT, REINDEX_STATE_POLL_INTERVAL, REINDEX_WORKER_TIMEOUT
+)
+from config.filter_config import USER_FILTER_CONFIGS
 from .dynamic_filter import DynamicFilterEngine
+from .cache import ResponseCache, EmbeddingCache
+from .concurrency import SingleFlight, KeyedLocks, ReadWriteLock
+from .embedding_pool import EmbeddingPool
+from .similarity import NeighborGraph, combine_developer_vector
+from .suggest import SuggestIndex
+from .stats import StatsCollector
+from .results import SearchHit, needs_documents, project_result
+from .planner import FieldHistograms, QueryPlanner, QueryPlan, PLAN_FILTER_FIRST
+from .compact_index import CompactIndex
+from .warmup import QueryLog
+from .tracing import SlowQueryLog, current_trace, bind_trace
+from .store_client import create_client, is_remote
+from .reindex import (
+    INDEX_NAMES, INDEX_STAMP_FIELD, IndexSet, IndexState, IndexStateWatcher, collection_name, index_versions,
+    load_index_state, save_index_state, register_worker, unregister_worker, live_workers, new_index_stamp
+)
+from .profile_fields import build_profile_filter_fields, build_where_clause, has_filter_fields
+from .index_config import (
+    hnsw_metadata, collection_hnsw_params, needs_rebuild, set_search_ef, distance_to_similarity, exact_distances
+)
+
+# 한 번의 인덱스 질의로 가져오는 최대 결과 행 수 (쿼리 수 x 조회 수, SQLite 변수 수 제한)
+MAX_QUERY_ROWS = 20000
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -22,45 +63,583 @@ class SearchEngine:
     def __init__(self, db_path: str = None, user_config: str = "default"):
         """검색 엔진 초기화"""
         self.db_path = db_path or DB_PATH
-        self.client = chromadb.PersistentClient(path=self.db_path)
-        self.embedding_model = SentenceTransformer(MODEL_NAME)
+        # 벡터 저장소 (embedded: 로컬 DB, http: Chroma 서버 - 세 인덱스 질의를 동시에 보냄)
+        self.client = create_client(self.db_path)
+        self.remote_store = is_remote()
+        # 사용 중인 컬렉션 세트 버전과 그 세트를 임베딩한 모델 (온라인 재색인으로 교체)
+        state = load_index_state(self.client)
+        model_name = state.model_name or MODEL_NAME
+        if model_name != MODEL_NAME:
+            logger.warning(f"저장된 인덱스 모델({model_name})이 설정(MODEL_NAME={MODEL_NAME})과 다릅니다. "
+                           f"온라인 재색인(POST /api/reindex)이 끝날 때까지 기존 모델로 검색합니다.")
+        embedding_model = SentenceTransformer(model_name)
         
-        # 동적 필터 엔진 초기화
+        # 동적 필터 엔진 초기화 (필터 모드별로 재사용)
         self.filter_engine = DynamicFilterEngine(user_config)
+        self.filter_engines = {self.filter_engine.user_config: self.filter_engine}
+        
+        # 검색 응답 캐시 (쓰기마다 인덱스 세대가 증가하여 무효화)
+        self.result_cache = ResponseCache(RESPONSE_CACHE_SIZE, RESPONSE_CACHE_PATH)
+        # 쿼리 임베딩 캐시와 캐시 워밍업용 쿼리 빈도 로그
+        self.embedding_cache = EmbeddingCache(EMBEDDING_CACHE_SIZE)
+        self.query_log = QueryLog(
+            os.path.join(self.db_path, "query_log.json") if QUERY_LOG_PATH is None else QUERY_LOG_PATH,
+            QUERY_LOG_MAX_ENTRIES
+        )
+        self.query_log.start_flushing(QUERY_LOG_FLUSH_INTERVAL)
+        # 느린 검색/필터/프로필 조회의 단계별 추적
+        self.slow_query_log = SlowQueryLog(
+            os.path.join(self.db_path, "slow_queries.log") if SLOW_QUERY_LOG_PATH is None else SLOW_QUERY_LOG_PATH,
+            SLOW_QUERY_THRESHOLD_MS, SLOW_QUERY_SAMPLE_RATE, SLOW_QUERY_RECENT,
+            SLOW_QUERY_LOG_MAX_BYTES, SLOW_QUERY_LOG_BACKUPS
+        )
+        # 동일 검색의 동시 실행 병합
+        self._single_flight = SingleFlight()
+        # 같은 개발자에 대한 쓰기 직렬화
+        self._write_locks = KeyedLocks()
+        # 쓰기 후 호출되는 보조 인덱스 갱신 리스너
+        self._write_listeners: List[Callable[[Dict[str, Dict], List[str]], None]] = []
+        # 인덱스 동시 검색용 스레드 풀
+        self._index_executor = ThreadPoolExecutor(max_workers=INDEX_QUERY_WORKERS, thread_name_prefix="index-query")
+        # 저장소 쓰기(읽기 락)와 컬렉션 세트 교체(쓰기 락) 사이의 락, 세트 상태 확인/변경 직렬화 락
+        self._index_lock = ReadWriteLock()
+        self._state_lock = threading.Lock()
+        # 재색인 중인 새 세트 (다른 프로세스가 시작한 재색인도 세트 상태에서 읽어 쓰기를 함께 기록)
+        self._reindex_target: Optional[IndexSet] = None
+        # 이 워커가 재색인을 시작했으면 마지막 생존 기록 시각 (다른 워커의 재색인이면 None)
+        self._reindex_heartbeat: Optional[float] = None
+        # 요청 동안 검색할 세트 (스레드별 고정, 세트 교체와 무관하게 한 요청은 한 세트/모델로 처리)
+        self._pinned = threading.local()
+        # 세트 상태 컬렉션에 사용 중인 세트 버전을 기록하는 워커 ID
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        
+        # 컬렉션 생성 (다른 워커가 쓰지 않는 이전 세트가 남아 있으면 정리)
+        collections, spaces = self._create_collections(state.active_version)
+        self._active = IndexSet(state.active_version, model_name, embedding_model, collections, spaces)
+        self.drop_stale_index_sets()
+        # 이전 버전에서 저장된 프로필에 필터 필드 추가
+        self.backfill_profile_fields()
+        
+        # 비슷한 개발자 이웃 그래프 (저장된 임베딩으로 생성, 쓰기마다 증분 갱신)
+        self.neighbor_graph = NeighborGraph(SIMILAR_GRAPH_K)
+        self.neighbor_graph.build(self.developer_vectors())
+        self.add_write_listener(self._update_neighbor_graph)
+        
+        # 2단계 검색용 축소 벡터 인덱스 (컬렉션별 설정, 쓰기마다 증분 갱신)
+        self.compact_indexes: Dict[str, CompactIndex] = {}
+        self._two_stage_config: Dict[str, Optional[Dict[str, Any]]] = {}
+        # 축소 벡터 인덱스를 만든 세트 버전 (다른 세트를 검색하는 요청은 단일 단계 검색)
+        self._compact_version: Optional[int] = None
+        self._compact_lock = threading.Lock()
+        # 이웃 그래프/축소 벡터 인덱스를 만든 세트 버전 (교체 후 세트 상태 확인 스레드에서 다시 생성)
+        self._auxiliary_version = self._active.version
+        if TWO_STAGE_ENABLED:
+            self.configure_two_stage(TWO_STAGE_CONFIG)
+        self.add_write_listener(self._update_compact_indexes)
+        
+        profile_metadatas = self.collections['profiles'].get(include=['metadatas'])['metadatas']
+        
+        # 검색어 자동완성 인덱스 (필터 패턴 + 저장된 기술/회사/지역 값)
+        self.suggest_index = SuggestIndex()
+        self.suggest_index.build(profile_metadatas)
+        self.add_write_listener(self.suggest_index.on_write)
         
-        # 컬렉션 생성
-        self.collections = self._create_collections()
+        # 필터 선택도 추정용 필드 히스토그램과 쿼리 플래너
+        self.field_histograms = FieldHistograms()
+        self.field_histograms.build(profile_metadatas)
+        self.add_write_listener(self.field_histograms.on_write)
+        self.query_planner = QueryPlanner(
+            self.field_histograms, PLANNER_FILTER_FIRST_MAX, PLANNER_OVERFETCH_MARGIN, PLANNER_MAX_FETCH
+        )
+        
+        # 메모리 내 통계 (쓰기마다 증분 갱신, 주기적으로 컬렉션과 대조)
+        self.stats_collector = StatsCollector(STATS_TOP_N)
+        self.stats_collector.reconcile(lambda: (profile_metadatas, self._count_entries()))
+        self.add_write_listener(self.stats_collector.on_write)
+        self.stats_collector.start_reconciliation(STATS_RECONCILE_INTERVAL, self._load_stats_source)
+        
+        # 다른 프로세스의 재색인 시작/교체를 주기적으로 반영하고 사용 중인 세트 버전 기록
+        self.refresh_index_state()
+        self.index_watcher = IndexStateWatcher(self, REINDEX_STATE_POLL_INTERVAL, REINDEX_WORKER_TIMEOUT / 3)
+        self.index_watcher.start()
         logger.info(f"검색 엔진 초기화 완료: {self.db_path} (필터 모드: {user_config})")
     
-    def _create_collections(self) -> Dict[str, Any]:
-        """ChromaDB 컬렉션 생성"""
-        collections = {}
+    @property
+    def index_set(self) -> IndexSet:
+        """현재 스레드가 고정한 세트 (없으면 사용 중인 세트)"""
+        return getattr(self._pinned, "index_set", None) or self._active
+    
+    @property
+    def collections(self) -> Dict[str, Any]:
+        """검색 대상 컬렉션"""
+        return self.index_set.collections
+    
+    @property
+    def collection_spaces(self) -> Dict[str, str]:
+        return self.index_set.spaces
+    
+    @property
+    def embedding_model(self):
+        """검색 대상 세트를 임베딩한 모델"""
+        return self.index_set.embedding_model
+    
+    @property
+    def model_name(self) -> str:
+        return self.index_set.model_name
+    
+    @contextmanager
+    def _use_index_set(self, index_set: IndexSet = None):
+        """블록 동안 현재 스레드의 검색 세트 고정 (기본: 사용 중인 세트, 이미 고정돼 있으면 유지)
         
-        # 프로필 컬렉션
+        쿼리 임베딩과 인덱스 검색이 같은 세트(모델)를 쓰도록 요청 단위로 고정하며, 락은 잡지 않는다.
+        """
+        previous = getattr(self._pinned, "index_set", None)
+        self._pinned.index_set = previous or index_set or self._active
         try:
-            collections['profiles'] = self.client.get_collection("profiles")
-            logger.info("기존 프로필 컬렉션 로드")
-        except:
-            collections['profiles'] = self.client.create_collection("profiles")
-            logger.info("새 프로필 컬렉션 생성")
+            yield self._pinned.index_set
+        finally:
+            self._pinned.index_set = previous
+    
+    def _create_collections(self, version: int = 0) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """세트 버전의 ChromaDB 컬렉션 생성 (컬렉션별 거리 공간과 HNSW 파라미터 적용) - (컬렉션, 거리 공간)"""
+        collections = {}
+        spaces = {}
         
-        # 기술 스택 컬렉션
+        for name, label in (("profiles", "프로필"), ("skills", "기술"), ("experience", "경력")):
+            params = HNSW_CONFIG[name]
+            full_name = collection_name(name, version)
+            try:
+                collection = self.client.get_collection(full_name)
+                logger.info(f"기존 {label} 컬렉션 로드 ({full_name})")
+            except:
+                collection = self.client.create_collection(full_name, metadata=hnsw_metadata(params))
+                logger.info(f"새 {label} 컬렉션 생성 ({full_name})")
+            
+            current = collection_hnsw_params(collection)
+            if needs_rebuild(current, params):
+                if HNSW_AUTO_MIGRATE:
+                    collection = self._migrate_collection(name, collection)
+                    current = collection_hnsw_params(collection)
+                else:
+                    logger.warning(
+                        f"{label} 컬렉션 인덱스 설정이 다릅니다 (현재: {current}, 설정: {params}). "
+                        f"온라인 재색인(POST /api/reindex)으로 새 설정의 세트를 만들거나 "
+                        f"'python scripts/tune_hnsw.py --migrate'로 마이그레이션하세요."
+                    )
+            elif current["search_ef"] != params["search_ef"]:
+                set_search_ef(collection, params["search_ef"])
+                logger.info(f"{label} 컬렉션 search_ef 변경: {current['search_ef']} -> {params['search_ef']}")
+            
+            collections[name] = collection
+            spaces[name] = current["space"]
+        
+        return collections, spaces
+    
+    def migrate_collections(self) -> List[str]:
+        """인덱스 설정이 다른 컬렉션을 설정대로 다시 생성"""
+        migrated = []
+        for name, collection in list(self.collections.items()):
+            if needs_rebuild(collection_hnsw_params(collection), HNSW_CONFIG[name]):
+                self.collections[name] = self._migrate_collection(name, collection)
+                self.collection_spaces[name] = HNSW_CONFIG[name]["space"]
+                migrated.append(name)
+        if migrated:
+            self._bump_generation()
+        return migrated
+    
+    def _migrate_collection(self, name: str, collection, batch_size: int = 1000):
+        """저장된 임베딩을 복사해 새 설정의 컬렉션으로 교체 (재임베딩 없음)"""
+        params = HNSW_CONFIG[name]
+        full_name = collection.name
+        temp_name = f"{full_name}_migrating"
+        logger.info(f"컬렉션 마이그레이션 시작: {name} ({collection_hnsw_params(collection)} -> {params})")
+        
+        # 이전에 중단된 마이그레이션 정리
         try:
-            collections['skills'] = self.client.get_collection("skills")
-            logger.info("기존 기술 컬렉션 로드")
-        except:
-            collections['skills'] = self.client.create_collection("skills")
-            logger.info("새 기술 컬렉션 생성")
+            self.client.delete_collection(temp_name)
+        except Exception:
+            pass
+        target = self.client.create_collection(temp_name, metadata=hnsw_metadata(params))
+        
+        total = collection.count()
+        for offset in range(0, total, batch_size):
+            batch = collection.get(include=['embeddings', 'documents', 'metadatas'], limit=batch_size, offset=offset)
+            if not batch['ids']:
+                break
+            target.add(
+                ids=batch['ids'],
+                embeddings=batch['embeddings'],
+                documents=batch['documents'],
+                metadatas=batch['metadatas']
+            )
         
-        # 경력 컬렉션
+        self.client.delete_collection(full_name)
+        target.modify(name=full_name)
+        logger.info(f"컬렉션 마이그레이션 완료: {full_name} ({total}개)")
+        return self.client.get_collection(full_name)
+    
+    def developer_ids(self) -> List[str]:
+        """사용 중인 세트의 전체 개발자 ID"""
+        profile_ids = self._active.collections['profiles'].get(include=[])['ids']
+        return [profile_id[len("profile_"):] for profile_id in profile_ids]
+    
+    def developer_records(self, developer_ids: List[str]) -> List[Dict[str, Any]]:
+        """사용 중인 세트의 메타데이터로 개발자 데이터 복원 (프로필이 없는 개발자는 제외)"""
+        return self._read_developers(developer_ids, self._active)[0]
+    
+    def _read_developers(self, developer_ids: List[str], index_set: IndexSet) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+        """세트의 메타데이터로 개발자 데이터 복원 - (개발자 목록, 개발자별 기록 시각)"""
+        if not developer_ids:
+            return [], {}
+        collections = index_set.collections
+        profiles = collections['profiles'].get(
+            ids=[f"profile_{dev_id}" for dev_id in developer_ids], include=['metadatas']
+        )
+        where = {"developer_id": {"$in": list(developer_ids)}}
+        skills: Dict[str, List[Dict]] = {}
+        for metadata in collections['skills'].get(where=where, include=['metadatas'])['metadatas']:
+            skills.setdefault(metadata['developer_id'], []).append(metadata)
+        experience: Dict[str, List[Dict]] = {}
+        for metadata in collections['experience'].get(where=where, include=['metadatas'])['metadatas']:
+            experience.setdefault(metadata['developer_id'], []).append(metadata)
+        developers = [
+            self._developer_from_metadata(
+                metadata, skills.get(metadata['developer_id'], []), experience.get(metadata['developer_id'], [])
+            )
+            for metadata in profiles['metadatas']
+        ]
+        stamps = {metadata['developer_id']: metadata.get(INDEX_STAMP_FIELD, "") for metadata in profiles['metadatas']}
+        return developers, stamps
+    
+    def _profile_stamps(self, index_set: IndexSet, developer_ids: List[str] = None,
+                        batch_size: int = 5000) -> Dict[str, str]:
+        """세트의 개발자별 기록 시각 (developer_ids가 없으면 전체)"""
+        collection = index_set.collections['profiles']
+        if developer_ids is not None:
+            if not developer_ids:
+                return {}
+            metadatas = collection.get(ids=[f"profile_{dev_id}" for dev_id in developer_ids], include=['metadatas'])['metadatas']
+        else:
+            metadatas = []
+            for offset in range(0, collection.count(), batch_size):
+                batch = collection.get(include=['metadatas'], limit=batch_size, offset=offset)['metadatas']
+                if not batch:
+                    break
+                metadatas.extend(batch)
+        return {metadata['developer_id']: metadata.get(INDEX_STAMP_FIELD, "") for metadata in metadatas}
+    
+    def _load_model(self, model_name: str):
+        """임베딩 모델 로드 (사용 중이거나 재색인 중인 세트의 모델이면 재사용)"""
+        for index_set in (self._active, self._reindex_target):
+            if index_set is not None and index_set.model_name == model_name:
+                return index_set.embedding_model
+        return SentenceTransformer(model_name)
+    
+    def _open_index_set(self, version: int, model_name: Optional[str]) -> Optional[IndexSet]:
+        """다른 워커가 만든 세트 열기 (컬렉션이 없으면 생성하지 않고 None)"""
         try:
-            collections['experience'] = self.client.get_collection("experience")
-            logger.info("기존 경력 컬렉션 로드")
-        except:
-            collections['experience'] = self.client.create_collection("experience")
-            logger.info("새 경력 컬렉션 생성")
+            collections = {name: self.client.get_collection(collection_name(name, version)) for name in INDEX_NAMES}
+        except Exception:
+            return None
+        spaces = {name: collection_hnsw_params(collection)["space"] for name, collection in collections.items()}
+        model_name = model_name or MODEL_NAME
+        return IndexSet(version, model_name, self._load_model(model_name), collections, spaces)
+    
+    def refresh_index_state(self) -> bool:
+        """저장소의 세트 상태를 읽어 검색/쓰기 세트를 맞춤 - 바뀌었으면 True
         
-        return collections
+        다른 워커가 재색인을 시작하면 쓰기를 새 세트에도 기록하고 (생존 기록이 끊긴 재색인은 무시),
+        교체하면 새 세트로 전환한다. 세트 상태 확인 스레드에서 호출하며, 쓰기는 마지막으로 반영한 상태를 그대로 쓴다
+        (재색인 시작이 반영되기 전의 쓰기는 교체 직전 대조에서 다시 복사). 교체 후 보조 인덱스 재생성도 이 스레드에서 한다.
+        """
+        changed = self._sync_index_state()
+        if self._active.version != self._auxiliary_version:
+            self._on_index_swapped()
+        return changed
+    
+    def _sync_index_state(self) -> bool:
+        """저장소의 세트 상태로 사용 중인 세트/재색인 세트 전환 - 바뀌었으면 True"""
+        with self._state_lock:
+            state = load_index_state(self.client)
+            active, target = self._active, self._reindex_target
+            if state.active_version != active.version:
+                if target is not None and target.version == state.active_version:
+                    active = target
+                else:
+                    opened = self._open_index_set(state.active_version, state.model_name)
+                    if opened is None:
+                        logger.warning(f"세트 상태의 컬렉션 세트를 열 수 없습니다 (버전 {state.active_version})")
+                    else:
+                        active = opened
+            if not state.reindex_alive(REINDEX_WORKER_TIMEOUT) or state.target_version == active.version:
+                target = None
+            elif target is None or target.version != state.target_version:
+                target = self._open_index_set(state.target_version, state.target_model_name)
+            if active is self._active and target is self._reindex_target:
+                return False
+            # 진행 중인 저장소 쓰기가 끝난 뒤 전환 (이후 쓰기는 바뀐 세트 기준으로 다시 임베딩)
+            with self._index_lock.write():
+                previous = self._active
+                self._active, self._reindex_target = active, target
+        
+        if active is not previous:
+            logger.info(f"컬렉션 세트 전환: 버전 {previous.version} -> {active.version} (모델: {active.model_name})")
+            self._bump_generation()
+        elif target is not None:
+            logger.info(f"재색인 세트 쓰기 시작: 버전 {target.version} (모델: {target.model_name})")
+        else:
+            logger.info("재색인 세트 쓰기 중지")
+        return True
+    
+    def _on_index_swapped(self) -> None:
+        """세트 교체 후 보조 인덱스를 새 세트 임베딩으로 다시 생성 (그동안 비슷한 개발자는 이전 그래프, 검색은 단일 단계로 처리)"""
+        self._auxiliary_version = self._active.version
+        with self._compact_lock:
+            compact_indexes, self.compact_indexes = self.compact_indexes, {}
+            self._compact_version = None
+        for index in compact_indexes.values():
+            index.close()
+        if any(self._two_stage_config.values()):
+            self.configure_two_stage(self._two_stage_config)
+        self.neighbor_graph.build(self.developer_vectors())
+    
+    def report_worker(self) -> None:
+        """이 워커가 쓰고 있는 세트 버전을 세트 상태 컬렉션에 기록"""
+        target = self._reindex_target
+        register_worker(self.client, self.worker_id, self._active.version, target.version if target is not None else None)
+    
+    def unregister_worker(self) -> None:
+        unregister_worker(self.client, self.worker_id)
+    
+    def live_workers(self) -> Dict[str, Dict[str, Any]]:
+        """생존 기록이 남아 있는 워커별 사용 중인 세트 버전"""
+        return live_workers(self.client, REINDEX_WORKER_TIMEOUT)
+    
+    def heartbeat_reindex(self) -> None:
+        """재색인을 시작한 워커의 생존 기록 (생존 시한의 1/3마다, 기록이 끊기면 다른 워커는 재색인 세트 쓰기를 멈춤)"""
+        target = self._reindex_target
+        if target is None or self._reindex_heartbeat is None:
+            return
+        if time.time() - self._reindex_heartbeat < REINDEX_WORKER_TIMEOUT / 3:
+            return
+        with self._state_lock:
+            state = load_index_state(self.client)
+            if state.target_version != target.version:
+                return
+            state.heartbeat_at = self._reindex_heartbeat = time.time()
+            save_index_state(self.client, state)
+    
+    def begin_reindex(self, model_name: str = None) -> IndexSet:
+        """온라인 재색인 시작 - 새 버전 컬렉션 세트를 만들어 세트 상태에 기록 (이후 모든 워커의 쓰기가 양쪽 세트에 기록됨)
+        
+        생존 기록이 끊긴 이전 재색인 세트(사용 중인 버전보다 높은 버전)는 삭제하고 다시 만든다.
+        """
+        model_name = model_name or MODEL_NAME
+        self._sync_index_state()
+        embedding_model = self._load_model(model_name)
+        
+        with self._state_lock:
+            state = load_index_state(self.client)
+            if state.reindex_alive(REINDEX_WORKER_TIMEOUT):
+                raise RuntimeError(f"이미 재색인 중입니다 (버전 {state.target_version})")
+            active = self._active
+            versions = index_versions(self.client)
+            for version in versions:
+                if version > active.version:
+                    self._drop_collections(version)
+            version = max(versions + [active.version]) + 1
+            collections, spaces = self._create_collections(version)
+            target = IndexSet(version, model_name, embedding_model, collections, spaces)
+            
+            state.active_version, state.model_name = active.version, active.model_name
+            state.target_version, state.target_model_name = version, model_name
+            state.heartbeat_at = self._reindex_heartbeat = time.time()
+            save_index_state(self.client, state)
+            with self._index_lock.write():
+                self._reindex_target = target
+        self.report_worker()
+        logger.info(f"재색인 세트 생성: 버전 {version} (모델: {model_name})")
+        return target
+    
+    def reindex_developers(self, developer_ids: List[str]) -> int:
+        """재색인 배치 - 사용 중인 세트의 개발자 데이터를 새 세트에 복사하고 복사한 개발자 수 반환"""
+        target = self._reindex_target
+        if target is None:
+            raise RuntimeError("재색인 중이 아닙니다")
+        return self._sync_developers(developer_ids, self._active, target)
+    
+    def reconcile_index_sets(self, batch_size: int = 256) -> int:
+        """교체 직전 대조 - 두 세트의 개발자별 기록 시각이 다른 개발자를 다시 복사하고 그 수 반환
+        
+        재색인 시작이 모든 워커에 반영되기 전의 쓰기나 복사와 겹친 다른 워커의 쓰기로 어긋난 개발자를 맞춘다.
+        """
+        target = self._reindex_target
+        if target is None:
+            raise RuntimeError("재색인 중이 아닙니다")
+        source = self._active
+        source_stamps = self._profile_stamps(source)
+        target_stamps = self._profile_stamps(target)
+        changed = sorted(
+            dev_id for dev_id in source_stamps.keys() | target_stamps.keys()
+            if source_stamps.get(dev_id) != target_stamps.get(dev_id)
+        )
+        for start in range(0, len(changed), batch_size):
+            self.heartbeat_reindex()
+            self._sync_developers(changed[start:start + batch_size], source, target)
+        if changed:
+            logger.info(f"재색인 세트 대조: {len(changed)}명 다시 복사")
+        return len(changed)
+    
+    def _sync_developers(self, developer_ids: List[str], source: IndexSet, target: IndexSet, attempts: int = 3) -> int:
+        """원본 세트의 개발자 데이터를 대상 세트로 복사하고 복사한 개발자 수 반환 (원본에 없는 개발자는 대상에서 삭제)
+        
+        읽기와 임베딩은 락 밖에서 하므로, 복사한 뒤 원본의 기록 시각이 바뀐 개발자(그 사이 다른 워커의 쓰기)는
+        다시 복사한다. 계속 바뀌는 개발자는 교체 직전 대조에서 다시 맞춘다.
+        """
+        pending = list(developer_ids)
+        copied: Set[str] = set()
+        for _ in range(attempts):
+            developers, stamps = self._read_developers(pending, source)
+            entries = self._build_index_entries(developers, stamps)
+            embeddings = self._encode_entries(entries, target.embedding_model)
+            with self._index_lock.read(), self._write_locks.hold(pending):
+                self._delete_entries(pending, target.collections)
+                self._write_index_entries(entries, embeddings, target.collections)
+            copied.update(stamps)
+            current = self._profile_stamps(source, pending)
+            pending = [dev_id for dev_id in pending if current.get(dev_id) != stamps.get(dev_id)]
+            if not pending:
+                break
+        if pending:
+            logger.warning(f"복사 중 계속 바뀐 개발자 {len(pending)}명 (교체 직전 대조에서 다시 복사)")
+        return len(copied)
+    
+    def commit_reindex(self) -> IndexSet:
+        """재색인한 세트로 검색/쓰기 대상 교체 후 이전 세트 반환
+        
+        세트 상태에 먼저 기록하므로 다른 워커도 상태 확인 시 스스로 전환한다. 이미 시작된 검색은 시작할 때
+        고정한 세트로 끝까지 처리하므로, 이전 세트 컬렉션은 모든 워커가 전환한 뒤 호출한 쪽에서
+        drop_index_set으로 삭제한다. 보조 인덱스는 세트 상태 확인 스레드가 다시 생성한다 (스레드가 없으면 여기서).
+        """
+        with self._state_lock:
+            target = self._reindex_target
+            if target is None or self._reindex_heartbeat is None:
+                raise RuntimeError("재색인 중이 아닙니다")
+            save_index_state(self.client, IndexState(target.version, target.model_name, swapped_at=time.time()))
+            with self._index_lock.write():
+                previous, self._active = self._active, target
+                self._reindex_target = None
+            self._reindex_heartbeat = None
+        logger.info(f"컬렉션 세트 교체: 버전 {previous.version} -> {target.version} (모델: {target.model_name})")
+        self._bump_generation()
+        self.report_worker()
+        if not self.index_watcher.running:
+            self._on_index_swapped()
+        return previous
+    
+    def abort_reindex(self) -> Optional[IndexSet]:
+        """재색인 취소 - 세트 상태에서 재색인 세트를 지워 양쪽 쓰기를 멈추고 그 세트 반환
+        
+        다른 워커도 쓰기를 멈춘 뒤 호출한 쪽에서 drop_index_set으로 삭제한다.
+        """
+        with self._state_lock:
+            target = self._reindex_target
+            if target is None:
+                return None
+            if self._reindex_heartbeat is not None:
+                state = load_index_state(self.client)
+                if state.target_version == target.version:
+                    state.target_version = state.target_model_name = None
+                    save_index_state(self.client, state)
+            with self._index_lock.write():
+                self._reindex_target = None
+            self._reindex_heartbeat = None
+        self.report_worker()
+        return target
+    
+    def drop_index_set(self, index_set: IndexSet) -> None:
+        """세트의 컬렉션 삭제 (사용 중인 세트는 삭제하지 않음)"""
+        if index_set.version == self._active.version:
+            raise ValueError(f"사용 중인 세트는 삭제할 수 없습니다 (버전 {index_set.version})")
+        self._drop_collections(index_set.version)
+        logger.info(f"컬렉션 세트 삭제: 버전 {index_set.version}")
+    
+    def drop_stale_index_sets(self) -> List[int]:
+        """사용 중인 버전보다 낮은 세트(교체 후 삭제되지 못한 이전 세트) 중 살아 있는 워커가 쓰지 않는 세트 삭제
+        
+        높은 버전은 다른 프로세스가 재색인 중일 수 있으므로 다음 재색인 시작 시 정리한다.
+        """
+        in_use = {worker["active_version"] for worker in self.live_workers().values()}
+        stale = [
+            version for version in index_versions(self.client)
+            if version < self._active.version and version not in in_use
+        ]
+        for version in stale:
+            self._drop_collections(version)
+            logger.info(f"이전 컬렉션 세트 삭제: 버전 {version}")
+        return stale
+    
+    def _drop_collections(self, version: int) -> None:
+        for name in INDEX_NAMES:
+            try:
+                self.client.delete_collection(collection_name(name, version))
+            except Exception:
+                pass
+    
+    def index_status(self) -> Dict[str, Any]:
+        """사용 중인 세트, 재색인 중인 세트와 워커별 사용 중인 세트 버전"""
+        target = self._reindex_target
+        return {
+            "active": self._active.to_dict(),
+            "reindexing": target.to_dict() if target is not None else None,
+            "configured_model": MODEL_NAME,
+            "worker_id": self.worker_id,
+            "workers": self.live_workers()
+        }
+    
+    def _similarity(self, collection_name: str, distance: float) -> float:
+        """컬렉션의 거리 공간에 맞춰 거리를 유사도 점수로 변환"""
+        return distance_to_similarity(distance, self.collection_spaces[collection_name])
+    
+    @property
+    def index_generation(self) -> int:
+        """현재 인덱스 세대 (쓰기마다 단조 증가)"""
+        return self.result_cache.generation
+    
+    def _bump_generation(self) -> int:
+        """인덱스 세대 증가 - 모든 쓰기 작업 후 호출"""
+        return self.result_cache.bump_generation()
+    
+    def add_write_listener(self, listener: Callable[[Dict[str, Dict], List[str]], None]) -> None:
+        """쓰기 리스너 등록 - listener(갱신된 개발자별 프로필 메타데이터, 삭제된 개발자 ID 목록)"""
+        self._write_listeners.append(listener)
+    
+    def _notify_write(self, upserted: Dict[str, Dict], removed: List[str]) -> None:
+        """쓰기 리스너 호출 (개발자 쓰기 락 안에서 호출되어 같은 개발자의 변경 순서 보장)"""
+        for listener in self._write_listeners:
+            try:
+                listener(upserted, removed)
+            except Exception as e:
+                logger.error(f"쓰기 리스너 오류 ({getattr(listener, '__name__', listener)}): {e}")
+    
+    def get_filter_engine(self, filter_mode: str = None) -> DynamicFilterEngine:
+        """필터 모드별 동적 필터 엔진 반환"""
+        if filter_mode is None:
+            return self.filter_engine
+        if filter_mode not in USER_FILTER_CONFIGS:
+            filter_mode = "default"
+        if filter_mode not in self.filter_engines:
+            self.filter_engines[filter_mode] = DynamicFilterEngine(filter_mode)
+        return self.filter_engines[filter_mode]
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """응답 캐시 및 동시 요청 병합 통계"""
+        stats = self.result_cache.stats()
+        stats["single_flight"] = self._single_flight.stats()
+        stats["embedding_cache"] = self.embedding_cache.stats()
+        stats["query_log"] = self.query_log.stats()
+        stats["slow_query_log"] = self.slow_query_log.stats()
+        return stats
     
     def create_sample_data(self, count: int = 30) -> List[Dict]:
         """샘플 개발자 데이터 생성"""
@@ -112,63 +691,125 @@ class SearchEngine:
         
         return developers
     
-    def add_developers(self, developers: List[Dict]) -> None:
-        """개발자 데이터를 벡터 DB에 추가"""
+    def add_developers(self, developers: List[Dict]) -> int:
+        """개발자 데이터를 벡터 DB에 추가하고 추가한 개발자 수 반환 (이미 있는 개발자는 건너뜀, 교체는 update_developers)"""
         logger.info(f"개발자 데이터 추가 시작: {len(developers)}명")
         
+        requested = len(dict.fromkeys(dev["developer_id"] for dev in developers))
+        written = self._write_developers(developers, replace=False)
+        if not written:
+            logger.info(f"추가할 개발자 없음 (기존 {requested}명 건너뜀)")
+            return 0
+        
+        self._bump_generation()
+        logger.info(f"벡터 DB 데이터 추가 완료: {len(written)}명 (기존 {requested - len(written)}명 건너뜀)")
+        return len(written)
+    
+    def _write_developers(self, developers: List[Dict], replace: bool = True,
+                          encoded: Tuple[Dict[str, Dict[str, tuple]], Dict[str, Any], str] = None) -> Dict[str, Dict]:
+        """개발자 항목을 사용 중인 세트(재색인 중이면 새 세트에도)에 기록하고 기록된 개발자별 프로필 메타데이터 반환
+        
+        임베딩은 락 밖에서 하고 개발자 쓰기 락 안에서는 저장소 쓰기만 한다. 그 사이 세트가 바뀌면
+        (재색인 시작/교체) 바뀐 세트 기준으로 다시 임베딩한다.
+        replace=False면 이미 있는 개발자는 건너뛴다.
+        encoded: 미리 임베딩한 (항목, 컬렉션별 임베딩, 임베딩 모델 이름)
+        """
+        developer_ids = list(dict.fromkeys(dev["developer_id"] for dev in developers))
+        while True:
+            active, target = self._active, self._reindex_target
+            pending, existing = developers, None
+            if not replace:
+                existing = self._existing_developers(developer_ids, active)
+                pending = [dev for dev in developers if dev["developer_id"] not in existing]
+                if not pending:
+                    return {}
+            
+            entries, embeddings, model_name = encoded if encoded is not None and replace else (None, None, None)
+            if entries is None:
+                entries = self._build_index_entries(pending)
+            if model_name != active.model_name:
+                embeddings = self._encode_entries(entries, active.embedding_model)
+            target_embeddings = None
+            if target is not None:
+                target_embeddings = (
+                    embeddings if target.model_name == active.model_name
+                    else self._encode_entries(entries, target.embedding_model)
+                )
+            
+            with self._index_lock.read(), self._write_locks.hold(developer_ids):
+                if self._active is not active or self._reindex_target is not target:
+                    continue
+                if existing is not None and self._existing_developers(developer_ids, active) != existing:
+                    continue
+                if replace:
+                    self._delete_entries(developer_ids, active.collections)
+                written = self._write_index_entries(entries, embeddings, active.collections)
+                if target is not None:
+                    self._mirror_entries(developer_ids, entries, target_embeddings, target)
+                self._notify_write(written, [dev_id for dev_id in developer_ids if dev_id not in written] if replace else [])
+                return written
+    
+    @staticmethod
+    def _existing_developers(developer_ids: List[str], index_set: IndexSet) -> Set[str]:
+        """세트에 프로필이 있는 개발자 ID"""
+        profile_ids = index_set.collections['profiles'].get(
+            ids=[f"profile_{dev_id}" for dev_id in developer_ids], include=[]
+        )['ids']
+        return {profile_id[len("profile_"):] for profile_id in profile_ids}
+    
+    def _mirror_entries(self, developer_ids: List[str], entries: Dict[str, Dict[str, tuple]],
+                        embeddings: Dict[str, Any], target: IndexSet) -> None:
+        """재색인 중인 세트에도 기록 (개발자 쓰기 락 안에서 호출)
+        
+        재색인 세트 기록이 실패해도 사용 중인 세트의 쓰기는 유지하고, 어긋난 개발자는 교체 직전 대조에서 다시 복사된다.
+        """
+        try:
+            self._delete_entries(developer_ids, target.collections)
+            self._write_index_entries(entries, embeddings, target.collections)
+        except Exception as e:
+            logger.warning(f"재색인 세트 기록 실패 (버전 {target.version}): {e}")
+    
+    @staticmethod
+    def _encode_entries(entries: Dict[str, Dict[str, tuple]], embedding_model) -> Dict[str, Any]:
+        """컬렉션별 항목 텍스트 일괄 임베딩"""
+        return {
+            name: embedding_model.encode([text for text, _ in items.values()])
+            for name, items in entries.items() if items
+        }
+    
+    def _build_index_entries(self, developers: List[Dict], stamps: Dict[str, str] = None) -> Dict[str, Dict[str, tuple]]:
+        """컬렉션별 {항목 ID: (텍스트, 메타데이터)} 생성 (stamps: 재색인 복사본이 유지할 원본의 기록 시각)"""
+        entries = {name: {} for name in ('profiles', 'skills', 'experience')}
+        
         for dev in developers:
             dev_id = dev["developer_id"]
             
-            # 프로필 텍스트 생성 및 임베딩
-            profile_text = self._create_profile_text(dev)
-            profile_embedding = self.embedding_model.encode(profile_text).tolist()
-            
-            # 프로필 컬렉션에 추가
-            self.collections['profiles'].add(
-                ids=[f"profile_{dev_id}"],
-                embeddings=[profile_embedding],
-                documents=[profile_text],
-                metadatas=[{
-                    "developer_id": dev_id,
-                    "name": dev["name"],
-                    "location": dev["location"],
-                    "seniority": dev["seniority"],
-                    "primary_role": dev["primary_role"],
-                    "years_experience": dev["years_experience"],
-                    "availability": dev["availability"],
-                    "salary_range": dev["salary_range"]
-                }]
-            )
+            # 같은 ID가 중복되면 먼저 나온 항목 유지 (개별 추가 시 동작과 동일)
+            if f"profile_{dev_id}" not in entries['profiles']:
+                metadata = self._create_profile_metadata(dev)
+                if stamps is not None:
+                    metadata[INDEX_STAMP_FIELD] = stamps.get(dev_id, "")
+                entries['profiles'][f"profile_{dev_id}"] = (self._create_profile_text(dev), metadata)
             
-            # 기술 스택 추가
+            # 기술 스택
             for skill in dev["skills"]:
-                skill_text = self._create_skill_text(dev, skill)
-                skill_embedding = self.embedding_model.encode(skill_text).tolist()
-                
-                self.collections['skills'].add(
-                    ids=[f"skill_{dev_id}_{skill['name']}"],
-                    embeddings=[skill_embedding],
-                    documents=[skill_text],
-                    metadatas=[{
+                entries['skills'].setdefault(f"skill_{dev_id}_{skill['name']}", (
+                    self._create_skill_text(dev, skill),
+                    {
                         "developer_id": dev_id,
                         "developer_name": dev["name"],
                         "skill_name": skill["name"],
                         "skill_level": skill["level"],
                         "years_used": skill["years"],
                         "seniority": dev["seniority"]
-                    }]
-                )
+                    }
+                ))
             
-            # 경력 추가
+            # 경력
             for exp in dev["experience"]:
-                exp_text = self._create_experience_text(dev, exp)
-                exp_embedding = self.embedding_model.encode(exp_text).tolist()
-                
-                self.collections['experience'].add(
-                    ids=[f"exp_{dev_id}_{exp['company']}"],
-                    embeddings=[exp_embedding],
-                    documents=[exp_text],
-                    metadatas=[{
+                entries['experience'].setdefault(f"exp_{dev_id}_{exp['company']}", (
+                    self._create_experience_text(dev, exp),
+                    {
                         "developer_id": dev_id,
                         "developer_name": dev["name"],
                         "company": exp["company"],
@@ -176,10 +817,148 @@ class SearchEngine:
                         "duration_months": exp["duration_months"],
                         "industry": exp["industry"],
                         "seniority": dev["seniority"]
-                    }]
+                    }
+                ))
+        
+        return entries
+    
+    def _write_index_entries(self, entries: Dict[str, Dict[str, tuple]], embeddings: Dict[str, Any],
+                             collections: Dict[str, Any] = None) -> Dict[str, Dict]:
+        """임베딩된 항목을 컬렉션(기본: 사용 중인 세트)에 추가하고 기록된 개발자별 프로필 메타데이터 반환"""
+        collections = collections or self.collections
+        # Chroma 한 번의 add 요청 최대 항목 수 단위로 나눠 기록
+        batch_size = self.client.get_max_batch_size()
+        for name, items in entries.items():
+            if not items:
+                continue
+            ids = list(items.keys())
+            values = list(items.values())
+            for start in range(0, len(ids), batch_size):
+                end = start + batch_size
+                collections[name].add(
+                    ids=ids[start:end],
+                    embeddings=[embedding.tolist() for embedding in embeddings[name][start:end]],
+                    documents=[text for text, _ in values[start:end]],
+                    metadatas=[metadata for _, metadata in values[start:end]]
                 )
+        return {metadata["developer_id"]: metadata for _, metadata in entries['profiles'].values()}
+    
+    def delete_developers(self, developer_ids: List[str]) -> None:
+        """개발자 데이터를 벡터 DB에서 삭제 (재색인 중이면 새 세트에서도 삭제)"""
+        if not developer_ids:
+            return
+        logger.info(f"개발자 데이터 삭제: {len(developer_ids)}명")
         
-        logger.info("벡터 DB 데이터 추가 완료")
+        with self._index_lock.read(), self._write_locks.hold(developer_ids):
+            self._delete_entries(developer_ids, self._active.collections)
+            target = self._reindex_target
+            if target is not None:
+                try:
+                    self._delete_entries(developer_ids, target.collections)
+                except Exception as e:
+                    logger.warning(f"재색인 세트 기록 실패 (버전 {target.version}): {e}")
+            self._notify_write({}, list(developer_ids))
+        
+        self._bump_generation()
+    
+    @staticmethod
+    def _delete_entries(developer_ids: List[str], collections: Dict[str, Any]) -> None:
+        collections['profiles'].delete(ids=[f"profile_{dev_id}" for dev_id in developer_ids])
+        where = {"developer_id": {"$in": list(developer_ids)}}
+        collections['skills'].delete(where=where)
+        collections['experience'].delete(where=where)
+    
+    def update_developer(self, developer: Dict) -> None:
+        """개발자 데이터 갱신 (기존 기술/경력 항목은 교체)"""
+        self.update_developers([developer])
+    
+    def update_developers(self, developers: List[Dict]) -> None:
+        """개발자 데이터 일괄 갱신 - 같은 개발자에 대한 동시 쓰기는 직렬화"""
+        if not developers:
+            return
+        self._write_developers(developers)
+        self._bump_generation()
+    
+    def update_developers_parallel(self, developers: List[Dict], embedding_pool: EmbeddingPool,
+                                   batch_size: int = 64) -> Iterator[int]:
+        """멀티 프로세스 임베딩으로 대량 갱신 - 배치별 임베딩을 입력 순서대로 받아 기록하고 처리 건수 반환
+        
+        도중에 세트가 다른 모델로 교체되면 해당 배치는 이 프로세스에서 다시 임베딩한다.
+        """
+        def encode_batches():
+            for start in range(0, len(developers), batch_size):
+                batch = developers[start:start + batch_size]
+                entries = self._build_index_entries(batch)
+                texts = [text for items in entries.values() for text, _ in items.values()]
+                yield (batch, entries), texts
+        
+        for (batch, entries), vectors in embedding_pool.imap(encode_batches()):
+            # 하나의 임베딩 배열을 컬렉션별로 분할
+            embeddings, offset = {}, 0
+            for name, items in entries.items():
+                embeddings[name] = vectors[offset:offset + len(items)]
+                offset += len(items)
+            
+            self._write_developers(batch, encoded=(entries, embeddings, embedding_pool.model_name))
+            self._bump_generation()
+            yield len(batch)
+    
+    def _create_profile_metadata(self, dev: Dict) -> Dict[str, Any]:
+        """프로필 메타데이터 생성 (회사/기술/연봉 필터 필드 포함)"""
+        metadata = {
+            "developer_id": dev["developer_id"],
+            "name": dev["name"],
+            "location": dev["location"],
+            "seniority": dev["seniority"],
+            "primary_role": dev["primary_role"],
+            "years_experience": dev["years_experience"],
+            "availability": dev["availability"],
+            "salary_range": dev["salary_range"],
+            # 재색인 시 프로필 텍스트 복원용
+            "education_degree": dev["education"]["degree"],
+            "education_major": dev["education"]["major"],
+            "github_stars": dev["github_stars"],
+            "stackoverflow_reputation": dev.get("stackoverflow_reputation", 0),
+            # 재색인 시 두 세트의 개발자별 최신 여부 대조용
+            INDEX_STAMP_FIELD: new_index_stamp()
+        }
+        metadata.update(build_profile_filter_fields(dev))
+        return metadata
+    
+    def backfill_profile_fields(self, batch_size: int = 500) -> int:
+        """비정규화 필터 필드가 없는 기존 프로필에 필드 추가 (기존 저장소 마이그레이션)"""
+        profiles = self.collections['profiles'].get(include=['metadatas'])
+        stale = [(pid, meta) for pid, meta in zip(profiles['ids'], profiles['metadatas']) if not has_filter_fields(meta)]
+        if not stale:
+            return 0
+        
+        logger.info(f"프로필 필터 필드 생성 시작: {len(stale)}명")
+        
+        # 기술/경력 컬렉션에서 개발자별 기술명과 회사명 수집
+        skills_by_dev: Dict[str, List[Dict]] = {}
+        for meta in self.collections['skills'].get(include=['metadatas'])['metadatas']:
+            skills_by_dev.setdefault(meta['developer_id'], []).append({"name": meta['skill_name']})
+        experience_by_dev: Dict[str, List[Dict]] = {}
+        for meta in self.collections['experience'].get(include=['metadatas'])['metadatas']:
+            experience_by_dev.setdefault(meta['developer_id'], []).append({"company": meta['company']})
+        
+        for start in range(0, len(stale), batch_size):
+            batch = stale[start:start + batch_size]
+            metadatas = []
+            for _, meta in batch:
+                dev_id = meta['developer_id']
+                fields = build_profile_filter_fields({
+                    "salary_range": meta.get('salary_range'),
+                    "skills": skills_by_dev.get(dev_id, []),
+                    "experience": experience_by_dev.get(dev_id, [])
+                })
+                metadatas.append({**meta, **fields})
+            self.collections['profiles'].update(ids=[pid for pid, _ in batch], metadatas=metadatas)
+            self._notify_write({meta['developer_id']: meta for meta in metadatas}, [])
+        
+        self._bump_generation()
+        logger.info(f"프로필 필터 필드 생성 완료: {len(stale)}명")
+        return len(stale)
     
     def _create_profile_text(self, dev: Dict) -> str:
         """개발자 통합 프로필 텍스트 생성"""
@@ -215,127 +994,548 @@ class SearchEngine:
         총 경력: {dev['years_experience']}년
         """
     
-    def search_developers(self, query: str, search_type: str = "comprehensive", limit: int = DEFAULT_SEARCH_LIMIT) -> List[Dict]:
-        """개발자 검색"""
-        logger.info(f"검색 실행: '{query}' (타입: {search_type}, 제한: {limit})")
-        
+    def search_developers(self, query: str, search_type: str = "comprehensive", limit: int = DEFAULT_SEARCH_LIMIT,
+                          filter_mode: str = None, fields: Tuple[str, ...] = None) -> List[Dict]:
+        """개발자 검색 (응답 캐시 우선 조회, fields: 반환할 필드 목록 - 없으면 전체)"""
         # 제한 검증
         limit = min(limit, MAX_SEARCH_LIMIT)
+        filter_engine = self.get_filter_engine(filter_mode)
+        self.query_log.record(query, search_type, filter_engine.user_config, limit)
+        with self.slow_query_log.trace("search_developers", query=query, search_type=search_type, limit=limit,
+                                       filter_mode=filter_engine.user_config,
+                                       fields=list(fields) if fields else None) as trace:
+            results, _ = self._cached_search(query, search_type, limit, filter_engine)
+            with trace.stage("finalize"):
+                return self._finalize_results([results], search_type, fields)[0]
+    
+    def warm_query(self, query: str, search_type: str, limit: int, filter_mode: str = None) -> bool:
+        """캐시 워밍업 - 쿼리 로그에 기록하지 않고 임베딩/응답 캐시만 채움 (새로 계산했으면 True)"""
+        filter_engine = self.get_filter_engine(filter_mode)
+        _, computed = self._cached_search(query, search_type, min(limit, MAX_SEARCH_LIMIT), filter_engine)
+        return computed
+    
+    def _cached_search(self, query: str, search_type: str, limit: int,
+                       filter_engine: DynamicFilterEngine) -> Tuple[List[Dict], bool]:
+        """응답 캐시 우선 검색 - (결과, 새로 계산했는지)"""
+        cache_key = self.result_cache.make_key(query, search_type, filter_engine.user_config, limit)
+        trace = current_trace()
+        with trace.stage("result_cache"):
+            cached = self.result_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"캐시 적중: '{query}' (타입: {search_type}, 제한: {limit})")
+            trace.set(result_cache="hit")
+            return cached, False
+        
+        # 같은 세대의 동일 검색은 진행 중인 계산 하나의 결과를 공유
+        generation = self.index_generation
+        results, shared = self._single_flight.do(
+            (cache_key, generation), self._search_and_cache,
+            cache_key, generation, query, search_type, limit, filter_engine
+        )
+        trace.set(result_cache="shared" if shared else "miss")
+        if shared:
+            logger.info(f"진행 중인 동일 검색 결과 공유: '{query}'")
+        return results, not shared
+    
+    def _search_and_cache(self, cache_key: str, generation: int, query: str, search_type: str, limit: int,
+                          filter_engine: DynamicFilterEngine) -> List[Dict]:
+        """검색 실행 후 응답 캐시에 저장 (반환할 페이지만 사전으로 변환)"""
+        # 계산 시작 시점의 세대로 저장해야 도중의 쓰기로 인한 오래된 결과가 남지 않음
+        with self._use_index_set():
+            hits = self._search_developers(query, search_type, limit, filter_engine)
+        results = [hit.to_dict() for hit in hits] if hits is not None else None
+        self.result_cache.set(cache_key, results, generation)
+        return results
+    
+    def _search_developers(self, query: str, search_type: str, limit: int, filter_engine: DynamicFilterEngine) -> List[SearchHit]:
+        """개발자 검색 실행"""
+        logger.info(f"검색 실행: '{query}' (타입: {search_type}, 제한: {limit})")
         
+        trace = current_trace()
         # 쿼리에서 조건 추출 (동적 필터 엔진 사용)
-        extracted_filters = self.filter_engine.extract_filters(query)
+        with trace.stage("extract_filters"):
+            extracted_filters = filter_engine.extract_filters(query)
+        with trace.stage("plan"):
+            plan = self.query_planner.plan(extracted_filters, search_type, limit, filter_engine.strict_mode)
+        logger.info(f"실행 계획: {plan.strategy} ({plan.reason})")
+        trace.set(extracted_filters=extracted_filters, strict_mode=filter_engine.strict_mode, plan=plan.to_dict())
         
-        query_embedding = self.embedding_model.encode(query).tolist()
+        with trace.stage("encode"):
+            query_embeddings = self._encode_queries([query])
+        results = self._execute_plan(plan, query_embeddings, search_type)[0]
+        if results is None:
+            return None
         
+        with trace.stage("filter"):
+            filtered_results = filter_engine.apply_filters(results, extracted_filters, limit)
+        trace.add_count("candidates_before_filter", len(results))
+        trace.add_count("candidates_after_filter", len(filtered_results))
+        return filtered_results[:limit]
+    
+    def _encode_queries(self, queries: List[str]) -> List[List[float]]:
+        """쿼리 임베딩 (캐시에 없는 쿼리만 한 번에 인코딩)"""
+        index_set = self.index_set
+        embeddings: List[Optional[List[float]]] = [
+            self.embedding_cache.get(query, index_set.model_name) for query in queries
+        ]
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        current_trace().add_count("embedding_cache_hits", len(queries) - len(missing))
+        if missing:
+            encoded = index_set.embedding_model.encode([queries[i] for i in missing]).tolist()
+            for i, embedding in zip(missing, encoded):
+                embeddings[i] = embedding
+                self.embedding_cache.set(queries[i], embedding, index_set.model_name)
+        return embeddings
+    
+    def plan_search(self, query: str, search_type: str = "comprehensive", limit: int = DEFAULT_SEARCH_LIMIT,
+                    filter_mode: str = None) -> QueryPlan:
+        """검색 실행 계획 조회 (디버깅용, 검색은 실행하지 않음)"""
+        limit = min(limit, MAX_SEARCH_LIMIT)
+        filter_engine = self.get_filter_engine(filter_mode)
+        return self.query_planner.plan(filter_engine.extract_filters(query), search_type, limit, filter_engine.strict_mode)
+    
+    def _execute_plan(self, plan: QueryPlan, query_embeddings: List[List[float]], search_type: str) -> List[List[SearchHit]]:
+        """실행 계획에 따라 후보 검색 (같은 계획의 쿼리 여러 개를 한 번에 처리)"""
+        if search_type not in ("profile_only", "comprehensive"):
+            return [None] * len(query_embeddings)
+        
+        if plan.strategy == PLAN_FILTER_FIRST:
+            candidates = self._filter_first_search(plan, query_embeddings, search_type)
+            if not plan.fill:
+                return candidates
+            # 필터 일치 후보 뒤에 기본 조회 범위의 부분 일치 후보 추가
+            window = self._vector_first_search(plan.fetch, None, query_embeddings, search_type)
+            return [self._union_hits(matched, extra) for matched, extra in zip(candidates, window)]
+        
+        return self._vector_first_search(plan.fetch, plan.where, query_embeddings, search_type)
+    
+    def _vector_first_search(self, fetch: int, where: Optional[Dict[str, Any]], query_embeddings: List[List[float]],
+                             search_type: str) -> List[List[SearchHit]]:
+        """벡터 우선 실행 - 인덱스 검색 후 병합 (필터는 호출한 쪽에서 적용)"""
         if search_type == "profile_only":
-            # 단일 인덱스 검색
-            results = self.collections['profiles'].query(
-                query_embeddings=[query_embedding],
-                n_results=limit * 3,  # 더 많은 결과를 가져와서 필터링
-                include=['documents', 'metadatas', 'distances']
+            results = self._query_index('profiles', query_embeddings, fetch, where)
+            return [self._format_simple_results(results, i) for i in range(len(query_embeddings))]
+        
+        # 다중 인덱스 검색
+        trace = current_trace()
+        index_results = self._query_indexes(query_embeddings, fetch * 2)
+        with trace.stage("merge"):
+            candidates = [self._merge_index_results(*index_results, index=i) for i in range(len(query_embeddings))]
+        with trace.stage("hydrate"):
+            self._hydrate_profile_metadata(candidates)
+        return candidates
+    
+    @staticmethod
+    def _union_hits(primary: List[SearchHit], extra: List[SearchHit]) -> List[SearchHit]:
+        """두 후보 목록 합치기 (같은 개발자는 primary 우선, 점수 내림차순)"""
+        seen = {hit.developer_id for hit in primary}
+        combined = primary + [hit for hit in extra if hit.developer_id not in seen]
+        combined.sort(key=lambda hit: hit.total_score if hit.total_score is not None else hit.score, reverse=True)
+        return combined
+    
+    def _filter_first_search(self, plan: QueryPlan, query_embeddings: List[List[float]],
+                             search_type: str) -> List[List[SearchHit]]:
+        """필터 우선 실행 - 조건에 맞는 개발자의 저장된 임베딩만 가져와 정확한 거리로 점수 계산
+        
+        인덱스별로 후보 안에서 가장 가까운 항목을 고르므로 벡터 우선 검색과 같은 방식으로 병합된다.
+        일치 개발자가 예상보다 많아 조회 상한을 넘으면 상한 조회 수의 벡터 우선 실행으로 전환한다.
+        """
+        trace = current_trace()
+        max_matches = self.query_planner.filter_first_limit
+        with trace.stage("fetch_profiles"):
+            profiles = self.collections['profiles'].get(
+                where=plan.where, include=['embeddings', 'metadatas'], limit=max_matches + 1
             )
-            filtered_results = self.filter_engine.apply_filters(self._format_simple_results(results), extracted_filters)
-            return filtered_results[:limit]
-        
-        elif search_type == "comprehensive":
-            # 다중 인덱스 검색
-            results = self._multi_index_search(query_embedding, limit * 3)
-            filtered_results = self.filter_engine.apply_filters(results, extracted_filters)
-            return filtered_results[:limit]
-    
-    def _multi_index_search(self, query_embedding: List[float], limit: int) -> List[Dict]:
-        """다중 인덱스 종합 검색"""
-        
-        # 각 인덱스에서 검색
-        profile_results = self.collections['profiles'].query(
-            query_embeddings=[query_embedding],
-            n_results=limit * 2,
-            include=['documents', 'metadatas', 'distances']
-        )
+        trace.add_count("profiles_matched", len(profiles['ids']))
+        if len(profiles['ids']) > max_matches:
+            logger.warning(f"필터 우선 후보가 상한({max_matches}명)을 넘어 벡터 우선으로 전환 "
+                           f"(예상 {plan.estimated_matches:.0f}명)")
+            trace.set(filter_first_overflow=True)
+            fetch = max(plan.fetch, self.query_planner.max_fetch)
+            return self._vector_first_search(fetch, plan.where if search_type == "profile_only" else None,
+                                             query_embeddings, search_type)
+        logger.info(f"필터 우선 후보: {len(profiles['ids'])}명 (예상 {plan.estimated_matches:.0f}명)")
+        if search_type == "profile_only":
+            return [
+                self._format_simple_results(self._exact_query('profiles', [embedding], profiles, len(profiles['ids'])))
+                for embedding in query_embeddings
+            ]
         
-        skill_results = self.collections['skills'].query(
-            query_embeddings=[query_embedding], 
-            n_results=limit * 2,
-            include=['documents', 'metadatas', 'distances']
-        )
+        developer_ids = [metadata['developer_id'] for metadata in profiles['metadatas']]
+        if not developer_ids:
+            return [[] for _ in query_embeddings]
+        where = {"developer_id": {"$in": developer_ids}}
         
-        exp_results = self.collections['experience'].query(
-            query_embeddings=[query_embedding],
-            n_results=limit * 2,
-            include=['documents', 'metadatas', 'distances']
+        def fetch(name: str) -> Dict[str, Any]:
+            trace = current_trace()
+            with trace.stage(f"fetch_{name}"):
+                result = self.collections[name].get(where=where, include=['embeddings', 'metadatas'])
+            trace.add_count(f"{name}_matched", len(result['ids']))
+            return result
+        
+        fetched = {'profiles': profiles}
+        fetched['skills'], fetched['experience'] = self._for_each_index(('skills', 'experience'), fetch)
+        n_results = plan.fetch * 2
+        with trace.stage("exact_scoring"):
+            index_results = [
+                self._exact_query(name, query_embeddings, fetched[name], n_results)
+                for name in ('profiles', 'skills', 'experience')
+            ]
+        with trace.stage("merge"):
+            candidates = [self._merge_index_results(*index_results, index=i) for i in range(len(query_embeddings))]
+        with trace.stage("hydrate"):
+            self._hydrate_profile_metadata(candidates)
+        return candidates
+    
+    def _two_stage_query(self, name: str, compact_index: CompactIndex, query_embeddings: List[List[float]],
+                         n_results: int, candidates: int) -> Dict[str, Any]:
+        """2단계 검색 - 축소 벡터로 넓게 후보를 찾고 원본 임베딩으로 재점수 (Chroma query 결과와 같은 형식)
+        
+        메타데이터는 재점수 후 남은 상위 항목만 컬렉션에서 읽는다.
+        """
+        rescored = compact_index.search(np.asarray(query_embeddings, dtype=np.float32), candidates, n_results)
+        unique_ids = list(dict.fromkeys(entry_id for hits in rescored for entry_id, _ in hits))
+        metadatas = {}
+        if unique_ids:
+            fetched = self.collections[name].get(ids=unique_ids, include=['metadatas'])
+            metadatas = dict(zip(fetched['ids'], fetched['metadatas']))
+        
+        results = {'ids': [], 'metadatas': [], 'distances': []}
+        for hits in rescored:
+            # 1단계 이후 삭제된 항목 제외
+            hits = [(entry_id, distance) for entry_id, distance in hits if entry_id in metadatas]
+            results['ids'].append([entry_id for entry_id, _ in hits])
+            results['metadatas'].append([metadatas[entry_id] for entry_id, _ in hits])
+            results['distances'].append([distance for _, distance in hits])
+        return results
+    
+    def _exact_query(self, name: str, query_embeddings: List[List[float]], fetched: Dict[str, Any],
+                     n_results: int) -> Dict[str, Any]:
+        """조회한 항목 대상 정확한 최근접 검색 (Chroma query 결과와 같은 형식)"""
+        results = {'ids': [], 'metadatas': [], 'distances': []}
+        if not fetched['ids']:
+            return {key: [[] for _ in query_embeddings] for key in results}
+        
+        vectors = np.asarray(fetched['embeddings'], dtype=np.float32)
+        space = self.collection_spaces[name]
+        for embedding in query_embeddings:
+            distances = exact_distances(np.asarray(embedding, dtype=np.float32), vectors, space)
+            count = min(n_results, len(distances))
+            top = np.argpartition(distances, count - 1)[:count]
+            top = top[np.argsort(distances[top], kind='stable')]
+            results['ids'].append([fetched['ids'][i] for i in top])
+            results['metadatas'].append([fetched['metadatas'][i] for i in top])
+            results['distances'].append(distances[top].tolist())
+        return results
+    
+    def search_developers_batch(self, queries: List[str], search_type: str = "comprehensive",
+                                limit: int = DEFAULT_SEARCH_LIMIT, filter_mode: str = None,
+                                fields: Tuple[str, ...] = None) -> List[List[Dict]]:
+        """여러 쿼리를 한 번에 검색 (입력 순서대로 결과 반환)"""
+        limit = min(limit, MAX_SEARCH_LIMIT)
+        filter_engine = self.get_filter_engine(filter_mode)
+        generation = self.index_generation
+        
+        # 캐시 적중분은 바로 사용하고, 미스는 정규화된 키 기준으로 중복 제거
+        batch_results: List[List[Dict]] = [None] * len(queries)
+        pending: Dict[str, List[int]] = {}
+        for i, query in enumerate(queries):
+            self.query_log.record(query, search_type, filter_engine.user_config, limit)
+            cache_key = self.result_cache.make_key(query, search_type, filter_engine.user_config, limit)
+            if cache_key in pending:
+                pending[cache_key].append(i)
+                continue
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                batch_results[i] = cached
+            else:
+                pending[cache_key] = [i]
+        
+        if pending:
+            cache_keys = list(pending.keys())
+            miss_queries = [queries[pending[key][0]] for key in cache_keys]
+            logger.info(f"배치 검색 실행: {len(queries)}개 쿼리 (계산 {len(miss_queries)}개, 타입: {search_type}, 제한: {limit})")
+            
+            with self._use_index_set():
+                computed = self._search_developers_batch(miss_queries, search_type, limit, filter_engine)
+            for cache_key, results in zip(cache_keys, computed):
+                self.result_cache.set(cache_key, results, generation)
+                for i in pending[cache_key]:
+                    batch_results[i] = copy.deepcopy(results)
+        
+        return self._finalize_results(batch_results, search_type, fields)
+    
+    def _search_developers_batch(self, queries: List[str], search_type: str, limit: int,
+                                 filter_engine: DynamicFilterEngine) -> List[List[Dict]]:
+        """배치 검색 실행 - 임베딩은 한 번의 모델 호출, 같은 실행 계획의 쿼리는 컬렉션별 질의 한 번씩
+        
+        쿼리별 결과는 search_developers와 같도록 실행 계획(조회 수, where 절)이 같은 쿼리끼리 묶는다.
+        """
+        if search_type not in ("profile_only", "comprehensive"):
+            return [None] * len(queries)
+        query_embeddings = self._encode_queries(queries)
+        
+        extracted = [filter_engine.extract_filters(query) for query in queries]
+        groups: Dict[str, tuple] = {}
+        for i, filters in enumerate(extracted):
+            plan = self.query_planner.plan(filters, search_type, limit, filter_engine.strict_mode)
+            # 필터 우선 계획은 where 절마다, 벡터 우선 계획은 조회 수와 where 절이 같은 쿼리끼리 실행
+            key = json.dumps([plan.strategy, plan.fetch, plan.where, plan.fill], sort_keys=True, ensure_ascii=False, default=str)
+            groups.setdefault(key, (plan, []))[1].append(i)
+        
+        candidates: List[List[SearchHit]] = [None] * len(queries)
+        for plan, indices in groups.values():
+            results = self._execute_plan(plan, [query_embeddings[i] for i in indices], search_type)
+            for i, result in zip(indices, results):
+                candidates[i] = result
+        
+        # 필터 적용은 쿼리별로 수행
+        batch_results = []
+        for filters, query_candidates in zip(extracted, candidates):
+            filtered_results = filter_engine.apply_filters(query_candidates, filters, limit)
+            batch_results.append([hit.to_dict() for hit in filtered_results[:limit]])
+        return batch_results
+    
+    def search_developers_progressive(self, query: str, search_type: str = "comprehensive",
+                                      limit: int = DEFAULT_SEARCH_LIMIT, filter_mode: str = None,
+                                      fields: Tuple[str, ...] = None) -> Iterator[Dict[str, Any]]:
+        """단계별 검색 결과 생성 (필터 → 임시 순위 → 보정된 순위 → 최종 순위)
+        
+        최종 순위는 search_developers와 동일하며 응답 캐시에도 저장된다.
+        """
+        limit = min(limit, MAX_SEARCH_LIMIT)
+        filter_engine = self.get_filter_engine(filter_mode)
+        
+        # 추출된 필터는 인덱스 검색 전에 바로 전달
+        extracted_filters = filter_engine.extract_filters(query)
+        yield {
+            "event": "filters",
+            "extracted_filters": extracted_filters,
+            "filter_info": filter_engine.get_filter_info(extracted_filters)
+        }
+        
+        # 단일 인덱스 검색은 중간 단계가 없으므로 바로 최종 결과 전달
+        if search_type != "comprehensive":
+            results = self.search_developers(query, search_type, limit, filter_mode, fields)
+            yield {"event": "final", "stages": [search_type], "results": results}
+            return
+        
+        self.query_log.record(query, search_type, filter_engine.user_config, limit)
+        cache_key = self.result_cache.make_key(query, search_type, filter_engine.user_config, limit)
+        cached = self.result_cache.get(cache_key)
+        if cached is not None:
+            yield {"event": "final", "stages": ["cache"], "results": self._finalize_results([cached], search_type, fields)[0]}
+            return
+        
+        # 필터 우선 계획은 중간 단계 없이 최종 결과 전달
+        plan = self.query_planner.plan(extracted_filters, search_type, limit, filter_engine.strict_mode)
+        if plan.strategy == PLAN_FILTER_FIRST:
+            results = self.search_developers(query, search_type, limit, filter_mode, fields)
+            yield {"event": "final", "stages": [plan.strategy], "results": results}
+            return
+        
+        logger.info(f"단계별 검색 실행: '{query}' (제한: {limit}, 조회 수: {plan.fetch})")
+        generation = self.index_generation
+        yield from self._progressive_ranks(query, search_type, limit, fields, filter_engine, extracted_filters,
+                                           plan, cache_key, generation)
+    
+    def _progressive_ranks(self, query: str, search_type: str, limit: int, fields: Tuple[str, ...],
+                           filter_engine: DynamicFilterEngine, extracted_filters: Dict[str, Any], plan: QueryPlan,
+                           cache_key: str, generation: int) -> Iterator[Dict[str, Any]]:
+        """세 인덱스를 동시에 검색하고 끝나는 순서대로 순위 갱신
+        
+        시작 시점의 세트를 단계마다 고정해 쓰고 결과를 내보내는 동안에는 고정을 풀어 둔다
+        (생성기는 느린 클라이언트를 기다리거나 요청마다 다른 스레드에서 재개될 수 있음).
+        """
+        index_set = self._active
+        with self._use_index_set(index_set):
+            query_embedding = self._encode_queries([query])[0]
+        n_results = plan.fetch * 2
+        futures = {
+            self._index_executor.submit(self._run_in_index_set, index_set, self._query_index,
+                                        name, [query_embedding], n_results): name
+            for name in ('profiles', 'skills', 'experience')
+        }
+        index_results = {}
+        profile_metadata = {}
+        for future in as_completed(futures):
+            index_results[futures[future]] = future.result()
+            with self._use_index_set(index_set):
+                merged = self._merge_index_results(
+                    index_results.get('profiles'), index_results.get('skills'), index_results.get('experience')
+                )
+                self._hydrate_profile_metadata([merged], profile_metadata)
+                results = [hit.to_dict() for hit in filter_engine.apply_filters(merged, extracted_filters, limit)[:limit]]
+                stages = [name for name in ('profiles', 'skills', 'experience') if name in index_results]
+                final = len(index_results) == len(futures)
+                if final:
+                    self.result_cache.set(cache_key, results, generation)
+                event = "final" if final else "provisional" if len(index_results) == 1 else "refined"
+                payload = {"event": event, "stages": stages, "results": self._finalize_results([results], search_type, fields)[0]}
+            yield payload
+    
+    def _run_in_index_set(self, index_set: IndexSet, task: Callable[..., Any], *args) -> Any:
+        """작업 스레드에서 세트를 고정해 실행"""
+        with self._use_index_set(index_set):
+            return task(*args)
+    
+    def _finalize_results(self, result_lists: List[List[Dict]], search_type: str,
+                          fields: Tuple[str, ...] = None) -> List[List[Dict]]:
+        """반환할 페이지 구성 - 요청한 필드만 남기고 프로필 문서는 필요할 때 페이지 분량만 조회
+        
+        fields가 없으면 기존 응답 형식 (단일 인덱스 검색은 프로필 문서 포함)을 그대로 유지한다.
+        """
+        with_documents = needs_documents(fields) if fields is not None else search_type == "profile_only"
+        if with_documents:
+            documents = self._profile_documents({
+                result['developer_id'] for results in result_lists if results for result in results
+            })
+            result_lists = [
+                [{**result, 'document': documents.get(result['developer_id'])} for result in results]
+                if results is not None else None
+                for results in result_lists
+            ]
+        if fields is None:
+            return result_lists
+        return [
+            [project_result(result, fields) for result in results] if results is not None else None
+            for results in result_lists
+        ]
+    
+    def _profile_documents(self, developer_ids) -> Dict[str, str]:
+        """개발자 ID별 프로필 문서 조회"""
+        if not developer_ids:
+            return {}
+        fetched = self.collections['profiles'].get(
+            ids=[f"profile_{dev_id}" for dev_id in developer_ids],
+            include=['documents']
         )
+        return {
+            profile_id[len("profile_"):]: document
+            for profile_id, document in zip(fetched['ids'], fetched['documents'])
+        }
+    
+    def _hydrate_profile_metadata(self, result_lists: List[List[SearchHit]], known: Dict[str, Dict] = None) -> None:
+        """기술/경력 인덱스로만 찾은 개발자의 메타데이터를 프로필 메타데이터로 교체
         
-        # 개발자별 점수 집계
-        developer_scores = {}
+        필터는 프로필의 비정규화 필드로 판정하므로, 누락된 프로필을 ID로 한 번에 조회한다.
+        known: 이미 조회한 프로필 메타데이터 (단계별 검색에서 재사용)
+        """
+        known = known if known is not None else {}
+        missing = {
+            result['developer_id']
+            for results in result_lists for result in results
+            if not has_filter_fields(result.metadata) and result.developer_id not in known
+        }
+        if missing:
+            fetched = self.collections['profiles'].get(
+                ids=[f"profile_{dev_id}" for dev_id in missing],
+                include=['metadatas']
+            )
+            for metadata in fetched['metadatas']:
+                known[metadata['developer_id']] = metadata
         
-        # 프로필 점수
-        if profile_results and 'metadatas' in profile_results and profile_results['metadatas']:
-            for i, metadata in enumerate(profile_results['metadatas'][0]):
-                dev_id = metadata['developer_id']
-                score = 1 - profile_results['distances'][0][i]
-                developer_scores[dev_id] = {
-                    'metadata': metadata,
-                    'profile_score': score * SEARCH_WEIGHTS['profile'],
-                    'total_score': score * SEARCH_WEIGHTS['profile']
-                }
+        for results in result_lists:
+            for result in results:
+                if not has_filter_fields(result.metadata) and result.developer_id in known:
+                    result.metadata = known[result.developer_id]
+    
+    def _query_indexes(self, query_embeddings: List[List[float]], n_results: int) -> tuple:
+        """프로필/기술/경력 인덱스 검색 (쿼리 여러 개를 한 번에 전달)"""
+        return tuple(self._for_each_index(
+            ('profiles', 'skills', 'experience'),
+            lambda name: self._query_index(name, query_embeddings, n_results)
+        ))
+    
+    def _for_each_index(self, names: Tuple[str, ...], task: Callable[[str], Any]) -> List[Any]:
+        """인덱스별 작업 실행 (Chroma 서버 모드는 스레드 풀에서 동시에 요청, 현재 추적과 세트를 작업 스레드에 연결)"""
+        if not self.remote_store or len(names) < 2:
+            return [task(name) for name in names]
+        trace = current_trace()
+        index_set = self.index_set
         
-        # 기술 점수
-        if skill_results and 'metadatas' in skill_results and skill_results['metadatas']:
-            for i, metadata in enumerate(skill_results['metadatas'][0]):
+        def run(name: str):
+            with bind_trace(trace), self._use_index_set(index_set):
+                return task(name)
+        
+        futures = [self._index_executor.submit(run, name) for name in names]
+        return [future.result() for future in futures]
+    
+    def _query_index(self, name: str, query_embeddings: List[List[float]], n_results: int,
+                     where: Dict[str, Any] = None) -> Dict[str, Any]:
+        """단일 인덱스 검색 (병합/필터에 쓰지 않는 문서 본문은 가져오지 않음)
+        
+        결과 행이 많으면 SQLite 변수 수 제한을 넘지 않도록 쿼리를 나눠 질의한다.
+        """
+        # 축소 벡터 인덱스는 그 인덱스를 만든 세트를 검색할 때만 사용
+        compact_index = (
+            self.compact_indexes.get(name) if where is None and self._compact_version == self.index_set.version else None
+        )
+        two_stage = compact_index is not None and compact_index.fitted
+        chunk_size = max(1, MAX_QUERY_ROWS // max(n_results, 1))
+        merged: Dict[str, Any] = {}
+        trace = current_trace()
+        with trace.stage(f"query_{name}"):
+            for start in range(0, len(query_embeddings), chunk_size):
+                chunk = query_embeddings[start:start + chunk_size]
+                if two_stage:
+                    candidates = n_results * (self._two_stage_config.get(name) or {}).get("candidates", 4)
+                    results = self._two_stage_query(name, compact_index, chunk, n_results, candidates)
+                else:
+                    results = self.collections[name].query(
+                        query_embeddings=chunk,
+                        n_results=n_results,
+                        where=where,
+                        include=['metadatas', 'distances']
+                    )
+                for key in ('ids', 'metadatas', 'distances'):
+                    merged.setdefault(key, []).extend(results[key] or [])
+        trace.add_count(f"{name}_candidates", sum(len(ids) for ids in merged.get('ids', [])))
+        if two_stage:
+            trace.set(**{f"{name}_two_stage": self._two_stage_config.get(name)})
+        return merged
+    
+    def _merge_index_results(self, profile_results, skill_results, exp_results, index: int = 0) -> List[SearchHit]:
+        """인덱스별 검색 결과를 개발자 단위로 병합 (index: 배치 내 쿼리 위치)"""
+        # 개발자별 점수 집계 (먼저 찾은 인덱스의 메타데이터 사용)
+        hits: Dict[str, SearchHit] = {}
+        for name, weight_key, results in (
+            ('profiles', 'profile', profile_results),
+            ('skills', 'skills', skill_results),
+            ('experience', 'experience', exp_results)
+        ):
+            if not results or 'metadatas' not in results or not results['metadatas']:
+                continue
+            weight = SEARCH_WEIGHTS[weight_key]
+            distances = results['distances'][index]
+            for i, metadata in enumerate(results['metadatas'][index]):
                 dev_id = metadata['developer_id']
-                score = 1 - skill_results['distances'][0][i]
-                if dev_id in developer_scores:
-                    developer_scores[dev_id]['skill_score'] = score * SEARCH_WEIGHTS['skills']
-                    developer_scores[dev_id]['total_score'] += score * SEARCH_WEIGHTS['skills']
+                score = self._similarity(name, distances[i]) * weight
+                hit = hits.get(dev_id)
+                if hit is None:
+                    hits[dev_id] = SearchHit(dev_id, metadata, total_score=score, experience=[])
+                elif name == 'profiles':
+                    hit.metadata, hit.total_score = metadata, score
                 else:
-                    developer_scores[dev_id] = {
-                        'metadata': metadata,
-                        'skill_score': score * SEARCH_WEIGHTS['skills'],
-                        'total_score': score * SEARCH_WEIGHTS['skills']
-                    }
+                    hit.total_score += score
         
-        # 경력 점수
+        # 경력 정보 수집 (경력 검색 결과를 한 번만 순회)
         if exp_results and 'metadatas' in exp_results and exp_results['metadatas']:
-            for i, metadata in enumerate(exp_results['metadatas'][0]):
-                dev_id = metadata['developer_id']
-                score = 1 - exp_results['distances'][0][i]
-                if dev_id in developer_scores:
-                    developer_scores[dev_id]['exp_score'] = score * SEARCH_WEIGHTS['experience']
-                    developer_scores[dev_id]['total_score'] += score * SEARCH_WEIGHTS['experience']
-                else:
-                    developer_scores[dev_id] = {
-                        'metadata': metadata,
-                        'exp_score': score * SEARCH_WEIGHTS['experience'],
-                        'total_score': score * SEARCH_WEIGHTS['experience']
-                    }
+            for metadata in exp_results['metadatas'][index]:
+                hits[metadata['developer_id']].experience.append({
+                    'company': metadata['company'],
+                    'position': metadata['position'],
+                    'duration_months': metadata['duration_months'],
+                    'industry': metadata['industry']
+                })
         
         # 결과 정렬
-        results = []
-        for dev_id, data in developer_scores.items():
-            # 경력 정보 수집
-            experience_info = []
-            if exp_results and 'metadatas' in exp_results and exp_results['metadatas']:
-                for i, metadata in enumerate(exp_results['metadatas'][0]):
-                    if metadata['developer_id'] == dev_id:
-                        experience_info.append({
-                            'company': metadata['company'],
-                            'position': metadata['position'],
-                            'duration_months': metadata['duration_months'],
-                            'industry': metadata['industry']
-                        })
-            
-            results.append({
-                'developer_id': dev_id,
-                'metadata': data['metadata'],
-                'total_score': data['total_score'],
-                'experience': experience_info
-            })
-        
-        results.sort(key=lambda x: x['total_score'], reverse=True)
+        results = list(hits.values())
+        results.sort(key=lambda x: x.total_score, reverse=True)
         return results
     
-    def _format_simple_results(self, results) -> List[Dict]:
-        """단순 검색 결과 포맷팅"""
+    def _format_simple_results(self, results, index: int = 0) -> List[SearchHit]:
+        """단순 검색 결과 포맷팅 (index: 배치 내 쿼리 위치)"""
         formatted = []
         
         # results가 유효한지 확인
@@ -344,70 +1544,192 @@ class SearchEngine:
             return formatted
         
         try:
-            for i, metadata in enumerate(results['metadatas'][0]):
-                formatted.append({
-                    'developer_id': metadata['developer_id'],
-                    'score': 1 - results['distances'][0][i],
-                    'metadata': metadata,
-                    'document': results['documents'][0][i]
-                })
+            distances = results['distances'][index]
+            for i, metadata in enumerate(results['metadatas'][index]):
+                formatted.append(SearchHit(
+                    metadata['developer_id'],
+                    metadata,
+                    score=self._similarity('profiles', distances[i])
+                ))
             # 매칭도 높은 순으로 정렬
-            formatted.sort(key=lambda x: x['score'], reverse=True)
+            formatted.sort(key=lambda x: x.score, reverse=True)
         except Exception as e:
             logger.error(f"검색 결과 포맷팅 오류: {e}")
         
         return formatted
     
     def search_by_filters(self, filters: Dict, limit: int = DEFAULT_SEARCH_LIMIT) -> List[Dict]:
-        """필터 기반 검색"""
+        """필터 기반 검색 (필터 조건은 프로필 인덱스에서 바로 판정)"""
         logger.info(f"필터 검색: {filters}")
-        
-        # 더미 쿼리로 검색 후 필터링
+        with self.slow_query_log.trace("search_by_filters", filters=filters, limit=limit):
+            return self._search_by_filters(filters, limit)
+    
+    def _search_by_filters(self, filters: Dict, limit: int) -> List[Dict]:
+        """필터 기반 검색 실행"""
+        trace = current_trace()
+        # 더미 쿼리와의 유사도로 정렬
         dummy_query = "개발자"
-        dummy_embedding = self.embedding_model.encode(dummy_query).tolist()
+        with trace.stage("encode"):
+            dummy_embedding = self._encode_queries([dummy_query])[0]
         
         try:
-            results = self.collections['profiles'].query(
-                query_embeddings=[dummy_embedding],
-                n_results=limit * 3,
-                include=['documents', 'metadatas', 'distances']
-            )
+            where = build_where_clause(filters)
+            trace.set(where=where)
+            with trace.stage("query_profiles"):
+                results = self.collections['profiles'].query(
+                    query_embeddings=[dummy_embedding],
+                    n_results=limit,
+                    where=where,
+                    include=['documents', 'metadatas', 'distances']
+                )
+            trace.add_count("profiles_candidates", len(results['ids'][0]) if results and results['ids'] else 0)
             
-            # Python-side 필터링
             filtered_results = []
             if results and 'metadatas' in results and results['metadatas']:
                 for i, metadata in enumerate(results['metadatas'][0]):
-                    if self._matches_filters(metadata, filters):
-                        filtered_results.append({
-                            'developer_id': metadata['developer_id'],
-                            'score': 1 - results['distances'][0][i],
-                            'metadata': metadata,
-                            'document': results['documents'][0][i]
-                        })
-            
-            filtered_results.sort(key=lambda x: x['score'], reverse=True)
-            return filtered_results[:limit]
+                    filtered_results.append(SearchHit(
+                        metadata['developer_id'], metadata,
+                        score=self._similarity('profiles', results['distances'][0][i]),
+                        document=results['documents'][0][i]
+                    ))
+
+            filtered_results.sort(key=lambda hit: hit.score, reverse=True)
+            # 응답에는 회사/기술 플래그 등 내부 필터 필드 제외
+            return [hit.to_dict() for hit in filtered_results[:limit]]
             
         except Exception as e:
             logger.error(f"필터 검색 오류: {e}")
             return []
     
+    def developer_vectors(self, developer_ids: List[str] = None) -> Dict[str, np.ndarray]:
+        """저장된 프로필/기술/경력 임베딩을 검색 가중치로 합친 개발자 벡터 (모델 추론 없음)"""
+        if developer_ids is None:
+            profiles = self.collections['profiles'].get(include=['embeddings', 'metadatas'])
+            skills = self.collections['skills'].get(include=['embeddings', 'metadatas'])
+            experience = self.collections['experience'].get(include=['embeddings', 'metadatas'])
+        else:
+            if not developer_ids:
+                return {}
+            where = {"developer_id": {"$in": list(developer_ids)}}
+            profiles = self.collections['profiles'].get(
+                ids=[f"profile_{dev_id}" for dev_id in developer_ids], include=['embeddings', 'metadatas']
+            )
+            skills = self.collections['skills'].get(where=where, include=['embeddings', 'metadatas'])
+            experience = self.collections['experience'].get(where=where, include=['embeddings', 'metadatas'])
+        
+        parts: Dict[str, Dict[str, List]] = {}
+        for key, results in (('profile', profiles), ('skills', skills), ('experience', experience)):
+            for metadata, embedding in zip(results['metadatas'], results['embeddings']):
+                parts.setdefault(metadata['developer_id'], {}).setdefault(key, []).append(embedding)
+        
+        vectors = {}
+        for dev_id, dev_parts in parts.items():
+            # 프로필이 없는 개발자(삭제 중 등)는 제외
+            if 'profile' not in dev_parts:
+                continue
+            vectors[dev_id] = combine_developer_vector([
+                (SEARCH_WEIGHTS[key], dev_parts.get(key, [])) for key in ('profile', 'skills', 'experience')
+            ])
+        return vectors
+    
+    def configure_two_stage(self, config: Dict[str, Optional[Dict[str, Any]]]) -> None:
+        """컬렉션별 2단계 검색 설정 적용 (None인 컬렉션은 단일 단계 검색)"""
+        self._two_stage_config = config
+        version = self.index_set.version
+        for name in self.collections:
+            params = config.get(name)
+            if not params:
+                with self._compact_lock:
+                    previous = self.compact_indexes.pop(name, None)
+                if previous is not None:
+                    previous.close()
+                continue
+            index = CompactIndex(
+                params["dims"], params.get("method", "pca"), params.get("quantize", True), self.collection_spaces[name],
+                store_path=os.path.join(self.db_path, "two_stage", name)
+            )
+            with self._compact_lock:
+                self._load_compact_index(name, index)
+                self.compact_indexes[name] = index
+        self._compact_version = version
+    
+    def _load_compact_index(self, name: str, index: CompactIndex, batch_size: int = 5000) -> None:
+        """저장된 임베딩 전체로 축소 벡터 인덱스 생성"""
+        collection = self.collections[name]
+        ids, vectors, owners = [], [], []
+        for offset in range(0, collection.count(), batch_size):
+            batch = collection.get(include=['embeddings', 'metadatas'], limit=batch_size, offset=offset)
+            if not batch['ids']:
+                break
+            ids.extend(batch['ids'])
+            vectors.extend(batch['embeddings'])
+            owners.extend(metadata['developer_id'] for metadata in batch['metadatas'])
+        if ids:
+            index.build(ids, np.asarray(vectors, dtype=np.float32), owners)
+    
+    def _update_compact_indexes(self, upserted: Dict[str, Dict], removed: List[str]) -> None:
+        """쓰기 리스너 - 바뀐 개발자의 항목만 다시 읽어 축소 벡터 인덱스 갱신 (전체 재생성과 섞이지 않도록 직렬화)"""
+        with self._compact_lock:
+            self._apply_compact_update(upserted, removed)
+    
+    def _apply_compact_update(self, upserted: Dict[str, Dict], removed: List[str]) -> None:
+        """축소 벡터 인덱스 증분 갱신"""
+        for name, index in list(self.compact_indexes.items()):
+            index.remove_owners(list(upserted) + list(removed))
+            if upserted and index.fitted:
+                fetched = self.collections[name].get(
+                    where={"developer_id": {"$in": list(upserted)}}, include=['embeddings', 'metadatas']
+                )
+                if fetched['ids']:
+                    index.upsert(
+                        fetched['ids'], np.asarray(fetched['embeddings'], dtype=np.float32),
+                        [metadata['developer_id'] for metadata in fetched['metadatas']]
+                    )
+            if not index.fitted or index.needs_refit():
+                # 데이터가 없던 컬렉션이거나 투영 학습 이후 크게 늘어난 경우 전체 재생성
+                self._load_compact_index(name, index)
+    
+    def _update_neighbor_graph(self, upserted: Dict[str, Dict], removed: List[str]) -> None:
+        """쓰기 리스너 - 바뀐 개발자의 벡터만 다시 읽어 이웃 그래프 갱신"""
+        if removed:
+            self.neighbor_graph.remove(removed)
+        if upserted:
+            self.neighbor_graph.upsert(self.developer_vectors(list(upserted)))
+    
+    def find_similar_developers(self, developer_id: str, limit: int = DEFAULT_SEARCH_LIMIT) -> Optional[List[Dict]]:
+        """비슷한 개발자 조회 (이웃 그래프 기반, 없는 개발자면 None)"""
+        neighbors = self.neighbor_graph.neighbors(developer_id, min(limit, SIMILAR_GRAPH_K))
+        if neighbors is None:
+            return None
+        if not neighbors:
+            return []
+        
+        profiles = self.collections['profiles'].get(
+            ids=[f"profile_{dev_id}" for dev_id, _ in neighbors], include=['metadatas']
+        )
+        metadata_by_id = {metadata['developer_id']: metadata for metadata in profiles['metadatas']}
+        return [
+            SearchHit(dev_id, metadata_by_id[dev_id], total_score=similarity).to_dict()
+            for dev_id, similarity in neighbors if dev_id in metadata_by_id
+        ]
+    
     def get_stats(self) -> Dict[str, int]:
-        """데이터베이스 통계"""
-        try:
-            profile_count = self.collections['profiles'].count()
-            skill_count = self.collections['skills'].count()
-            exp_count = self.collections['experience'].count()
-            
-            return {
-                "profiles": profile_count,
-                "skills": skill_count,
-                "experience": exp_count,
-                "total": profile_count + skill_count + exp_count
-            }
-        except Exception as e:
-            logger.error(f"통계 조회 오류: {e}")
-            return {"profiles": 0, "skills": 0, "experience": 0, "total": 0}
+        """데이터베이스 통계 (메모리 내 카운터)"""
+        stats = self.stats_collector.snapshot()
+        return {key: stats[key] for key in ("profiles", "skills", "experience", "total")}
+    
+    def get_detailed_stats(self) -> Dict[str, Any]:
+        """분포/상위 기술·회사/최근 수집 시각을 포함한 통계 (메모리 내 카운터)"""
+        return self.stats_collector.snapshot()
+    
+    def _count_entries(self) -> Dict[str, int]:
+        """기술/경력 컬렉션 항목 수"""
+        return {"skills": self.collections['skills'].count(), "experience": self.collections['experience'].count()}
+    
+    def _load_stats_source(self) -> tuple:
+        """통계 보정용 프로필 메타데이터와 항목 수 조회"""
+        metadatas = self.collections['profiles'].get(include=['metadatas'])['metadatas']
+        return metadatas, self._count_entries()
     
     def _extract_filters_from_query(self, query: str) -> Dict[str, Any]:
         """쿼리에서 필터 조건 추출 (기존 메서드 - 호환성 유지)"""
@@ -416,41 +1738,62 @@ class SearchEngine:
     def _apply_filters_to_results(self, results, filters: Dict[str, Any]) -> List[Dict]:
         """단순 검색 결과에 필터 적용 (기존 메서드 - 호환성 유지)"""
         formatted_results = self._format_simple_results(results)
-        return self.filter_engine.apply_filters(formatted_results, filters)
+        return [hit.to_dict() for hit in self.filter_engine.apply_filters(formatted_results, filters)]
     
-    def _apply_filters_to_comprehensive_results(self, results: List[Dict], filters: Dict[str, Any]) -> List[Dict]:
+    def _apply_filters_to_comprehensive_results(self, results: List[SearchHit], filters: Dict[str, Any]) -> List[Dict]:
         """종합 검색 결과에 필터 적용 (기존 메서드 - 호환성 유지)"""
-        return self.filter_engine.apply_filters(results, filters)
-    
-    def _matches_filters(self, metadata: Dict, filters: Dict[str, Any]) -> bool:
-        """메타데이터가 필터 조건과 일치하는지 확인"""
-        for key, value in filters.items():
-            if key == "min_years_experience":
-                if metadata.get('years_experience', 0) < value:
-                    logger.debug(f"경력 조건 불일치: {metadata.get('years_experience', 0)} < {value}")
-                    return False
-            elif key == "companies":
-                # 회사 경험 확인 (실제로는 더 복잡한 로직이 필요)
-                # 여기서는 간단히 통과시킴
-                pass
-            elif key == "location":
-                if key in metadata and metadata[key] != value:
-                    logger.debug(f"지역 조건 불일치: {metadata.get(key)} != {value}")
-                    return False
-            elif key in metadata and metadata[key] != value:
-                logger.debug(f"조건 불일치: {key} = {metadata.get(key)} != {value}")
-                return False
-        
-        return True
+        return [hit.to_dict() for hit in self.filter_engine.apply_filters(results, filters)]
     
     def get_developer_by_id(self, developer_id: str) -> Dict[str, Any]:
         """개발자 ID로 상세 정보 가져오기"""
+        with self.slow_query_log.trace("get_developer_by_id", developer_id=developer_id) as trace:
+            developer = self._get_developer_by_id(developer_id)
+            trace.set(found=developer is not None)
+            return developer
+    
+    @staticmethod
+    def _developer_from_metadata(metadata: Dict, skill_metadatas: List[Dict], exp_metadatas: List[Dict]) -> Dict[str, Any]:
+        """저장된 프로필/기술/경력 메타데이터로 개발자 데이터 복원 (학력/GitHub 정보가 없던 항목은 기본값)"""
+        return {
+            "developer_id": metadata["developer_id"],
+            "name": metadata["name"],
+            "location": metadata["location"],
+            "seniority": metadata["seniority"],
+            "primary_role": metadata["primary_role"],
+            "years_experience": metadata["years_experience"],
+            "availability": metadata["availability"],
+            "salary_range": metadata["salary_range"],
+            "skills": [
+                {"name": skill["skill_name"], "level": skill["skill_level"], "years": skill["years_used"]}
+                for skill in skill_metadatas
+            ],
+            "experience": [
+                {
+                    "company": exp["company"],
+                    "position": exp["position"],
+                    "duration_months": exp["duration_months"],
+                    "industry": exp["industry"]
+                }
+                for exp in exp_metadatas
+            ],
+            "education": {
+                "degree": metadata.get("education_degree", "학사"),
+                "major": metadata.get("education_major", "컴퓨터공학")
+            },
+            "github_stars": metadata.get("github_stars", 0),
+            "stackoverflow_reputation": metadata.get("stackoverflow_reputation", 0)
+        }
+    
+    def _get_developer_by_id(self, developer_id: str) -> Dict[str, Any]:
+        """개발자 상세 정보 조회 실행"""
+        trace = current_trace()
         try:
             # 프로필 정보 가져오기
-            profile_results = self.collections['profiles'].get(
-                where={"developer_id": developer_id},
-                include=['documents', 'metadatas']
-            )
+            with trace.stage("get_profiles"):
+                profile_results = self.collections['profiles'].get(
+                    where={"developer_id": developer_id},
+                    include=['documents', 'metadatas']
+                )
 
             if not profile_results['metadatas']:
                 return None
@@ -458,55 +1801,22 @@ class SearchEngine:
             metadata = profile_results['metadatas'][0]
 
             # 기술 정보 가져오기
-            skill_results = self.collections['skills'].get(
-                where={"developer_id": developer_id},
-                include=['documents', 'metadatas']
-            )
+            with trace.stage("get_skills"):
+                skill_results = self.collections['skills'].get(
+                    where={"developer_id": developer_id},
+                    include=['documents', 'metadatas']
+                )
 
             # 경력 정보 가져오기
-            exp_results = self.collections['experience'].get(
-                where={"developer_id": developer_id},
-                include=['documents', 'metadatas']
-            )
-
-            # 개발자 데이터 구성
-            developer = {
-                "developer_id": developer_id,
-                "name": metadata["name"],
-                "location": metadata["location"],
-                "seniority": metadata["seniority"],
-                "primary_role": metadata["primary_role"],
-                "years_experience": metadata["years_experience"],
-                "availability": metadata["availability"],
-                "salary_range": metadata["salary_range"],
-                "skills": [],
-                "experience": [],
-                "education": {
-                    "degree": "학사",
-                    "major": "컴퓨터공학"
-                },
-                "github_stars": 0,
-                "stackoverflow_reputation": 0
-            }
-
-            # 기술 정보 추가
-            if skill_results and 'metadatas' in skill_results and skill_results['metadatas']:
-                for i, skill_metadata in enumerate(skill_results['metadatas']):
-                    developer["skills"].append({
-                        "name": skill_metadata["skill_name"],
-                        "level": skill_metadata["skill_level"],
-                        "years": skill_metadata["years_used"]
-                    })
+            with trace.stage("get_experience"):
+                exp_results = self.collections['experience'].get(
+                    where={"developer_id": developer_id},
+                    include=['documents', 'metadatas']
+                )
+            trace.add_count("skills_candidates", len(skill_results['ids']))
+            trace.add_count("experience_candidates", len(exp_results['ids']))
 
-            # 경력 정보 추가
-            if exp_results and 'metadatas' in exp_results and exp_results['metadatas']:
-                for i, exp_metadata in enumerate(exp_results['metadatas']):
-                    developer["experience"].append({
-                        "company": exp_metadata["company"],
-                        "position": exp_metadata["position"],
-                        "duration_months": exp_metadata["duration_months"],
-                        "industry": exp_metadata["industry"]
-                    })
+            developer = self._developer_from_metadata(metadata, skill_results['metadatas'], exp_results['metadatas'])
 
             logger.info(f"개발자 정보 조회: {developer_id}")
             return developer
@@ -0,0 +1,219 @@
+"""
+비슷한 개발자 이웃 그래프
+저장된 임베딩으로 만든 개발자 벡터의 top-k 이웃을 배치로 계산하고 쓰기마다 증분 갱신
+"""
+
+import logging
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+def combine_developer_vector(parts: List[Tuple[float, List[np.ndarray]]]) -> Optional[np.ndarray]:
+    """(가중치, 벡터 목록) 구성 요소를 가중 평균해 정규화된 개발자 벡터 생성"""
+    combined = None
+    for weight, vectors in parts:
+        if not vectors:
+            continue
+        normalized = np.asarray(vectors, dtype=np.float32)
+        normalized /= np.maximum(np.linalg.norm(normalized, axis=1, keepdims=True), 1e-12)
+        contribution = weight * normalized.mean(axis=0)
+        combined = contribution if combined is None else combined + contribution
+
+    if combined is None:
+        return None
+    norm = np.linalg.norm(combined)
+    return combined / norm if norm > 0 else combined
+
+class NeighborGraph:
+    """개발자별 코사인 유사도 top-k 이웃 그래프"""
+
+    def __init__(self, k: int, block_size: int = 1024):
+        """이웃 그래프 초기화"""
+        self.k = k
+        self.block_size = block_size
+        self._lock = threading.RLock()
+        self._reset(0)
+
+    def _reset(self, dimension: int) -> None:
+        """그래프 비우기"""
+        self._ids: List[Optional[str]] = []
+        self._slots: Dict[str, int] = {}
+        self._free: List[int] = []
+        self._vectors = np.zeros((0, dimension), dtype=np.float32)
+        self._alive = np.zeros(0, dtype=bool)
+        # 슬롯별 k번째 이웃 유사도 (이웃이 k개 미만이면 -inf)
+        self._kth = np.zeros(0, dtype=np.float32)
+        self._neighbors: Dict[str, List[Tuple[str, float]]] = {}
+        self._reverse: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, developer_id: str) -> bool:
+        return developer_id in self._slots
+
+    def build(self, vectors: Dict[str, np.ndarray]) -> None:
+        """전체 그래프 배치 생성"""
+        with self._lock:
+            dimension = len(next(iter(vectors.values()))) if vectors else 0
+            self._reset(dimension)
+            for developer_id, vector in vectors.items():
+                self._place(developer_id, vector)
+            self._recompute(list(self._slots))
+            logger.info(f"이웃 그래프 생성 완료: {len(self._slots)}명 (k={self.k})")
+
+    def upsert(self, vectors: Dict[str, np.ndarray]) -> None:
+        """개발자 추가/갱신 - 바뀐 노드와 그 노드를 이웃으로 가진 노드만 다시 계산"""
+        if not vectors:
+            return
+        with self._lock:
+            if self._vectors.shape[1] == 0:
+                self._reset(len(next(iter(vectors.values()))))
+
+            changed = list(vectors)
+            dirty = set()
+            for developer_id in changed:
+                if developer_id in self._slots:
+                    dirty |= self._detach(developer_id)
+                self._place(developer_id, vectors[developer_id])
+
+            # 바뀐 노드의 이웃 목록
+            self._recompute(changed)
+
+            # 기존 노드의 이웃 목록에 바뀐 노드 삽입 (k번째보다 가까운 경우만)
+            changed_set = set(changed)
+            for developer_id in changed:
+                slot = self._slots[developer_id]
+                similarities = self._vectors @ self._vectors[slot]
+                candidates = np.flatnonzero(self._alive & (similarities > self._kth))
+                for other_slot in candidates:
+                    other_id = self._ids[other_slot]
+                    if other_id in changed_set or other_id in dirty:
+                        continue
+                    self._insert_neighbor(other_id, developer_id, float(similarities[other_slot]))
+
+            # 이웃을 잃은 노드는 전체 다시 계산
+            self._recompute([developer_id for developer_id in dirty if developer_id in self._slots and developer_id not in changed_set])
+
+    def remove(self, developer_ids: Iterable[str]) -> None:
+        """개발자 삭제 - 삭제된 노드를 이웃으로 가진 노드만 다시 계산"""
+        with self._lock:
+            dirty = set()
+            for developer_id in developer_ids:
+                if developer_id not in self._slots:
+                    continue
+                dirty |= self._detach(developer_id)
+                slot = self._slots.pop(developer_id)
+                self._ids[slot] = None
+                self._alive[slot] = False
+                self._kth[slot] = -np.inf
+                self._free.append(slot)
+                self._neighbors.pop(developer_id, None)
+                self._reverse.pop(developer_id, None)
+
+            self._recompute([developer_id for developer_id in dirty if developer_id in self._slots])
+
+    def neighbors(self, developer_id: str, limit: int = None) -> Optional[List[Tuple[str, float]]]:
+        """가까운 이웃 (개발자 ID, 유사도) 목록 - 그래프에 없는 개발자면 None"""
+        with self._lock:
+            if developer_id not in self._slots:
+                return None
+            return list(self._neighbors.get(developer_id, [])[:limit or self.k])
+
+    def stats(self) -> Dict[str, int]:
+        """그래프 통계"""
+        with self._lock:
+            return {
+                "nodes": len(self._slots),
+                "k": self.k,
+                "edges": sum(len(neighbors) for neighbors in self._neighbors.values())
+            }
+
+    def _place(self, developer_id: str, vector: np.ndarray) -> None:
+        """벡터를 슬롯에 저장 (기존 개발자는 같은 슬롯 재사용)"""
+        vector = np.asarray(vector, dtype=np.float32)
+        slot = self._slots.get(developer_id)
+        if slot is None:
+            if self._free:
+                slot = self._free.pop()
+            else:
+                slot = len(self._ids)
+                self._grow(slot + 1)
+                self._ids.append(None)
+            self._slots[developer_id] = slot
+            self._ids[slot] = developer_id
+        self._vectors[slot] = vector
+        self._alive[slot] = True
+        self._kth[slot] = -np.inf
+
+    def _grow(self, size: int) -> None:
+        """슬롯 배열 확장 (2배씩)"""
+        if size <= len(self._alive):
+            return
+        capacity = max(size, len(self._alive) * 2, 16)
+        vectors = np.zeros((capacity, self._vectors.shape[1]), dtype=np.float32)
+        vectors[:len(self._vectors)] = self._vectors
+        alive = np.zeros(capacity, dtype=bool)
+        alive[:len(self._alive)] = self._alive
+        kth = np.full(capacity, -np.inf, dtype=np.float32)
+        kth[:len(self._kth)] = self._kth
+        self._vectors, self._alive, self._kth = vectors, alive, kth
+
+    def _detach(self, developer_id: str) -> Set[str]:
+        """다른 노드의 이웃 목록에서 제거하고 이웃을 잃은 노드 반환"""
+        affected = self._reverse.pop(developer_id, set())
+        for other_id in affected:
+            self._set_neighbors(other_id, [(n, s) for n, s in self._neighbors.get(other_id, []) if n != developer_id])
+        for neighbor_id, _ in self._neighbors.pop(developer_id, []):
+            self._reverse.get(neighbor_id, set()).discard(developer_id)
+        self._reverse[developer_id] = set()
+        return affected
+
+    def _set_neighbors(self, developer_id: str, neighbors: List[Tuple[str, float]]) -> None:
+        """이웃 목록과 k번째 유사도 갱신"""
+        self._neighbors[developer_id] = neighbors
+        slot = self._slots[developer_id]
+        self._kth[slot] = neighbors[-1][1] if len(neighbors) >= self.k else -np.inf
+
+    def _insert_neighbor(self, developer_id: str, neighbor_id: str, similarity: float) -> None:
+        """이웃 목록에 삽입하고 k개를 넘으면 가장 먼 이웃 제거"""
+        neighbors = self._neighbors.get(developer_id, [])
+        neighbors.append((neighbor_id, similarity))
+        neighbors.sort(key=lambda item: item[1], reverse=True)
+        self._reverse.setdefault(neighbor_id, set()).add(developer_id)
+        if len(neighbors) > self.k:
+            evicted_id, _ = neighbors.pop()
+            self._reverse.get(evicted_id, set()).discard(developer_id)
+        self._set_neighbors(developer_id, neighbors)
+
+    def _recompute(self, developer_ids: List[str]) -> None:
+        """지정한 노드의 이웃 목록을 전체 노드 대상으로 블록 단위 계산"""
+        if not developer_ids:
+            return
+        alive_count = int(self._alive.sum())
+        k = min(self.k, alive_count - 1)
+
+        for start in range(0, len(developer_ids), self.block_size):
+            block_ids = developer_ids[start:start + self.block_size]
+            block_slots = np.array([self._slots[developer_id] for developer_id in block_ids])
+            similarities = self._vectors[block_slots] @ self._vectors.T
+            similarities[:, ~self._alive] = -np.inf
+            similarities[np.arange(len(block_slots)), block_slots] = -np.inf
+
+            if k > 0:
+                top = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+            else:
+                top = np.zeros((len(block_slots), 0), dtype=int)
+
+            for row, developer_id in enumerate(block_ids):
+                for neighbor_id, _ in self._neighbors.get(developer_id, []):
+                    self._reverse.get(neighbor_id, set()).discard(developer_id)
+
+                order = top[row][np.argsort(-similarities[row, top[row]])]
+                neighbors = [(self._ids[slot], float(similarities[row, slot])) for slot in order]
+                for neighbor_id, _ in neighbors:
+                    self._reverse.setdefault(neighbor_id, set()).add(developer_id)
+                self._set_neighbors(developer_id, neighbors)
@@ -0,0 +1,194 @@
+"""
+데이터베이스 통계
+쓰기마다 증분 갱신되는 메모리 내 카운터와 분포, 주기적으로 컬렉션과 대조해 보정
+"""
+
+import logging
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 분포를 집계하는 프로필 필드
+DISTRIBUTION_FIELDS = ("seniority", "primary_role", "location", "availability")
+
+def _split(value: Optional[str]) -> Tuple[str, ...]:
+    """비정규화 목록 문자열 분리 ("React, Vue" -> ("React", "Vue"))"""
+    return tuple(item for item in (value or "").split(", ") if item)
+
+def _ranked(counter: Counter, limit: int = None) -> List[Tuple[str, int]]:
+    """빈도 내림차순, 같은 빈도는 이름순 (증분 갱신과 재집계 결과가 같은 순서)"""
+    return sorted(counter.items(), key=lambda item: (-item[1], item[0]))[:limit]
+
+class _Contribution:
+    """개발자 한 명이 통계에 반영한 값"""
+
+    __slots__ = ("fields", "skills", "companies")
+
+    def __init__(self, metadata: Dict):
+        self.fields = tuple(metadata.get(field) for field in DISTRIBUTION_FIELDS)
+        # 기술/경력 항목은 개발자별 기술명/회사명마다 하나씩 저장됨
+        self.skills = _split(metadata.get("skill_names"))
+        self.companies = _split(metadata.get("companies"))
+
+class StatsCollector:
+    """증분 통계 집계기 - 조회는 마지막 쓰기 이후 한 번 만든 스냅샷 반환"""
+
+    def __init__(self, top_n: int = 10):
+        """통계 집계기 초기화"""
+        self.top_n = top_n
+        self._lock = threading.Lock()
+        self._contributions: Dict[str, _Contribution] = {}
+        self._distributions = {field: Counter() for field in DISTRIBUTION_FIELDS}
+        self._skills = Counter()
+        self._companies = Counter()
+        self._skill_entries = 0
+        self._experience_entries = 0
+        self._writes = 0
+        self._last_ingest_at: Optional[float] = None
+        self._last_write_at: Optional[float] = None
+        self._reconciled_at: Optional[float] = None
+        self._last_drift: Dict[str, int] = {}
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def on_write(self, upserted: Dict[str, Dict], removed: List[str]) -> None:
+        """쓰기 리스너 - 바뀐 개발자의 기여분만 갱신"""
+        now = time.time()
+        with self._lock:
+            for developer_id in removed:
+                self._remove(developer_id)
+            for developer_id, metadata in upserted.items():
+                self._remove(developer_id)
+                self._add(developer_id, metadata)
+            self._writes += 1
+            self._last_write_at = now
+            if upserted:
+                self._last_ingest_at = now
+            self._snapshot = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 통계 (컬렉션 조회 없음)"""
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
+
+        with self._lock:
+            if self._snapshot is None:
+                profiles = len(self._contributions)
+                self._snapshot = {
+                    "profiles": profiles,
+                    "skills": self._skill_entries,
+                    "experience": self._experience_entries,
+                    "total": profiles + self._skill_entries + self._experience_entries,
+                    "distributions": {
+                        field: dict(_ranked(counter)) for field, counter in self._distributions.items()
+                    },
+                    "top_skills": [{"name": name, "count": count} for name, count in _ranked(self._skills, self.top_n)],
+                    "top_companies": [{"name": name, "count": count} for name, count in _ranked(self._companies, self.top_n)],
+                    "last_ingest_at": self._last_ingest_at,
+                    "last_write_at": self._last_write_at,
+                    "reconciled_at": self._reconciled_at,
+                    "last_drift": dict(self._last_drift)
+                }
+            return self._snapshot
+
+    def reconcile(self, load: Callable[[], Tuple[List[Dict], Dict[str, int]]]) -> bool:
+        """컬렉션과 대조해 통계 보정 - 읽는 동안 쓰기가 있었으면 다음 주기로 미룸"""
+        with self._lock:
+            writes = self._writes
+        profile_metadatas, counts = load()
+
+        with self._lock:
+            if self._writes != writes:
+                logger.debug("통계 보정 연기: 대조 중 쓰기 발생")
+                return False
+
+            before = {
+                "profiles": len(self._contributions),
+                "skills": self._skill_entries,
+                "experience": self._experience_entries
+            }
+            self._rebuild(profile_metadatas)
+            # 기술/경력 항목 수는 컬렉션 실제 개수 사용
+            self._skill_entries = counts.get("skills", self._skill_entries)
+            self._experience_entries = counts.get("experience", self._experience_entries)
+            after = {
+                "profiles": len(self._contributions),
+                "skills": self._skill_entries,
+                "experience": self._experience_entries
+            }
+            # 최초 적재는 차이로 기록하지 않음
+            if self._reconciled_at is not None:
+                self._last_drift = {key: after[key] - before[key] for key in after if after[key] != before[key]}
+            self._reconciled_at = time.time()
+            self._snapshot = None
+
+        if self._last_drift:
+            logger.warning(f"통계 보정: 증분 카운터와 컬렉션 차이 {self._last_drift}")
+        return True
+
+    def start_reconciliation(self, interval: float, load: Callable[[], Tuple[List[Dict], Dict[str, int]]]) -> None:
+        """주기적 보정 스레드 시작 (interval <= 0이면 비활성화)"""
+        if interval <= 0 or self._thread is not None:
+            return
+
+        def run():
+            while not self._stop.wait(interval):
+                try:
+                    self.reconcile(load)
+                except Exception as e:
+                    logger.error(f"통계 보정 오류: {e}")
+
+        self._thread = threading.Thread(target=run, name="stats-reconcile", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """주기적 보정 중지"""
+        self._stop.set()
+
+    def _rebuild(self, profile_metadatas: Iterable[Dict]) -> None:
+        """잠금을 잡은 상태에서 전체 재집계"""
+        self._contributions = {}
+        self._distributions = {field: Counter() for field in DISTRIBUTION_FIELDS}
+        self._skills = Counter()
+        self._companies = Counter()
+        self._skill_entries = 0
+        self._experience_entries = 0
+        for metadata in profile_metadatas:
+            self._add(metadata["developer_id"], metadata)
+        self._snapshot = None
+
+    def _add(self, developer_id: str, metadata: Dict) -> None:
+        """개발자 기여분 반영"""
+        contribution = _Contribution(metadata)
+        self._contributions[developer_id] = contribution
+        for field, value in zip(DISTRIBUTION_FIELDS, contribution.fields):
+            if value is not None:
+                self._distributions[field][value] += 1
+        self._skills.update(contribution.skills)
+        self._companies.update(contribution.companies)
+        self._skill_entries += len(contribution.skills)
+        self._experience_entries += len(contribution.companies)
+
+    def _remove(self, developer_id: str) -> None:
+        """개발자 기여분 차감"""
+        contribution = self._contributions.pop(developer_id, None)
+        if contribution is None:
+            return
+        for field, value in zip(DISTRIBUTION_FIELDS, contribution.fields):
+            if value is not None:
+                self._distributions[field][value] -= 1
+                if self._distributions[field][value] <= 0:
+                    del self._distributions[field][value]
+        self._skills.subtract(contribution.skills)
+        self._companies.subtract(contribution.companies)
+        for counter, names in ((self._skills, contribution.skills), (self._companies, contribution.companies)):
+            for name in names:
+                if counter[name] <= 0:
+                    del counter[name]
+        self._skill_entries -= len(contribution.skills)
+        self._experience_entries -= len(contribution.companies)
@@ -0,0 +1,121 @@
+"""
+벡터 저장소 클라이언트
+설정된 모드(CHROMA_MODE)에 따라 프로세스 내 PersistentClient 또는 Chroma 서버 HTTP 클라이언트 생성
+"""
+
+import logging
+import random
+import threading
+import time
+from typing import Any, Dict, Tuple
+
+import chromadb
+import httpx
+from chromadb.config import Settings
+
+from config.settings import (
+    CHROMA_MODE, CHROMA_HOST, CHROMA_PORT, CHROMA_POOL_SIZE, CHROMA_KEEPALIVE_SECONDS,
+    CHROMA_CONNECT_TIMEOUT, CHROMA_REQUEST_TIMEOUT, CHROMA_POOL_TIMEOUT, CHROMA_RETRIES, CHROMA_RETRY_BACKOFF
+)
+
+logger = logging.getLogger(__name__)
+
+# 저장소 모드
+MODE_EMBEDDED = "embedded"
+MODE_HTTP = "http"
+
+# 반복해도 결과가 같은 컬렉션 요청 (경로 마지막 부분)
+IDEMPOTENT_ACTIONS = frozenset(("query", "get", "count", "upsert", "update", "delete"))
+# 재시도하는 서버 응답 상태
+RETRY_STATUSES = frozenset((502, 503, 504))
+
+class RetryTransport(httpx.HTTPTransport):
+    """일시적 오류 재시도 전송 계층
+
+    연결 실패(요청이 서버에 도달하지 않음)는 모든 요청을, 응답 시간 초과/끊김/5xx는 반복해도 안전한 요청만 재시도한다.
+    풀에서 빈 연결을 기다리다 시간 초과된 경우는 과부하이므로 재시도하지 않는다.
+    """
+
+    def __init__(self, retries: int, backoff: float, **kwargs):
+        super().__init__(**kwargs)
+        self.retries = retries
+        self.backoff = backoff
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        idempotent = request.method == "GET" or request.url.path.rsplit("/", 1)[-1] in IDEMPOTENT_ACTIONS
+        attempt = 0
+        while True:
+            try:
+                response = super().handle_request(request)
+            except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+                error = e
+            except (httpx.ReadTimeout, httpx.ReadError, httpx.WriteError, httpx.RemoteProtocolError) as e:
+                if not idempotent:
+                    raise
+                error = e
+            else:
+                if response.status_code not in RETRY_STATUSES or not idempotent or attempt >= self.retries:
+                    return response
+                response.close()
+                error = f"HTTP {response.status_code}"
+
+            if attempt >= self.retries:
+                raise error
+            delay = self.backoff * (2 ** attempt) * (0.5 + random.random())
+            attempt += 1
+            logger.warning(f"Chroma 서버 요청 재시도 {attempt}/{self.retries}: {request.method} {request.url.path} "
+                           f"({error}, {delay * 1000:.0f}ms 후)")
+            time.sleep(delay)
+
+# 프로세스 내 Chroma 서버 클라이언트 (서버 주소별 하나, 검색 엔진끼리 연결 풀 공유)
+_http_clients: Dict[Tuple[str, int], Any] = {}
+_http_clients_lock = threading.Lock()
+
+def create_client(db_path: str):
+    """설정된 모드의 Chroma 클라이언트 생성 (embedded 모드는 db_path의 로컬 DB 사용)"""
+    if CHROMA_MODE == MODE_EMBEDDED:
+        return chromadb.PersistentClient(path=db_path)
+    if CHROMA_MODE != MODE_HTTP:
+        raise ValueError(f"지원하지 않는 저장소 모드: {CHROMA_MODE}")
+
+    with _http_clients_lock:
+        client = _http_clients.get((CHROMA_HOST, CHROMA_PORT))
+        if client is None:
+            client = _http_clients[(CHROMA_HOST, CHROMA_PORT)] = _create_http_client()
+        return client
+
+def _create_http_client():
+    """크기 제한 연결 풀, keep-alive, 시간 초과, 재시도를 적용한 Chroma 서버 클라이언트"""
+    limits = httpx.Limits(
+        max_connections=CHROMA_POOL_SIZE,
+        max_keepalive_connections=CHROMA_POOL_SIZE,
+        keepalive_expiry=CHROMA_KEEPALIVE_SECONDS
+    )
+    settings = Settings(
+        chroma_http_keepalive_secs=CHROMA_KEEPALIVE_SECONDS,
+        chroma_http_max_connections=CHROMA_POOL_SIZE,
+        chroma_http_max_keepalive_connections=CHROMA_POOL_SIZE
+    )
+    client = chromadb.HttpClient(host=CHROMA_HOST, port=CHROMA_PORT, settings=settings)
+
+    # Chroma HTTP 클라이언트는 시간 초과 없이 세션을 만들고 전송 계층 설정을 받지 않으므로 세션을 교체
+    server = getattr(client, "_server", None)
+    session = getattr(server, "_session", None)
+    if isinstance(session, httpx.Client):
+        server._session = httpx.Client(
+            timeout=httpx.Timeout(CHROMA_REQUEST_TIMEOUT, connect=CHROMA_CONNECT_TIMEOUT, pool=CHROMA_POOL_TIMEOUT),
+            limits=limits,
+            transport=RetryTransport(CHROMA_RETRIES, CHROMA_RETRY_BACKOFF, limits=limits),
+            headers=session.headers
+        )
+        session.close()
+    else:
+        logger.warning("Chroma HTTP 세션을 찾을 수 없어 기본 연결 설정 사용 (시간 초과/재시도 미적용)")
+
+    logger.info(f"Chroma 서버 연결: http://{CHROMA_HOST}:{CHROMA_PORT} "
+                f"(연결 풀 {CHROMA_POOL_SIZE}개, 요청 시간 초과 {CHROMA_REQUEST_TIMEOUT:.0f}초, 재시도 {CHROMA_RETRIES}회)")
+    return client
+
+def is_remote() -> bool:
+    """Chroma 서버 연결 모드 여부"""
+    return CHROMA_MODE == MODE_HTTP
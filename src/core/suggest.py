@@ -0,0 +1,179 @@
+"""
+검색어 자동완성
+FILTER_PATTERNS와 저장된 기술/회사/지역 값으로 만든 메모리 내 접두어 인덱스 (빈도순 정렬, 쓰기마다 증분 갱신)
+"""
+
+import bisect
+import heapq
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Tuple
+
+from config.filter_config import FILTER_PATTERNS
+from .profile_fields import normalize_term
+
+logger = logging.getLogger(__name__)
+
+# 자동완성 대상 필터 타입 (정규식 패턴인 연차/연봉 제외)
+SUGGEST_CATEGORIES = ("skills", "companies", "location", "seniority", "availability")
+
+class Suggestion:
+    """자동완성 후보"""
+
+    __slots__ = ("text", "category", "value", "count", "recognized")
+
+    def __init__(self, text: str, category: str, value: Any, recognized: bool):
+        self.text = text
+        self.category = category
+        self.value = value
+        self.count = 0
+        # FILTER_PATTERNS로 필터 추출되는 표현인지
+        self.recognized = recognized
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "text": self.text,
+            "category": self.category,
+            "value": self.value,
+            "count": self.count,
+            "recognized": self.recognized
+        }
+
+def profile_terms(metadata: Dict) -> List[Tuple[str, str]]:
+    """프로필 메타데이터의 (필터 타입, 값) 목록"""
+    terms = []
+    for category in ("location", "seniority", "availability"):
+        if metadata.get(category):
+            terms.append((category, metadata[category]))
+    for category, field in (("companies", "companies"), ("skills", "skill_names")):
+        for value in (metadata.get(field) or "").split(", "):
+            if value:
+                terms.append((category, value))
+    return terms
+
+class SuggestIndex:
+    """정렬된 접두어 키 배열 기반 자동완성 인덱스 - 읽기는 잠금 없이 스냅샷 사용"""
+
+    def __init__(self):
+        """자동완성 인덱스 초기화"""
+        self._lock = threading.Lock()
+        self._suggestions: Dict[Tuple[str, str], Suggestion] = {}
+        # (필터 타입, 값) -> 해당 값으로 추출되는 후보 (빈도 공유)
+        self._by_value: Dict[Tuple[str, str], List[Suggestion]] = {}
+        # 개발자별 반영된 (필터 타입, 값) - 갱신/삭제 시 차감
+        self._contributions: Dict[str, List[Tuple[str, str]]] = {}
+        # (정렬된 접두어 키, 키별 후보) 스냅샷
+        self._snapshot: Tuple[List[str], List[Suggestion]] = ([], [])
+
+    def build(self, profile_metadatas: Iterable[Dict]) -> None:
+        """FILTER_PATTERNS와 프로필 메타데이터로 전체 인덱스 생성"""
+        with self._lock:
+            self._suggestions = {}
+            self._by_value = {}
+            self._contributions = {}
+
+            for category in SUGGEST_CATEGORIES:
+                for pattern, value in FILTER_PATTERNS.get(category, {}).get("patterns", []):
+                    self._ensure(pattern, category, value, recognized=True)
+
+            for metadata in profile_metadatas:
+                self._apply(metadata["developer_id"], profile_terms(metadata))
+
+            self._rebuild_snapshot()
+            logger.info(f"자동완성 인덱스 생성 완료: {len(self._suggestions)}개 후보")
+
+    def on_write(self, upserted: Dict[str, Dict], removed: List[str]) -> None:
+        """쓰기 리스너 - 바뀐 개발자의 기여분만 갱신"""
+        with self._lock:
+            size = len(self._suggestions)
+            for developer_id in removed:
+                self._apply(developer_id, [])
+            for developer_id, metadata in upserted.items():
+                self._apply(developer_id, profile_terms(metadata))
+            # 새 후보가 생긴 경우에만 키 배열 재생성 (빈도는 후보 객체에서 바로 반영)
+            if len(self._suggestions) != size:
+                self._rebuild_snapshot()
+
+    def suggest(self, prefix: str, limit: int = 8) -> List[Suggestion]:
+        """접두어로 시작하는 후보를 빈도순으로 반환"""
+        key = normalize_term(prefix)
+        if not key:
+            return []
+        keys, entries = self._snapshot
+        start = bisect.bisect_left(keys, key)
+        end = bisect.bisect_left(keys, key + "\uffff", start)
+
+        # 여러 키(단어 시작 위치)로 같은 후보가 잡힐 수 있으므로 중복 제거, 데이터에서 사라진 값은 제외
+        matched = {id(entry): entry for entry in entries[start:end] if entry.recognized or entry.count > 0}.values()
+        return heapq.nsmallest(
+            limit, matched,
+            key=lambda s: (-s.count, not s.recognized, len(s.text), s.text)
+        )
+
+    def complete(self, query: str, limit: int = 8) -> List[Dict[str, Any]]:
+        """입력 중인 쿼리의 마지막 단어(또는 두 단어)를 완성한 후보 반환"""
+        if not query or query[-1].isspace():
+            return []
+        words = query.split()
+
+        results: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        # "LG C" -> "LG CNS"처럼 공백이 있는 후보를 위해 마지막 두 단어도 확인
+        for span in (2, 1):
+            if len(words) < span:
+                continue
+            head = " ".join(words[:-span])
+            for suggestion in self.suggest("".join(words[-span:]), limit):
+                key = (suggestion.category, suggestion.text)
+                if key in results:
+                    continue
+                item = suggestion.to_dict()
+                item["completion"] = f"{head} {suggestion.text}".strip()
+                results[key] = item
+
+        ordered = sorted(results.values(), key=lambda s: (-s["count"], not s["recognized"], len(s["text"])))
+        return ordered[:limit]
+
+    def stats(self) -> Dict[str, int]:
+        """인덱스 통계"""
+        keys, _ = self._snapshot
+        return {"suggestions": len(self._suggestions), "keys": len(keys), "developers": len(self._contributions)}
+
+    def _ensure(self, text: str, category: str, value: Any, recognized: bool = False) -> Suggestion:
+        """후보 조회 또는 생성"""
+        key = (category, normalize_term(text))
+        suggestion = self._suggestions.get(key)
+        if suggestion is None:
+            suggestion = Suggestion(text, category, value, recognized)
+            self._suggestions[key] = suggestion
+            self._by_value.setdefault((category, normalize_term(value)), []).append(suggestion)
+        return suggestion
+
+    def _apply(self, developer_id: str, terms: List[Tuple[str, str]]) -> None:
+        """개발자의 이전 기여분을 빼고 새 값 반영"""
+        for category, value in self._contributions.pop(developer_id, []):
+            for suggestion in self._by_value.get((category, normalize_term(value)), []):
+                suggestion.count -= 1
+
+        terms = list(dict.fromkeys(terms))
+        for category, value in terms:
+            value_key = (category, normalize_term(value))
+            if value_key not in self._by_value:
+                # 패턴에 없는 값은 새 후보로 추가 (같은 표현의 패턴 후보가 있으면 그 후보에 합산)
+                suggestion = self._ensure(value, category, value)
+                bucket = self._by_value.setdefault(value_key, [])
+                if suggestion not in bucket:
+                    bucket.append(suggestion)
+            for suggestion in self._by_value[value_key]:
+                suggestion.count += 1
+        if terms:
+            self._contributions[developer_id] = terms
+
+    def _rebuild_snapshot(self) -> None:
+        """접두어 키 배열 재생성 - 후보 전체와 단어 시작 위치마다 키 생성"""
+        pairs = []
+        for suggestion in self._suggestions.values():
+            words = suggestion.text.split()
+            for i in range(len(words)):
+                pairs.append((normalize_term("".join(words[i:])), suggestion))
+        pairs.sort(key=lambda pair: pair[0])
+        self._snapshot = ([key for key, _ in pairs], [suggestion for _, suggestion in pairs])
@@ -0,0 +1,195 @@
+"""
+느린 쿼리 추적
+검색 호출별 단계 시간/후보 수/캐시 적중/선택된 파라미터를 기록하고, 기준 시간을 넘은 호출만 회전 파일과 최근 목록에 보관
+"""
+
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+class QueryTrace:
+    """호출 한 번의 실행 추적"""
+
+    __slots__ = ("operation", "started_at", "elapsed_ms", "stages", "counts", "attributes", "_start")
+
+    def __init__(self, operation: str, **attributes):
+        self.operation = operation
+        self.started_at = time.time()
+        self.elapsed_ms: Optional[float] = None
+        # 단계별 누적 시간(ms), 컬렉션별 후보 수 등 개수, 쿼리/필터/계획 등 속성
+        self.stages: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+        self.attributes: Dict[str, Any] = {key: value for key, value in attributes.items() if value is not None}
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """단계 시간 측정 (같은 이름은 누적)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + (time.perf_counter() - start) * 1000
+
+    def add_count(self, name: str, count: int) -> None:
+        self.counts[name] = self.counts.get(name, 0) + count
+
+    def set(self, **attributes) -> None:
+        self.attributes.update(attributes)
+
+    def finish(self) -> None:
+        self.elapsed_ms = (time.perf_counter() - self._start) * 1000
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "operation": self.operation,
+            "started_at": round(self.started_at, 3),
+            "elapsed_ms": round(self.elapsed_ms, 2) if self.elapsed_ms is not None else None,
+            "stages": {name: round(value, 2) for name, value in self.stages.items()},
+            "counts": dict(self.counts),
+            **self.attributes
+        }
+
+class _NullTrace:
+    """추적 중이 아닐 때 사용하는 빈 추적 (계측 지점에서 분기 없이 호출)"""
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        yield
+
+    def add_count(self, name: str, count: int) -> None:
+        pass
+
+    def set(self, **attributes) -> None:
+        pass
+
+NULL_TRACE = _NullTrace()
+_local = threading.local()
+
+def current_trace():
+    """현재 스레드에서 진행 중인 추적 (없으면 빈 추적)"""
+    return getattr(_local, "trace", None) or NULL_TRACE
+
+@contextmanager
+def bind_trace(trace) -> Iterator[None]:
+    """다른 스레드에서 시작된 추적을 현재 스레드에 연결 (스레드 풀 작업의 단계 기록용)"""
+    previous = getattr(_local, "trace", None)
+    _local.trace = trace if trace is not NULL_TRACE else None
+    try:
+        yield
+    finally:
+        _local.trace = previous
+
+class SlowQueryLog:
+    """느린 쿼리 로그 - 기준 시간을 넘은 추적을 샘플링해 최근 목록에 보관하고 별도 스레드가 회전 파일에 기록"""
+
+    def __init__(self, path: Optional[str], threshold_ms: float, sample_rate: float = 1.0, recent: int = 100,
+                 max_bytes: int = 10 * 1024 * 1024, backup_count: int = 5, max_pending: int = 1000):
+        """느린 쿼리 로그 초기화 (threshold_ms <= 0이면 비활성화, path가 없으면 최근 목록만 유지)"""
+        self.path = path
+        self.threshold_ms = threshold_ms
+        self.sample_rate = sample_rate
+        self._recent: deque = deque(maxlen=recent)
+        self._lock = threading.Lock()
+        self._observed = 0
+        self._slow = 0
+        self._sampled_out = 0
+        self._dropped = 0
+        self._queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=max_pending)
+        self._listener: Optional[logging.handlers.QueueListener] = None
+        if self.enabled and path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            handler = logging.handlers.RotatingFileHandler(
+                path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+            )
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            self._listener = logging.handlers.QueueListener(self._queue, handler)
+            self._listener.start()
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold_ms > 0
+
+    @contextmanager
+    def trace(self, operation: str, **attributes) -> Iterator[QueryTrace]:
+        """호출 추적 - 끝나면 기준 시간과 비교해 기록 (비활성화 시 빈 추적)"""
+        if not self.enabled:
+            yield NULL_TRACE
+            return
+
+        trace = QueryTrace(operation, **attributes)
+        previous = getattr(_local, "trace", None)
+        _local.trace = trace
+        try:
+            yield trace
+        except Exception as e:
+            trace.set(error=str(e))
+            raise
+        finally:
+            _local.trace = previous
+            trace.finish()
+            self.observe(trace)
+
+    def observe(self, trace: QueryTrace) -> None:
+        """끝난 추적 기록 여부 판정"""
+        with self._lock:
+            self._observed += 1
+            if trace.elapsed_ms < self.threshold_ms:
+                return
+            self._slow += 1
+            if self.sample_rate < 1 and random.random() >= self.sample_rate:
+                self._sampled_out += 1
+                return
+
+        entry = trace.to_dict()
+        with self._lock:
+            self._recent.append(entry)
+        if self._listener is None:
+            return
+        try:
+            line = json.dumps(entry, ensure_ascii=False, default=str)
+            self._queue.put_nowait(logging.makeLogRecord({"msg": line, "levelno": logging.INFO, "levelname": "INFO"}))
+        except queue.Full:
+            # 파일 기록이 밀리면 요청 처리를 막지 않고 버림
+            with self._lock:
+                self._dropped += 1
+
+    def recent(self, limit: int = 20, operation: str = None) -> List[Dict[str, Any]]:
+        """최근 느린 쿼리 (최신순)"""
+        with self._lock:
+            entries = list(self._recent)
+        entries.reverse()
+        if operation:
+            entries = [entry for entry in entries if entry["operation"] == operation]
+        return entries[:limit]
+
+    def stats(self) -> Dict[str, Any]:
+        """느린 쿼리 로그 통계"""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "path": self.path,
+                "threshold_ms": self.threshold_ms,
+                "sample_rate": self.sample_rate,
+                "observed": self._observed,
+                "slow": self._slow,
+                "sampled_out": self._sampled_out,
+                "dropped": self._dropped,
+                "recent": len(self._recent)
+            }
+
+    def close(self) -> None:
+        """남은 기록을 쓰고 종료"""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
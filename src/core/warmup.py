@@ -0,0 +1,250 @@
+"""
+캐시 워밍업
+검색 쿼리를 빈도와 함께 로컬 파일에 기록하고, 시작 시 상위 쿼리를 백그라운드에서 재실행해 캐시를 채움
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 워밍업 상태
+WARMUP_PENDING = "pending"
+WARMUP_RUNNING = "running"
+WARMUP_COMPLETED = "completed"
+WARMUP_STOPPED = "stopped"
+
+# (정규화된 쿼리, 검색 타입, 필터 모드, 결과 수)
+QueryKey = Tuple[str, str, str, int]
+
+def normalize_query(query: str) -> str:
+    """공백 정규화 (응답 캐시 키와 같은 규칙)"""
+    return " ".join(query.split())
+
+class QueryLog:
+    """쿼리 빈도 기록 - 메모리에서 집계하고 주기적으로 JSON 파일에 저장 (상위 max_entries개만 유지)"""
+
+    def __init__(self, path: Optional[str], max_entries: int = 1000):
+        """쿼리 로그 초기화 (path가 없으면 기록하지 않음)"""
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._counts: Counter = Counter()
+        self._dirty = False
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        if path:
+            self._load()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path) and self.max_entries > 0
+
+    def record(self, query: str, search_type: str, filter_mode: str, limit: int) -> None:
+        """검색 한 건 기록"""
+        if not self.enabled:
+            return
+        key = (normalize_query(query), search_type, filter_mode, limit)
+        if not key[0]:
+            return
+        with self._lock:
+            self._counts[key] += 1
+            self._dirty = True
+            # 드문 쿼리가 계속 쌓이지 않도록 상한의 2배를 넘으면 정리
+            if len(self._counts) > self.max_entries * 2:
+                self._counts = Counter(dict(self._counts.most_common(self.max_entries)))
+
+    def top(self, count: int) -> List[Tuple[QueryKey, int]]:
+        """빈도 상위 쿼리"""
+        with self._lock:
+            return self._counts.most_common(count)
+
+    def flush(self) -> bool:
+        """변경분이 있으면 파일에 저장 (임시 파일에 쓴 뒤 교체)"""
+        if not self.enabled:
+            return False
+        with self._lock:
+            if not self._dirty:
+                return False
+            entries = self._counts.most_common(self.max_entries)
+            self._dirty = False
+
+        payload = {
+            "saved_at": time.time(),
+            "queries": [
+                {"query": query, "search_type": search_type, "filter_mode": filter_mode, "limit": limit, "count": count}
+                for (query, search_type, filter_mode, limit), count in entries
+            ]
+        }
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
+        os.replace(temp_path, self.path)
+        return True
+
+    def start_flushing(self, interval: float) -> None:
+        """주기적 저장 스레드 시작 (interval <= 0이면 종료 시에만 저장)"""
+        if not self.enabled or interval <= 0 or self._thread is not None:
+            return
+
+        def run():
+            while not self._stop.wait(interval):
+                try:
+                    self.flush()
+                except Exception as e:
+                    logger.error(f"쿼리 로그 저장 오류: {e}")
+
+        self._thread = threading.Thread(target=run, name="query-log-flush", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """주기적 저장 중지 후 남은 변경분 저장"""
+        self._stop.set()
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(f"쿼리 로그 저장 오류: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """쿼리 로그 통계"""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "path": self.path,
+                "queries": len(self._counts),
+                "recorded": sum(self._counts.values())
+            }
+
+    def _load(self) -> None:
+        """저장된 로그 읽기 (없거나 손상된 파일은 빈 로그로 시작)"""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                payload = json.load(f)
+            for entry in payload.get("queries", []):
+                key = (entry["query"], entry["search_type"], entry["filter_mode"], int(entry["limit"]))
+                self._counts[key] += int(entry["count"])
+            logger.info(f"쿼리 로그 로드: {len(self._counts)}개 쿼리 ({self.path})")
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"쿼리 로그를 읽을 수 없어 새로 시작: {e}")
+
+class CacheWarmer:
+    """쿼리 로그 상위 쿼리를 재실행해 임베딩/응답 캐시를 채우는 백그라운드 작업
+
+    실시간 요청이 처리 중이면(busy) 끝날 때까지 기다렸다가 다음 쿼리를 실행한다.
+    """
+
+    def __init__(self, engine, top_n: int, busy: Callable[[], bool] = None, idle_wait: float = 0.05,
+                 max_seconds: float = 300.0):
+        """캐시 워밍업 초기화"""
+        self.engine = engine
+        self.top_n = top_n
+        self.busy = busy or (lambda: False)
+        self.idle_wait = idle_wait
+        self.max_seconds = max_seconds
+        self.state = WARMUP_PENDING
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._queries = 0
+        self._warmed = 0
+        self._cached = 0
+        self._failed = 0
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+        self._yielded = 0.0
+        # 워밍업 종료 시점의 캐시 통계 (이후 실시간 요청의 적중률 계산용)
+        self._baseline: Optional[Dict[str, Tuple[int, int]]] = None
+
+    def start(self) -> None:
+        """백그라운드 워밍업 시작"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="cache-warmup", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """워밍업 중단"""
+        self._stop.set()
+
+    def join(self, timeout: float = None) -> None:
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        entries = self.engine.query_log.top(self.top_n)
+        self._queries = len(entries)
+        self._started_at = time.time()
+        self.state = WARMUP_RUNNING
+        logger.info(f"캐시 워밍업 시작: 상위 {len(entries)}개 쿼리")
+
+        deadline = time.perf_counter() + self.max_seconds
+        for (query, search_type, filter_mode, limit), _ in entries:
+            if not self._wait_for_idle(deadline):
+                break
+            try:
+                if self.engine.warm_query(query, search_type, limit, filter_mode):
+                    self._warmed += 1
+                else:
+                    self._cached += 1
+            except Exception as e:
+                self._failed += 1
+                logger.warning(f"캐시 워밍업 쿼리 실패: '{query}' ({e})")
+
+        self._finished_at = time.time()
+        self._baseline = self._cache_counters()
+        self.state = WARMUP_STOPPED if self._stop.is_set() else WARMUP_COMPLETED
+        logger.info(f"캐시 워밍업 {'중단' if self._stop.is_set() else '완료'}: {self._warmed}개 계산, "
+                    f"{self._cached}개 이미 캐시됨, 실패 {self._failed}개, "
+                    f"{self._finished_at - self._started_at:.1f}초 (양보 {self._yielded:.1f}초)")
+
+    def _wait_for_idle(self, deadline: float) -> bool:
+        """실시간 요청이 없을 때까지 대기 (중단/시간 초과 시 False)"""
+        while True:
+            if self._stop.is_set():
+                return False
+            if time.perf_counter() > deadline:
+                logger.warning(f"캐시 워밍업 시간 초과 ({self.max_seconds:.1f}초)")
+                self._stop.set()
+                return False
+            if not self.busy():
+                return True
+            start = time.perf_counter()
+            self._stop.wait(self.idle_wait)
+            self._yielded += time.perf_counter() - start
+
+    def _cache_counters(self) -> Dict[str, Tuple[int, int]]:
+        """응답/임베딩 캐시의 (적중, 미스) 누적값"""
+        counters = {}
+        for name, stats in (("result_cache", self.engine.result_cache.stats()),
+                            ("embedding_cache", self.engine.embedding_cache.stats())):
+            counters[name] = (stats["hits"], stats["misses"])
+        return counters
+
+    def stats(self) -> Dict[str, Any]:
+        """워밍업 진행 상태와 종료 이후 실시간 요청의 캐시 적중률"""
+        end = self._finished_at or time.time()
+        stats = {
+            "state": self.state,
+            "queries": self._queries,
+            "warmed": self._warmed,
+            "already_cached": self._cached,
+            "failed": self._failed,
+            "elapsed_seconds": round(end - self._started_at, 3) if self._started_at else None,
+            "yielded_seconds": round(self._yielded, 3)
+        }
+        if self._baseline is not None:
+            current = self._cache_counters()
+            for name, (hits, misses) in current.items():
+                base_hits, base_misses = self._baseline[name]
+                hits, misses = hits - base_hits, misses - base_misses
+                stats[f"{name}_hit_rate_since"] = hits / (hits + misses) if hits + misses else None
+        return stats
@@ -0,0 +1,86 @@
+"""
+검색 요청 수락 제어
+동시 실행 수 제한과 제한된 대기열로 과부하 시 빠르게 거절
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+class AdmissionRejected(Exception):
+    """요청 수락 거절"""
+
+    def __init__(self, status_code: int, message: str):
+        super().__init__(message)
+        self.status_code = status_code
+        self.message = message
+
+class AdmissionController:
+    """동시 실행 제한 + 제한된 대기열 기반 수락 제어"""
+
+    def __init__(self, max_concurrency: int, max_queue: int, queue_timeout: float):
+        """수락 제어 초기화"""
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._active = 0
+        self._waiting = 0
+        self._admitted = 0
+        self._rejected_queue_full = 0
+        self._rejected_timeout = 0
+
+    async def acquire(self) -> None:
+        """실행 슬롯 확보 (대기열 초과 시 429, 대기 시간 초과 시 503)"""
+        if self._semaphore.locked():
+            if self._waiting >= self.max_queue:
+                self._rejected_queue_full += 1
+                raise AdmissionRejected(429, "요청이 많아 잠시 후 다시 시도해주세요.")
+
+            self._waiting += 1
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout)
+            except asyncio.TimeoutError:
+                self._rejected_timeout += 1
+                raise AdmissionRejected(503, "검색 서버가 혼잡합니다. 잠시 후 다시 시도해주세요.")
+            finally:
+                self._waiting -= 1
+        else:
+            await self._semaphore.acquire()
+
+        self._active += 1
+        self._admitted += 1
+
+    def release(self) -> None:
+        """실행 슬롯 반환"""
+        self._active -= 1
+        self._semaphore.release()
+
+    @asynccontextmanager
+    async def admit(self):
+        """실행 슬롯을 확보한 구간 (스트리밍 응답은 acquire/release 직접 사용)"""
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def busy(self) -> bool:
+        """실행 중이거나 대기 중인 요청이 있는지 (백그라운드 작업 양보 판단용)"""
+        return self._active > 0 or self._waiting > 0
+
+    def stats(self) -> Dict[str, Any]:
+        """수락 제어 통계"""
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "active": self._active,
+            "waiting": self._waiting,
+            "admitted": self._admitted,
+            "rejected_queue_full": self._rejected_queue_full,
+            "rejected_timeout": self._rejected_timeout
+        }
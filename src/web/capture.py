@@ -0,0 +1,100 @@
+"""
+요청 캡처
+검색/필터/프로필 요청의 입력, 처리 시간, 결과 ID를 JSONL로 기록 (scripts/replay.py로 재생)
+"""
+
+import json
+import logging
+import queue
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+class TrafficCapture:
+    """요청 캡처 기록기 - 요청 처리 경로에서는 대기열에 넣기만 하고 별도 스레드가 파일에 씀"""
+
+    def __init__(self, path: Optional[str], sample_rate: float = 1.0, max_pending: int = 10000):
+        """요청 캡처 초기화 (path가 없으면 기록하지 않음)"""
+        self.path = path
+        self.sample_rate = sample_rate
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=max_pending)
+        self._written = 0
+        self._dropped = 0
+        self._thread: Optional[threading.Thread] = None
+        if self.enabled:
+            self._thread = threading.Thread(target=self._run, name="traffic-capture", daemon=True)
+            self._thread.start()
+            logger.info(f"요청 캡처 시작: {path} (샘플링 {sample_rate:.0%})")
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path) and self.sample_rate > 0
+
+    def record(self, endpoint: str, params: Dict[str, Any], started: float, status: int = 200,
+               success: bool = True, ids: List[str] = None) -> None:
+        """요청 한 건 기록 (started: time.perf_counter() 기준 요청 시작 시각)"""
+        if not self.enabled or (self.sample_rate < 1 and random.random() >= self.sample_rate):
+            return
+        entry = {
+            "ts": round(time.time(), 3),
+            "endpoint": endpoint,
+            "params": {key: value for key, value in params.items() if value is not None},
+            "status": status,
+            "success": success,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+            "ids": ids or []
+        }
+        try:
+            self._queue.put_nowait(json.dumps(entry, ensure_ascii=False))
+        except queue.Full:
+            # 디스크가 느려도 요청 처리는 막지 않음
+            self._dropped += 1
+
+    def close(self) -> None:
+        """남은 기록을 쓰고 종료"""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def stats(self) -> Dict[str, Any]:
+        """캡처 통계"""
+        return {
+            "enabled": self.enabled,
+            "path": self.path,
+            "sample_rate": self.sample_rate,
+            "written": self._written,
+            "pending": self._queue.qsize(),
+            "dropped": self._dropped
+        }
+
+    def _run(self) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            while True:
+                line = self._queue.get()
+                if line is None:
+                    break
+                lines = [line]
+                closing = False
+                # 쌓여 있는 기록은 한 번에 씀
+                while len(lines) < 1000:
+                    try:
+                        line = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if line is None:
+                        closing = True
+                        break
+                    lines.append(line)
+                try:
+                    f.write("\n".join(lines) + "\n")
+                    f.flush()
+                    self._written += len(lines)
+                except OSError as e:
+                    self._dropped += len(lines)
+                    logger.error(f"요청 캡처 기록 오류: {e}")
+                if closing:
+                    break
@@ -0,0 +1,34 @@
+"""
+테스트 공통 설정
+저장소 루트를 모듈 경로에 추가 (config, src 패키지 import)
+"""
+
+import hashlib
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pytest
+
+class HashingEncoder:
+    """단어 해시 기반의 결정적 임베딩 모델 (SentenceTransformer 대체)"""
+
+    dimension = 32
+
+    def __init__(self, model_name):
+        self.model_name = model_name
+
+    def encode(self, texts, **kwargs):
+        vectors = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for token in text.lower().split():
+                digest = int(hashlib.md5(f"{self.model_name}:{token}".encode()).hexdigest(), 16)
+                vectors[row, digest % self.dimension] += 1.0
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0, 1.0, norms)
+
+@pytest.fixture(scope="session")
+def encoder_class():
+    """검색 엔진이 로드할 임베딩 모델 클래스"""
+    return HashingEncoder
@@ -0,0 +1,181 @@
+"""
+동시 실행 제어 유틸리티 테스트
+"""
+
+import threading
+import time
+
+from src.core.concurrency import KeyedLocks, ReadWriteLock, SingleFlight
+
+def test_single_flight_coalesces_concurrent_calls():
+    """같은 키의 동시 호출은 한 번만 계산하고 나머지는 결과 사본을 공유"""
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return {"results": [1, 2, 3]}
+
+    outcomes = []
+    leader = threading.Thread(target=lambda: outcomes.append(flight.do("q", compute)))
+    leader.start()
+    assert started.wait(5)
+    followers = [threading.Thread(target=lambda: outcomes.append(flight.do("q", compute))) for _ in range(3)]
+    for thread in followers:
+        thread.start()
+    while flight.stats()["coalesced"] < 3:
+        time.sleep(0.01)
+    release.set()
+    for thread in [leader] + followers:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert sorted(shared for _, shared in outcomes) == [False, True, True, True]
+    results = [result for result, _ in outcomes]
+    assert all(result == {"results": [1, 2, 3]} for result in results)
+    # 대기자마다 독립된 사본
+    assert len({id(result) for result in results}) == 4
+    assert flight.stats() == {"executed": 1, "coalesced": 3, "in_flight": 0}
+
+def test_single_flight_propagates_errors_and_forgets_key():
+    """리더의 예외는 대기자에게도 전달되고, 끝난 키는 다음 호출에서 다시 계산"""
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def fail():
+        started.set()
+        release.wait(5)
+        raise ValueError("boom")
+
+    errors = []
+
+    def call():
+        try:
+            flight.do("q", fail)
+        except ValueError as e:
+            errors.append(str(e))
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    assert started.wait(5)
+    follower = threading.Thread(target=call)
+    follower.start()
+    while flight.stats()["coalesced"] < 1:
+        time.sleep(0.01)
+    release.set()
+    leader.join(5)
+    follower.join(5)
+
+    assert errors == ["boom", "boom"]
+    assert flight.do("q", lambda: 42) == (42, False)
+
+def test_single_flight_different_keys_run_separately():
+    flight = SingleFlight()
+    assert flight.do("a", lambda: 1) == (1, False)
+    assert flight.do("b", lambda: 2) == (2, False)
+    assert flight.stats()["executed"] == 2
+
+def test_keyed_locks_serialize_same_key():
+    """같은 키는 직렬화되고 다른 락에 분산된 키는 동시에 진행"""
+    locks = KeyedLocks(stripes=4)
+    held = threading.Event()
+    release = threading.Event()
+
+    def holder():
+        with locks.hold([0]):
+            held.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=holder)
+    thread.start()
+    assert held.wait(5)
+
+    other_key_done = threading.Event()
+    same_key_done = threading.Event()
+
+    def acquire(key, done):
+        with locks.hold([key]):
+            done.set()
+
+    threading.Thread(target=acquire, args=(1, other_key_done)).start()
+    threading.Thread(target=acquire, args=(4, same_key_done)).start()
+    assert other_key_done.wait(5)
+    # 4는 0과 같은 락에 분산되므로 해제 전까지 대기
+    assert not same_key_done.wait(0.2)
+
+    release.set()
+    thread.join(5)
+    assert same_key_done.wait(5)
+
+def test_keyed_locks_reentrant_and_deduplicated():
+    """같은 스레드에서 중복 키/재진입 획득 가능"""
+    locks = KeyedLocks(stripes=2)
+    with locks.hold([1, 3, 1]):
+        with locks.hold([1]):
+            pass
+
+def test_read_write_lock_readers_share():
+    """읽기는 동시에 여러 스레드가 잡을 수 있음"""
+    lock = ReadWriteLock()
+    both_inside = threading.Barrier(2, timeout=5)
+
+    def reader():
+        with lock.read():
+            both_inside.wait()
+
+    threads = [threading.Thread(target=reader) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    assert not both_inside.broken
+
+def test_read_write_lock_writer_excludes_readers():
+    """쓰기 중에는 읽기가 대기하고, 쓰기가 끝나면 진행"""
+    lock = ReadWriteLock()
+    read_done = threading.Event()
+
+    def reader():
+        with lock.read():
+            read_done.set()
+
+    with lock.write():
+        thread = threading.Thread(target=reader)
+        thread.start()
+        assert not read_done.wait(0.2)
+    assert read_done.wait(5)
+    thread.join(5)
+
+def test_read_write_lock_waiting_writer_blocks_new_readers():
+    """쓰기가 대기 중이면 새 읽기는 쓰기가 끝날 때까지 대기 (쓰기가 밀리지 않음)"""
+    lock = ReadWriteLock()
+    order = []
+    lock.acquire_read()
+
+    def writer():
+        with lock.write():
+            order.append("write")
+
+    def reader():
+        with lock.read():
+            order.append("read")
+
+    writer_thread = threading.Thread(target=writer)
+    writer_thread.start()
+    while not lock._waiting_writers:
+        time.sleep(0.01)
+    reader_thread = threading.Thread(target=reader)
+    reader_thread.start()
+    time.sleep(0.2)
+    # 기존 읽기가 남아 있으므로 둘 다 대기
+    assert order == []
+
+    lock.release_read()
+    writer_thread.join(5)
+    reader_thread.join(5)
+    assert order == ["write", "read"]
@@ -0,0 +1,150 @@
+"""
+컴파일된 필터(CompiledFilterSet) 테스트 - 이전 행 단위 필터와 같은 판정인지 확인
+"""
+
+from src.core.dynamic_filter import DynamicFilterEngine, CompiledFilterSet
+from src.core.profile_fields import build_profile_filter_fields
+
+def make_result(developer_id, score=0.8, experience=None, skills=None, salary_range=None, **metadata):
+    """검색 결과 dict 생성 (experience/skills를 주면 비정규화 필터 필드 포함)"""
+    if experience is not None or skills is not None or salary_range is not None:
+        metadata.update(build_profile_filter_fields({
+            "experience": [{"company": c} for c in experience or []],
+            "skills": [{"name": s} for s in skills or []],
+            "salary_range": salary_range,
+        }))
+    return {"developer_id": developer_id, "total_score": score, "metadata": metadata}
+
+def ids(results):
+    return [r["developer_id"] for r in results]
+
+def strict(filters, results):
+    return CompiledFilterSet(filters, strict_mode=True).apply(results)
+
+def test_experience_years_bounds():
+    """경력 연차 min/max는 양 끝을 포함하고 값이 없으면 0년으로 판정"""
+    results = [
+        make_result("a", years_experience=2),
+        make_result("b", years_experience=5),
+        make_result("c", years_experience=9),
+        make_result("d"),
+    ]
+    assert ids(strict({"experience_years": {"min": 5}}, results)) == ["b", "c"]
+    assert ids(strict({"experience_years": {"max": 5}}, results)) == ["a", "b", "d"]
+    assert ids(strict({"experience_years": {"min": 3, "max": 9}}, results)) == ["b", "c"]
+
+def test_salary_overlap_and_missing_range_passes():
+    """희망 연봉 범위가 조건과 겹치면 통과하고 연봉 정보가 없으면 통과"""
+    results = [
+        make_result("low", salary_range="3000-4000"),
+        make_result("mid", salary_range="5000-7000"),
+        make_result("high", salary_range="9000-12000"),
+        make_result("none", seniority="senior"),
+    ]
+    assert ids(strict({"salary": {"min": 6000}}, results)) == ["mid", "high", "none"]
+    assert ids(strict({"salary": {"max": 5000}}, results)) == ["low", "mid", "none"]
+    assert ids(strict({"salary": {"min": 4500, "max": 8000}}, results)) == ["mid", "none"]
+
+def test_companies_flag_and_legacy_partial_match():
+    """회사 필터는 플래그로 판정하고, 필드가 없는 이전 데이터는 경력/메타데이터 부분 일치로 판정"""
+    results = [
+        make_result("flag_hit", experience=["네이버 클라우드"]),
+        make_result("flag_miss", experience=["쿠팡"]),
+        {"developer_id": "legacy_list", "total_score": 0.8, "metadata": {},
+         "experience": [{"company": "Naver Webtoon"}, {"company": "네이버"}]},
+        {"developer_id": "legacy_str", "total_score": 0.8, "metadata": {}, "experience": "카카오에서 3년"},
+        make_result("legacy_meta_hit", company="네이버랩스"),
+        make_result("legacy_meta_miss", company="토스"),
+        make_result("legacy_unknown"),
+    ]
+    assert ids(strict({"companies": "네이버"}, results)) == [
+        "flag_hit", "legacy_list", "legacy_meta_hit", "legacy_unknown",
+    ]
+
+def test_skills_role_keywords_flags_and_legacy_roles():
+    """역할 키워드는 primary_role, 그 외 기술은 보유 기술 플래그 (이전 데이터는 역할로 근사)"""
+    results = [
+        make_result("fe", skills=["React"], primary_role="frontend"),
+        make_result("be", skills=["Python"], primary_role="Backend"),
+        make_result("fs", skills=["Go"], primary_role="fullstack"),
+        make_result("legacy_fe", primary_role="frontend"),
+        make_result("legacy_fs", primary_role="fullstack"),
+    ]
+    assert ids(strict({"skills": "프론트엔드"}, results)) == ["fe", "fs", "legacy_fe", "legacy_fs"]
+    assert ids(strict({"skills": "backend"}, results)) == ["be", "fs", "legacy_fs"]
+    # 플래그가 있으면 역할과 무관하게 보유 기술로 판정
+    assert ids(strict({"skills": "python"}, results)) == ["be", "legacy_fs"]
+    assert ids(strict({"skills": "react"}, results)) == ["fe", "legacy_fe", "legacy_fs"]
+    assert ids(strict({"skills": "Rust"}, results)) == ["legacy_fs"]
+
+def test_basic_fields_pass_when_missing():
+    """seniority/availability/location은 값이 같거나 메타데이터에 없으면 통과"""
+    results = [
+        make_result("match", location="서울"),
+        make_result("other", location="부산"),
+        make_result("missing"),
+    ]
+    assert ids(strict({"location": "서울"}, results)) == ["match", "missing"]
+
+def test_default_mode_keeps_mismatches_with_penalty():
+    """기본 모드는 불일치 행을 남기고 불일치 비율만큼 점수 차감 (최대 50%, 최저 0.1)"""
+    results = [
+        make_result("both", score=1.4, location="서울", seniority="senior"),
+        make_result("one", score=0.8, location="부산", seniority="senior"),
+        make_result("none", score=0.8, location="부산", seniority="junior"),
+        make_result("floor", score=0.15, location="부산", seniority="junior"),
+    ]
+    ranked = DynamicFilterEngine("default").apply_filters(results, {"location": "서울", "seniority": "senior"})
+    scores = {r["developer_id"]: r["total_score"] for r in ranked}
+
+    assert ids(ranked) == ["both", "one", "none", "floor"]
+    assert scores["both"] == 1.0
+    assert abs(scores["one"] - 0.8 * 0.75) < 1e-9
+    assert abs(scores["none"] - 0.4) < 1e-9
+    assert scores["floor"] == 0.1
+    # 입력 결과는 변경하지 않음
+    assert results[0]["total_score"] == 1.4
+
+def test_strict_mode_drops_mismatches():
+    """엄격 모드는 하나라도 불일치하면 제외"""
+    results = [
+        make_result("both", location="서울", seniority="senior"),
+        make_result("one", location="부산", seniority="senior"),
+    ]
+    ranked = DynamicFilterEngine("strict").apply_filters(results, {"location": "서울", "seniority": "senior"})
+    assert ids(ranked) == ["both"]
+
+def test_priority_ordering_and_limit():
+    """일치한 필터의 우선순위 합 내림차순, 동점은 입력 순서 유지"""
+    results = [
+        make_result("skill_only", skills=["Python"], location="부산"),
+        make_result("location_only", location="서울"),
+        make_result("both", skills=["Python"], location="서울"),
+        make_result("skill_only_2", skills=["Python"], location="부산"),
+    ]
+    filters = {"location": "서울", "skills": "python"}
+    engine = DynamicFilterEngine("default")
+
+    assert ids(engine.apply_filters(results, filters)) == ["both", "location_only", "skill_only", "skill_only_2"]
+    assert ids(engine.apply_filters(results, filters, limit=2)) == ["both", "location_only"]
+
+def test_priority_counts_only_matching_companies():
+    """회사 필터는 일치한 경우에만 우선순위 점수에 포함 (이전 구현은 항상 일치로 계산)"""
+    results = [
+        make_result("other_company", experience=["쿠팡"], seniority="senior"),
+        make_result("company_only", experience=["카카오"], seniority="junior"),
+    ]
+    ranked = DynamicFilterEngine("default").apply_filters(results, {"companies": "카카오", "seniority": "senior"})
+    # seniority(3) > companies(2)
+    assert ids(ranked) == ["other_company", "company_only"]
+
+    ranked = DynamicFilterEngine("default").apply_filters(results, {"companies": "카카오", "skills": "rust"})
+    # 이전 구현에서는 두 행 모두 회사 필터 점수를 받아 입력 순서가 유지됨
+    assert ids(ranked) == ["company_only", "other_company"]
+
+def test_compile_filters_reuses_compiled_set():
+    """같은 필터 집합은 컴파일 결과를 재사용"""
+    engine = DynamicFilterEngine("default")
+    first = engine.compile_filters({"location": "서울", "skills": "python"})
+    assert engine.compile_filters({"skills": "python", "location": "서울"}) is first
+    assert engine.compile_filters({"location": "부산"}) is not first
@@ -0,0 +1,99 @@
+"""
+선택도 기반 쿼리 플래너 테스트
+"""
+
+from src.core.planner import (
+    FILTER_FIRST_OVERFLOW_FACTOR, PLAN_FILTER_FIRST, PLAN_VECTOR_FIRST, FieldHistograms, QueryPlanner
+)
+from src.core.profile_fields import company_flag
+
+def build_histograms(count=1000):
+    """서울 90%, 네이버 경력 1%, 시니어 50%인 합성 프로필 히스토그램"""
+    metadatas = []
+    for i in range(count):
+        metadata = {
+            "developer_id": f"dev_{i}",
+            "location": "서울" if i % 10 else "부산",
+            "seniority": "senior" if i % 2 else "junior",
+            "primary_role": "backend",
+            "years_experience": i % 15,
+        }
+        if i % 100 == 0:
+            metadata[company_flag("네이버")] = True
+        metadatas.append(metadata)
+    histograms = FieldHistograms()
+    histograms.build(metadatas)
+    return histograms
+
+def test_estimate_uses_independent_selectivity():
+    estimated, fractions = build_histograms().estimate({"location": "서울", "seniority": "senior"})
+    assert fractions == {"location": 0.9, "seniority": 0.5}
+    assert abs(estimated - 450) < 1e-9
+
+def test_selective_filter_plans_filter_first():
+    """예상 일치 수가 filter_first_max 이하이면 where 절로 필터 우선 실행"""
+    planner = QueryPlanner(build_histograms(), filter_first_max=50)
+    plan = planner.plan({"companies": "네이버"}, "comprehensive", 10, strict_mode=False)
+
+    assert plan.strategy == PLAN_FILTER_FIRST
+    assert plan.where == {company_flag("네이버"): True}
+    assert plan.estimated_matches == 10
+    assert plan.fetch == 30
+    # 엄격 모드가 아니면 벡터 우선 결과로 부분 일치 후보 보충
+    assert plan.fill
+    assert not planner.plan({"companies": "네이버"}, "comprehensive", 10, strict_mode=True).fill
+
+def test_broad_filter_plans_vector_first_with_capped_fetch():
+    """넓은 필터는 벡터 우선, 조회 수는 선택도로 늘리되 max_fetch로 제한"""
+    planner = QueryPlanner(build_histograms(), filter_first_max=50, overfetch_margin=1.5, max_fetch=100)
+
+    plan = planner.plan({"location": "서울"}, "profile_only", 10, strict_mode=False)
+    assert plan.strategy == PLAN_VECTOR_FIRST
+    assert plan.where is None
+    assert plan.fetch == 17  # ceil(10 / 0.9 * 1.5)
+
+    plan = planner.plan({"location": "서울", "seniority": "senior"}, "profile_only", 50, strict_mode=False)
+    assert plan.strategy == PLAN_VECTOR_FIRST
+    assert plan.fetch == 100  # ceil(50 / 0.45 * 1.5) = 167 -> max_fetch
+
+def test_comprehensive_floor_exceeds_max_fetch():
+    """종합 검색은 max_fetch보다 limit * 3이 크면 병합 깊이를 유지"""
+    planner = QueryPlanner(build_histograms(), filter_first_max=50, max_fetch=20)
+    plan = planner.plan({"location": "서울"}, "comprehensive", 10, strict_mode=False)
+    assert plan.strategy == PLAN_VECTOR_FIRST
+    assert plan.fetch == 30
+
+def test_strict_broad_filter_stays_vector_first():
+    """엄격 모드에서 필요 조회 수가 max_fetch를 넘어도 예상 일치 수가 많으면 필터 우선으로 전환하지 않음"""
+    planner = QueryPlanner(build_histograms(), filter_first_max=50, max_fetch=100)
+    plan = planner.plan({"location": "서울", "seniority": "senior"}, "comprehensive", 100, strict_mode=True)
+    assert plan.estimated_matches > planner.filter_first_max
+    assert plan.strategy == PLAN_VECTOR_FIRST
+    assert plan.where is None
+    assert plan.fetch == 300
+
+def test_strict_profile_only_pushes_where_to_index():
+    planner = QueryPlanner(build_histograms(), filter_first_max=50)
+    plan = planner.plan({"location": "서울"}, "profile_only", 10, strict_mode=True)
+    assert plan.strategy == PLAN_VECTOR_FIRST
+    assert plan.where == {"location": "서울"}
+    assert plan.fetch == 10
+
+def test_no_filters_fetches_floor():
+    planner = QueryPlanner(build_histograms())
+    assert planner.plan({}, "comprehensive", 10, strict_mode=False).fetch == 30
+    assert planner.plan({}, "skills_only", 10, strict_mode=False).fetch == 10
+
+def test_filter_first_limit():
+    planner = QueryPlanner(FieldHistograms(), filter_first_max=120)
+    assert planner.filter_first_limit == 120 * FILTER_FIRST_OVERFLOW_FACTOR
+
+def test_histograms_track_writes():
+    """쓰기 리스너로 갱신/삭제된 개발자의 기여분만 바뀜"""
+    histograms = build_histograms(100)
+    assert histograms.estimate({"location": "부산"})[0] == 10
+
+    histograms.on_write({"dev_1": {"developer_id": "dev_1", "location": "부산", "years_experience": 1}}, ["dev_0"])
+    assert histograms.total == 99
+    assert histograms.estimate({"location": "부산"})[0] == 10
+    assert histograms.estimate({"companies": "네이버"})[0] == 0
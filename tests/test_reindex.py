@@ -0,0 +1,193 @@
+"""
+온라인 재색인 테스트 - 시작/양쪽 쓰기/복사/대조/교체/취소 순서
+"""
+
+import pytest
+
+import src.core.search_engine as search_engine_module
+from src.core.reindex import (
+    INDEX_STAMP_FIELD, REINDEX_COMPLETED, OnlineReindexer, index_versions, load_index_state
+)
+from src.core.search_engine import SearchEngine
+
+def make_developer(index, role="backend", company="네이버"):
+    return {
+        "developer_id": f"dev_{index:03d}",
+        "name": f"개발자{index}",
+        "location": "서울",
+        "seniority": "senior",
+        "primary_role": role,
+        "years_experience": 3 + index,
+        "availability": "available",
+        "salary_range": "5000-8000",
+        "skills": [{"name": "Python", "level": 4, "years": 3}, {"name": "Docker", "level": 3, "years": 2}],
+        "experience": [{"company": company, "position": f"{role} 개발자", "duration_months": 24, "industry": "IT/소프트웨어"}],
+        "education": {"degree": "학사", "major": "컴퓨터공학"},
+        "github_stars": 10 * index,
+        "stackoverflow_reputation": 100
+    }
+
+@pytest.fixture
+def make_engine(tmp_path, monkeypatch, encoder_class):
+    """같은 저장소를 쓰는 워커 엔진 생성"""
+    monkeypatch.setattr(search_engine_module, "SentenceTransformer", encoder_class)
+    # 백그라운드 상태 확인이 테스트 중 전환하지 않도록 주기를 늘림 (전환은 테스트에서 직접 호출)
+    monkeypatch.setattr(search_engine_module, "REINDEX_STATE_POLL_INTERVAL", 3600)
+    engines = []
+
+    def make():
+        engine = SearchEngine(db_path=str(tmp_path / "db"))
+        engines.append(engine)
+        return engine
+
+    yield make
+    for engine in engines:
+        engine.index_watcher.stop()
+        engine.stats_collector.stop()
+        engine.query_log.stop()
+        engine._index_executor.shutdown(wait=True)
+
+@pytest.fixture
+def engine(make_engine):
+    engine = make_engine()
+    engine.add_developers([make_developer(i) for i in range(5)])
+    return engine
+
+def profile_metadata(index_set, developer_id):
+    metadatas = index_set.collections['profiles'].get(ids=[f"profile_{developer_id}"], include=['metadatas'])['metadatas']
+    return metadatas[0] if metadatas else None
+
+def test_reindex_mirrors_writes_and_swaps(engine):
+    """재색인 중 쓰기는 양쪽 세트에 기록되고 교체 후 새 세트로 검색, 이전 세트는 삭제 전까지 유지"""
+    previous_active = engine.index_set
+    target = engine.begin_reindex("test-model-v2")
+
+    state = load_index_state(engine.client)
+    assert (state.active_version, state.target_version) == (0, target.version)
+    assert state.target_model_name == "test-model-v2"
+    assert engine.index_status()["reindexing"]["version"] == target.version
+
+    # 재색인 중 쓰기 - 새 세트에도 같은 기록 시각으로 기록
+    engine.add_developers([make_developer(10, role="frontend")])
+    engine.update_developer(make_developer(0, company="카카오"))
+    engine.delete_developers(["dev_004"])
+    mirrored = profile_metadata(target, "dev_010")
+    assert mirrored is not None
+    assert mirrored[INDEX_STAMP_FIELD] == profile_metadata(previous_active, "dev_010")[INDEX_STAMP_FIELD]
+    assert profile_metadata(target, "dev_004") is None
+
+    copied = engine.reindex_developers(engine.developer_ids())
+    assert copied == 5
+    assert engine.reconcile_index_sets() == 0
+
+    previous = engine.commit_reindex()
+    assert previous.version == 0
+    assert engine.index_set.version == target.version
+    assert engine.index_set.model_name == "test-model-v2"
+    state = load_index_state(engine.client)
+    assert (state.active_version, state.target_version) == (target.version, None)
+    # 새 세트의 데이터로 검색 (복사한 개발자의 기록 시각은 원본 유지)
+    assert sorted(engine.developer_ids()) == ["dev_000", "dev_001", "dev_002", "dev_003", "dev_010"]
+    assert "카카오" in profile_metadata(engine.index_set, "dev_000")["companies"]
+    assert engine.search_developers("frontend 개발자", limit=3)
+
+    # 이전 세트는 호출한 쪽에서 삭제할 때까지 남음
+    assert index_versions(engine.client) == [0, target.version]
+    with pytest.raises(ValueError):
+        engine.drop_index_set(engine.index_set)
+    engine.drop_index_set(previous)
+    assert index_versions(engine.client) == [target.version]
+
+def test_reconcile_recopies_writes_missing_from_target(engine):
+    """재색인 시작이 반영되기 전 다른 워커가 이전 세트에만 기록한 개발자는 교체 직전 대조에서 다시 복사"""
+    target = engine.begin_reindex("test-model-v2")
+    engine.reindex_developers(engine.developer_ids())
+
+    # 새 세트를 모르는 워커의 쓰기 (사용 중인 세트에만 기록)
+    active = engine.index_set
+    developer = make_developer(1, company="토스")
+    entries = engine._build_index_entries([developer])
+    embeddings = engine._encode_entries(entries, active.embedding_model)
+    engine._delete_entries(["dev_001"], active.collections)
+    engine._write_index_entries(entries, embeddings, active.collections)
+    assert "토스" not in profile_metadata(target, "dev_001")["companies"]
+
+    assert engine.reconcile_index_sets() == 1
+    assert "토스" in profile_metadata(target, "dev_001")["companies"]
+    assert engine.reconcile_index_sets() == 0
+
+def test_abort_clears_target_and_stops_mirroring(engine):
+    """취소하면 세트 상태의 재색인 세트를 지우고 이후 쓰기는 사용 중인 세트에만 기록"""
+    target = engine.begin_reindex("test-model-v2")
+    assert engine.abort_reindex() is target
+
+    state = load_index_state(engine.client)
+    assert (state.active_version, state.target_version, state.target_model_name) == (0, None, None)
+    assert engine.index_status()["reindexing"] is None
+    assert engine.abort_reindex() is None
+
+    engine.add_developers([make_developer(20)])
+    assert profile_metadata(target, "dev_020") is None
+    engine.drop_index_set(target)
+    assert index_versions(engine.client) == [0]
+
+    # 취소 후 다시 시작 가능
+    assert engine.begin_reindex("test-model-v2").version == target.version
+    with pytest.raises(RuntimeError):
+        engine.begin_reindex("test-model-v2")
+
+def test_online_reindexer_completes(engine):
+    """백그라운드 재색인 작업이 복사/대조/교체/이전 세트 삭제까지 완료"""
+    reindexer = OnlineReindexer(engine, "test-model-v2", batch_size=2, pause=0, gc_delay=0, poll=0.01, worker_wait=5)
+    reindexer.start()
+    reindexer.join(30)
+
+    stats = reindexer.stats()
+    assert reindexer.state == REINDEX_COMPLETED, stats
+    assert engine.index_set.version == 1
+    assert index_versions(engine.client) == [1]
+    assert sorted(engine.developer_ids()) == [f"dev_{i:03d}" for i in range(5)]
+    # 교체한 워커도 보조 인덱스는 상태 확인 스레드에서 다시 생성
+    assert engine._auxiliary_version == 0
+    assert engine.refresh_index_state() is False
+    assert engine._auxiliary_version == 1
+    assert engine.find_similar_developers("dev_000", limit=2)
+
+def test_writes_use_last_loaded_state(engine, monkeypatch):
+    """쓰기는 저장소의 세트 상태를 다시 읽지 않고 상태 확인 스레드가 마지막으로 반영한 세트에 기록"""
+    loads = []
+    load = search_engine_module.load_index_state
+    monkeypatch.setattr(search_engine_module, "load_index_state", lambda client: loads.append(1) or load(client))
+
+    engine.add_developers([make_developer(30)])
+    engine.update_developer(make_developer(0, company="카카오"))
+    engine.delete_developers(["dev_001"])
+    assert loads == []
+
+def test_swap_by_other_worker_rebuilds_on_state_refresh(engine, make_engine, monkeypatch):
+    """다른 워커의 교체는 상태 확인에서 반영하고, 보조 인덱스 재생성은 쓰기가 아닌 상태 확인 호출에서 실행"""
+    other = make_engine()
+    engine.refresh_index_state()
+    target = other.begin_reindex("test-model-v2")
+    assert engine.refresh_index_state()
+    assert engine.index_status()["reindexing"]["version"] == target.version
+    other.reindex_developers(other.developer_ids())
+    other.commit_reindex()
+
+    rebuilds = []
+    rebuild = engine._on_index_swapped
+    monkeypatch.setattr(engine, "_on_index_swapped", lambda: rebuilds.append(1) or rebuild())
+
+    # 교체를 반영하기 전의 쓰기는 양쪽 세트에 기록되고 재생성을 일으키지 않음
+    engine.update_developer(make_developer(2, company="토스"))
+    assert rebuilds == []
+    assert engine.index_set.version == 0
+    assert "토스" in profile_metadata(target, "dev_002")["companies"]
+
+    assert engine.refresh_index_state()
+    assert rebuilds == [1]
+    assert engine.index_set.version == target.version
+    assert engine.index_set.model_name == "test-model-v2"
+    assert engine.index_status()["reindexing"] is None
+    assert engine.refresh_index_state() is False
+    assert rebuilds == [1]
@@ -0,0 +1,90 @@
+"""
+단계별 검색 스트림 API 테스트 - 중단된 스트림도 실행 슬롯을 반환하는지 확인
+"""
+
+import asyncio
+import importlib
+import json
+import os
+
+import pytest
+from starlette.requests import ClientDisconnect, Request
+
+import src.core.search_engine as search_engine_module
+from src.web.admission import AdmissionController
+
+@pytest.fixture(scope="module")
+def web(tmp_path_factory, encoder_class):
+    """임시 저장소와 결정적 임베딩 모델로 웹 앱 모듈 로드"""
+    workdir = tmp_path_factory.mktemp("web")
+    os.makedirs(workdir / "static")
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(search_engine_module, "SentenceTransformer", encoder_class)
+        patch.setattr(search_engine_module, "DB_PATH", str(workdir / "db"))
+        patch.chdir(workdir)
+        run_web = importlib.import_module("run_web")
+    yield run_web
+    asyncio.run(run_web.stop_background_tasks())
+    run_web.ingest_jobs.shutdown()
+
+@pytest.fixture
+def admission(web, monkeypatch):
+    """요청마다 새 수락 제어 (동시 실행 1, 대기열 없음)"""
+    controller = AdmissionController(1, 0, 0.1)
+    monkeypatch.setattr(web, "search_admission", controller)
+    return controller
+
+def stream_request(web, query="python 백엔드"):
+    request = Request({"type": "http", "method": "POST", "path": "/api/search/stream", "headers": []})
+    return web.api_search_stream(request, query=query, search_type="comprehensive",
+                                 filter_mode="default", limit=5, fields=None)
+
+def test_stream_not_started_does_not_hold_slot(web, admission):
+    """응답 시작 전에 클라이언트가 끊겨 스트림이 시작되지 않아도 슬롯이 남지 않음"""
+    async def scenario():
+        response = await stream_request(web)
+        assert admission.stats()["active"] == 0
+
+        async def send(message):
+            raise OSError("connection reset")
+
+        async def receive():
+            return {"type": "http.disconnect"}
+
+        scope = {"type": "http", "asgi": {"spec_version": "2.4"}}
+        with pytest.raises(ClientDisconnect):
+            await response(scope, receive, send)
+        await response.body_iterator.aclose()
+
+    asyncio.run(scenario())
+    assert admission.stats()["active"] == 0
+
+def test_stream_aborted_midway_releases_slot(web, admission):
+    """첫 이벤트를 받은 뒤 중단된 스트림은 슬롯 반환"""
+    async def scenario():
+        response = await stream_request(web)
+        first = json.loads(await response.body_iterator.__anext__())
+        assert first["query"] == "python 백엔드"
+        assert admission.stats()["active"] == 1
+        await response.body_iterator.aclose()
+
+    asyncio.run(scenario())
+    assert admission.stats()["active"] == 0
+    assert admission.stats()["admitted"] == 1
+
+def test_stream_rejected_sends_error_event(web, admission):
+    """슬롯을 얻지 못하면 error 이벤트로 거절을 알림"""
+    async def scenario():
+        await admission.acquire()
+        try:
+            response = await stream_request(web)
+            events = [json.loads(chunk) async for chunk in response.body_iterator]
+        finally:
+            admission.release()
+        return events
+
+    events = asyncio.run(scenario())
+    assert [event["event"] for event in events] == ["error"]
+    assert events[0]["status"] == 429
+    assert admission.stats()["active"] == 0
+    assert admission.stats()["rejected_queue_full"] == 1